@@ -0,0 +1,286 @@
+"""
+Rolling analytics for the dashboard.
+
+Everything here is updated in O(1) per event and holds a fixed amount of
+state. Event counts live in a ring of one-second buckets; latencies and
+frame rates go into log-spaced histogram bins (HDR-style, a few percent
+relative error) kept per ten-second slice, with a running aggregate from
+which expiring slices are subtracted. Reading a rate or a percentile walks
+those fixed buckets, never the event history. Kept free of Tk: Sparkline
+only needs a canvas-like object.
+"""
+
+import math
+import threading
+import time
+
+WINDOW = 60  # seconds covered by the rolling views
+SLICE_SECONDS = 10
+CLICK_STATS = ('click_count', 'right_click_count', 'double_click_count')
+
+
+class RollingCounter:
+    """Events per second over the last `slots` seconds"""
+
+    def __init__(self, slots=WINDOW):
+        """Initialize with empty buckets"""
+        self.counts = [0] * slots
+        self.total = 0
+        self.second = None
+
+    def advance(self, now):
+        """Expire the buckets that fell out of the window by now"""
+        second = int(now)
+        if self.second is None:
+            self.second = second
+            return
+        steps = second - self.second
+        if steps <= 0:
+            return
+        slots = len(self.counts)
+        for step in range(1, min(steps, slots) + 1):
+            index = (self.second + step) % slots
+            self.total -= self.counts[index]
+            self.counts[index] = 0
+        self.second = second
+
+    def add(self, now, count=1):
+        """Count events at time now"""
+        self.advance(now)
+        self.counts[self.second % len(self.counts)] += count
+        self.total += count
+
+    def series(self, now):
+        """Return the per-second counts, oldest first"""
+        self.advance(now)
+        start = (self.second + 1) % len(self.counts)
+        return self.counts[start:] + self.counts[:start]
+
+    def per_minute(self, now):
+        """Return the event rate per minute over the window"""
+        self.advance(now)
+        return self.total * 60.0 / len(self.counts)
+
+
+class LogHistogram:
+    """Histogram with log-spaced bins between lowest and highest"""
+
+    def __init__(self, lowest=0.01, highest=10000.0, precision=0.03):
+        """Values are binned to within precision of their true value"""
+        self.lowest = lowest
+        self.log_step = math.log1p(precision)
+        self.counts = [0] * (int(math.log(highest / lowest) / self.log_step) + 2)
+        self.total = 0
+
+    def index(self, value):
+        """Return the bin holding value"""
+        if value <= self.lowest:
+            return 0
+        return min(int(math.log(value / self.lowest) / self.log_step) + 1, len(self.counts) - 1)
+
+    def value(self, index):
+        """Return the value a bin stands for"""
+        if index == 0:
+            return self.lowest
+        return self.lowest * math.exp(self.log_step * (index - 0.5))
+
+    def record(self, value):
+        """Count one value"""
+        self.counts[self.index(value)] += 1
+        self.total += 1
+
+    def subtract(self, other):
+        """Remove the counts of a histogram with the same bins"""
+        counts = self.counts
+        for index, count in enumerate(other.counts):
+            if count:
+                counts[index] -= count
+        self.total -= other.total
+
+    def clear(self):
+        """Drop all counts"""
+        self.counts = [0] * len(self.counts)
+        self.total = 0
+
+    def percentile(self, pct):
+        """Return the pct-th percentile, or None when empty"""
+        if not self.total:
+            return None
+        rank = max(1, math.ceil(pct / 100.0 * self.total))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.value(index)
+        return self.value(len(self.counts) - 1)
+
+
+class RollingHistogram:
+    """LogHistogram over the last `slices` x `slice_seconds` seconds"""
+
+    def __init__(self, slices=WINDOW // SLICE_SECONDS, slice_seconds=SLICE_SECONDS, **bins):
+        """Initialize with empty slices"""
+        self.slice_seconds = slice_seconds
+        self.slices = [LogHistogram(**bins) for _ in range(slices)]
+        self.window = LogHistogram(**bins)
+        self.slot = None
+
+    def advance(self, now):
+        """Subtract the slices that fell out of the window by now"""
+        slot = int(now // self.slice_seconds)
+        if self.slot is None:
+            self.slot = slot
+            return
+        steps = slot - self.slot
+        if steps <= 0:
+            return
+        if steps >= len(self.slices):
+            for expired in self.slices:
+                expired.clear()
+            self.window.clear()
+        else:
+            for step in range(1, steps + 1):
+                expired = self.slices[(self.slot + step) % len(self.slices)]
+                if expired.total:
+                    self.window.subtract(expired)
+                    expired.clear()
+        self.slot = slot
+
+    def record(self, value, now):
+        """Count a value observed at time now"""
+        self.advance(now)
+        self.slices[self.slot % len(self.slices)].record(value)
+        self.window.record(value)
+
+    def percentile(self, pct, now):
+        """Return the pct-th percentile over the window, or None when empty"""
+        self.advance(now)
+        return self.window.percentile(pct)
+
+
+class GestureTimer:
+    """Time spent in each gesture this session"""
+
+    def __init__(self):
+        """Initialize with no gesture"""
+        self.totals = {}
+        self.gesture = None
+        self.since = None
+
+    def change(self, gesture, now):
+        """Switch to gesture (None for no hand) at time now"""
+        if gesture == self.gesture:
+            return
+        if self.gesture is not None:
+            self.totals[self.gesture] = self.totals.get(self.gesture, 0.0) + now - self.since
+        self.gesture, self.since = gesture, now
+
+    def snapshot(self, now):
+        """Return {gesture: seconds}, including the gesture in progress"""
+        totals = dict(self.totals)
+        if self.gesture is not None:
+            totals[self.gesture] = totals.get(self.gesture, 0.0) + now - self.since
+        return totals
+
+
+class DashboardAnalytics:
+    """Rolling gesture, click-latency, fps and frame-latency analytics.
+
+    The controller thread reports frames, gesture changes and actions; the
+    Tk thread reads summary() once a second.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        """Initialize empty analytics"""
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget everything recorded so far"""
+        with self.lock:
+            self.gestures = RollingCounter()
+            self.frames = RollingCounter()
+            self.fps = RollingHistogram()
+            self.frame_latency = RollingHistogram()
+            self.click_latency = RollingHistogram()
+            self.gesture_time = GestureTimer()
+            self.last_frame = None
+
+    def frame(self, latency):
+        """Record a processed frame and its latency in seconds"""
+        now = self.clock()
+        with self.lock:
+            self.frames.add(now)
+            self.frame_latency.record(latency * 1000.0, now)
+            if self.last_frame is not None and now > self.last_frame:
+                self.fps.record(1.0 / (now - self.last_frame), now)
+            self.last_frame = now
+
+    def gesture(self, gesture):
+        """Record the main hand's gesture changing; None when no hand is visible"""
+        now = self.clock()
+        with self.lock:
+            self.gesture_time.change(gesture, now)
+
+    def action(self, stat, latency):
+        """Record a gesture action and the seconds since its frame arrived"""
+        now = self.clock()
+        with self.lock:
+            self.gestures.add(now)
+            if stat in CLICK_STATS:
+                self.click_latency.record(latency * 1000.0, now)
+
+    def summary(self):
+        """Return the current rolling figures as a dict"""
+        now = self.clock()
+        with self.lock:
+            return {
+                'gestures_per_minute': self.gestures.per_minute(now),
+                'gesture_series': self.gestures.series(now),
+                'frame_series': self.frames.series(now),
+                'fps_p50': self.fps.percentile(50, now),
+                'fps_p5': self.fps.percentile(5, now),
+                'latency_p50_ms': self.frame_latency.percentile(50, now),
+                'latency_p95_ms': self.frame_latency.percentile(95, now),
+                'latency_p99_ms': self.frame_latency.percentile(99, now),
+                'click_p50_ms': self.click_latency.percentile(50, now),
+                'click_p95_ms': self.click_latency.percentile(95, now),
+                'gesture_seconds': self.gesture_time.snapshot(now),
+            }
+
+
+def format_ms(value):
+    """Render an optional millisecond value"""
+    return "-" if value is None else f"{value:.1f} ms"
+
+
+class Sparkline:
+    """A series drawn as one canvas line plus a caption, touched only when they change"""
+
+    def __init__(self, canvas, width, height, color="#5bc0be", text_color="#f5f0e1"):
+        """Create the line and caption items on canvas"""
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+        self.line = canvas.create_line(0, height - 1, width, height - 1, fill=color, width=2)
+        self.caption = canvas.create_text(4, 2, anchor="nw", fill=text_color, text="",
+                                          font=("Arial", 9, "bold"))
+        self.series = None
+        self.text = None
+
+    def update(self, series, text=None):
+        """Redraw the line and caption if they changed"""
+        if series != self.series and len(series) > 1:
+            self.series = list(series)
+            peak = max(series) or 1
+            step = self.width / (len(series) - 1)
+            usable = self.height - 14
+            coords = []
+            for index, value in enumerate(series):
+                coords.append(index * step)
+                coords.append(self.height - 1 - usable * value / peak)
+            self.canvas.coords(self.line, *coords)
+        if text is not None and text != self.text:
+            self.text = text
+            self.canvas.itemconfigure(self.caption, text=text)
@@ -1,96 +1,12 @@
-import json
 import os
-import hashlib
 import cv2
 import tkinter as tk
 from tkinter import ttk, messagebox, Toplevel
 import numpy as np
 from PIL import Image, ImageTk
-
-USERS_DIR = "users"
-USER_IMAGES_DIR = os.path.join(USERS_DIR, "images")
-USER_DATA_FILE = os.path.join(USERS_DIR, "users.json")
-
-os.makedirs(USERS_DIR, exist_ok=True)
-os.makedirs(USER_IMAGES_DIR, exist_ok=True)
-
-class AuthenticationManager:
-    def __init__(self):
-        """Initialize the authentication manager"""
-        self.current_user = None
-        self.load_users()
-    
-    def load_users(self):
-        """Load users from JSON file"""
-        if os.path.exists(USER_DATA_FILE):
-            try:
-                with open(USER_DATA_FILE, 'r') as f:
-                    self.users = json.load(f)
-            except:
-                self.users = {}
-        else:
-            self.users = {}
-    
-    def save_users(self):
-        """Save users to JSON file"""
-        with open(USER_DATA_FILE, 'w') as f:
-            json.dump(self.users, f, indent=2)
-    
-    def hash_password(self, password):
-        """Hash password using SHA-256"""
-        return hashlib.sha256(password.encode()).hexdigest()
-    
-    def user_exists(self, username):
-        """Check if user exists"""
-        return username in self.users
-    
-    def add_user(self, username, password):
-        """Add a new user"""
-        if self.user_exists(username):
-            return False, "User already exists"
-        
-        hashed_password = self.hash_password(password)
-        self.users[username] = {
-            'password': hashed_password,
-            'image_path': None
-        }
-        self.save_users()
-        return True, "User registered successfully"
-    
-    def authenticate_user(self, username, password):
-        """Authenticate user with username and password"""
-        if not self.user_exists(username):
-            return False, "User not found"
-        
-        hashed_password = self.hash_password(password)
-        
-        if self.users[username]['password'] == hashed_password:
-            self.current_user = username
-            return True, "Login successful"
-        else:
-            return False, "Incorrect password"
-    
-    def logout_user(self):
-        """Logout current user"""
-        self.current_user = None
-    
-    def get_current_user(self):
-        """Get current logged in user"""
-        return self.current_user
-    
-    def get_user_image_path(self, username):
-        """Get user's image path"""
-        if self.user_exists(username):
-            return self.users[username].get('image_path')
-        return None
-    
-    def set_user_image(self, username, image_path):
-        """Set user's image path"""
-        if self.user_exists(username):
-            self.users[username]['image_path'] = image_path
-            self.save_users()
-            return True
-        return False
+from image_cache import save_user_image
+from user_store import (AuthenticationManager, DEFAULT_HASH_ITERATIONS, HASH_SCHEME, USERS_DIR,
+                        USER_DATA_FILE, USER_IMAGES_DIR)
 
 def show_auth_window(auth_manager, on_success):
     """Show authentication window"""
@@ -336,7 +252,7 @@ def show_image_capture_window(auth_manager, username, on_success, parent_window)
             image_filename = f"{username}.jpg"
             image_path = os.path.join(USER_IMAGES_DIR, image_filename)
 
-            cv2.imwrite(image_path, frame)
+            save_user_image(frame, image_path)
 
             auth_manager.set_user_image(username, image_path)
             
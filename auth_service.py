@@ -0,0 +1,101 @@
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+from auth import AuthenticationManager
+
+
+class AsyncAuthService:
+    """Run password hashing and user store I/O on a worker pool.
+
+    Tk is not thread-safe, so workers never touch widgets. Finished results
+    are queued and delivered to their callbacks on the Tk main thread by a
+    short ``after()`` poll that only runs while requests are pending.
+    """
+
+    def __init__(self, root, auth_manager=None, max_workers=2, poll_interval=15):
+        """Initialize the service for the given Tk root"""
+        self.root = root
+        self.auth_manager = auth_manager or AuthenticationManager()
+        self.poll_interval = poll_interval
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix="auth-worker")
+        self.results = queue.Queue()
+        self.pending = 0
+        self.poll_id = None
+
+    def authenticate(self, username, password, callback):
+        """Authenticate in the background; callback(success, message) runs on Tk"""
+        self.submit(self.auth_manager.authenticate_user, (username, password), callback,
+                    "Authentication error")
+
+    def register(self, username, password, callback):
+        """Register in the background; callback(success, message) runs on Tk"""
+        self.submit(self.auth_manager.add_user, (username, password), callback, "Registration error")
+
+    def save_settings(self, username, settings, callback, base=None):
+        """Persist user settings in the background; callback(success, message) runs on Tk"""
+        def save():
+            if self.auth_manager.set_user_settings(username, settings, base):
+                return True, "Settings saved successfully!"
+            return False, "No user is logged in"
+        self.submit(save, (), callback, "Cannot save settings")
+
+    def save_gesture_templates(self, username, templates, callback):
+        """Persist custom gesture templates in the background; callback(success, message) runs on Tk"""
+        def save():
+            if self.auth_manager.set_gesture_templates(username, templates):
+                return True, "Custom gestures saved"
+            return False, "No user is logged in"
+        self.submit(save, (), callback, "Cannot save custom gestures")
+
+    def load_user_image(self, username, image_cache, size, callback):
+        """Decode a user's profile image in the background.
+
+        callback(success, result) runs on Tk with result the (key, image)
+        from image_cache.decode, or an error message.
+        """
+        def load():
+            image_path = self.auth_manager.get_user_image_path(username)
+            decoded = image_cache.decode(image_path, size) if image_path else None
+            if decoded is None:
+                return False, "No profile image"
+            return True, decoded
+        self.submit(load, (), callback, "Cannot load profile image")
+
+    def submit(self, func, args, callback, error="Request failed"):
+        """Queue func(*args) on the pool and schedule delivery of its result.
+
+        If func raises, callback gets False and "<error>: <exception>".
+        """
+        self.pending += 1
+        future = self.executor.submit(func, *args)
+        future.add_done_callback(lambda f: self.results.put((callback, error, f)))
+        if self.poll_id is None:
+            self.poll_id = self.root.after(self.poll_interval, self.deliver_results)
+
+    def deliver_results(self):
+        """Drain finished requests and invoke their callbacks on the Tk thread"""
+        self.poll_id = None
+        while True:
+            try:
+                callback, error, future = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.pending -= 1
+            try:
+                success, message = future.result()
+            except Exception as e:
+                success, message = False, f"{error}: {e}"
+            callback(success, message)
+        if self.pending > 0:
+            self.poll_id = self.root.after(self.poll_interval, self.deliver_results)
+
+    def shutdown(self):
+        """Stop polling and release the worker pool"""
+        if self.poll_id is not None:
+            try:
+                self.root.after_cancel(self.poll_id)
+            except Exception:
+                pass
+            self.poll_id = None
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Hardware auto-tuning for the controller pipeline.
+
+Calibration walks a ladder of pipeline configurations from best quality to
+cheapest, runs each briefly on the real camera with the real Hands graph
+(without moving the cursor) and keeps the first one that meets the target
+frame rate and latency. The choice is stored as this machine's profile and
+used as the base for every user's performance settings.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from user_store import USERS_DIR
+from settings_profile import PERFORMANCE_KEYS, default_settings
+
+MACHINE_PROFILE_FILE = os.path.join(USERS_DIR, "machine_profile.json")
+MACHINE_PROFILE_VERSION = 1
+
+DEFAULT_TARGET_FPS = 25.0
+DEFAULT_MAX_LATENCY_MS = 40.0
+
+# Candidate configurations, most expensive first
+TUNING_LADDER = [
+    {'camera_mode': "1280x720@30", 'inference_width': 640, 'model_complexity': 1, 'multi_hand_mode': True, 'inference_stride': 1},
+    {'camera_mode': "640x480@30", 'inference_width': 0, 'model_complexity': 1, 'multi_hand_mode': True, 'inference_stride': 1},
+    {'camera_mode': "640x480@30", 'inference_width': 480, 'model_complexity': 1, 'multi_hand_mode': True, 'inference_stride': 1},
+    {'camera_mode': "640x480@30", 'inference_width': 480, 'model_complexity': 0, 'multi_hand_mode': True, 'inference_stride': 1},
+    {'camera_mode': "640x480@30", 'inference_width': 320, 'model_complexity': 0, 'multi_hand_mode': True, 'inference_stride': 1},
+    {'camera_mode': "640x480@30", 'inference_width': 320, 'model_complexity': 0, 'multi_hand_mode': False, 'inference_stride': 1},
+    {'camera_mode': "320x240@30", 'inference_width': 0, 'model_complexity': 0, 'multi_hand_mode': False, 'inference_stride': 1},
+    {'camera_mode': "320x240@30", 'inference_width': 0, 'model_complexity': 0, 'multi_hand_mode': False, 'inference_stride': 2},
+    {'camera_mode': "320x240@30", 'inference_width': 0, 'model_complexity': 0, 'multi_hand_mode': False, 'inference_stride': 3},
+]
+
+
+def percentile(values, pct):
+    """Return the pct-th percentile of values"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure_candidate(cap, candidate, frames=60, warmup=15, clock=time.perf_counter):
+    """Run the pipeline on cap with candidate settings and return its timings"""
+    from controller_pipeline import ControllerConfig, ControllerPipeline
+
+    settings = default_settings()
+    settings.update(candidate)
+    settings['preview_rate'] = 0
+    # Measure the cost of inferring every frame, not of a still scene
+    settings['presence_gate'] = False
+    settings['idle_timeout'] = 0
+    pipeline = ControllerPipeline(ControllerConfig(settings))
+    pipeline.drive_controls = False
+    pipeline.apply_camera_mode(cap, settings['camera_mode'])
+    pipeline.poll_config(cap)
+
+    latencies = []
+    try:
+        start = None
+        for index in range(warmup + frames):
+            if index == warmup:
+                start = clock()
+            success, image = cap.read()
+            if not success:
+                continue
+            frame_start = clock()
+            pipeline.process_frame(image)
+            if index >= warmup:
+                latencies.append((clock() - frame_start) * 1000)
+        elapsed = clock() - start
+    finally:
+        pipeline.model.close()
+
+    if not latencies:
+        raise RuntimeError("Camera returned no frames during calibration")
+    return {
+        'fps': len(latencies) / elapsed if elapsed > 0 else 0.0,
+        'latency_p50_ms': percentile(latencies, 50),
+        'latency_p95_ms': percentile(latencies, 95),
+    }
+
+
+def calibrate(cap, target_fps=DEFAULT_TARGET_FPS, max_latency_ms=DEFAULT_MAX_LATENCY_MS,
+              ladder=TUNING_LADDER, measure=measure_candidate, log=print, should_run=None):
+    """Pick the best ladder entry meeting the targets and return a machine profile.
+
+    should_run() is checked before each rung; if it turns false, calibration
+    stops and returns None.
+    """
+    chosen = None
+    for candidate in ladder:
+        if should_run is not None and not should_run():
+            return None
+        result = measure(cap, candidate)
+        log(f"  {candidate}: {result['fps']:.1f} fps, p95 latency {result['latency_p95_ms']:.1f} ms")
+        chosen = candidate, result
+        if result['fps'] >= target_fps and result['latency_p95_ms'] <= max_latency_ms:
+            break
+    settings, measured = chosen
+    return {
+        'version': MACHINE_PROFILE_VERSION,
+        'hostname': platform.node(),
+        'cpu_count': os.cpu_count(),
+        'target_fps': target_fps,
+        'max_latency_ms': max_latency_ms,
+        'tuned_at': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'settings': dict(settings),
+        'measured': measured,
+    }
+
+
+def load_machine_profile(path=MACHINE_PROFILE_FILE):
+    """Return the stored machine profile, or None if the machine is untuned"""
+    try:
+        with open(path, 'r') as f:
+            profile = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if profile.get('version') != MACHINE_PROFILE_VERSION:
+        return None
+    return profile
+
+
+def save_machine_profile(profile, path=MACHINE_PROFILE_FILE):
+    """Store the machine profile"""
+    tmp_file = path + ".tmp"
+    with open(tmp_file, 'w') as f:
+        json.dump(profile, f, indent=2)
+    os.replace(tmp_file, path)
+
+
+def machine_settings(profile=None):
+    """Return the tuned performance settings of a profile, or {} if untuned"""
+    if profile is None:
+        profile = load_machine_profile()
+    if not profile:
+        return {}
+    return {k: v for k, v in profile['settings'].items() if k in PERFORMANCE_KEYS}
+
+
+def main(argv=None):
+    """Calibrate this machine from the command line"""
+    parser = argparse.ArgumentParser(description="Tune the controller pipeline for this machine")
+    parser.add_argument("--target-fps", type=float, default=DEFAULT_TARGET_FPS)
+    parser.add_argument("--max-latency-ms", type=float, default=DEFAULT_MAX_LATENCY_MS)
+    parser.add_argument("--camera", type=int, default=0, help="camera index")
+    args = parser.parse_args(argv)
+
+    import cv2
+    cap = cv2.VideoCapture(args.camera)
+    if not cap.isOpened():
+        print("Cannot open camera")
+        return 1
+    try:
+        print(f"Calibrating for {args.target_fps:g} fps, {args.max_latency_ms:g} ms p95 latency...")
+        profile = calibrate(cap, args.target_fps, args.max_latency_ms)
+    finally:
+        cap.release()
+    save_machine_profile(profile)
+    print(f"Selected {profile['settings']}, saved to {MACHINE_PROFILE_FILE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
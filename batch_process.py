@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Offline batch processing of recorded videos into gesture timelines.
+
+Every video under the input directory is decoded in a worker process, run
+through MediaPipe Hands and HandRecog classification exactly as the live
+controller would, and written as a compressed columnar ``.npz`` timeline:
+one array per column (timestamps, hand presence, gestures, landmarks) with
+a row per frame. Timelines are written atomically and record the source
+file's size and modification time, so an interrupted batch resumes by
+skipping videos whose timeline is already complete.
+
+    python batch_process.py recordings/ --output timelines/ --jobs 4
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from settings_profile import default_settings
+from trackers import BUILDERS
+
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.webm')
+TIMELINE_SUFFIX = ".gestures.npz"
+NO_GESTURE = -1
+# Hand slots in the gesture/landmark columns
+HAND_SLOTS = ('major', 'minor')
+PROGRESS_EVERY = 3000
+
+
+def find_videos(directory, extensions=VIDEO_EXTENSIONS):
+    """Return the video files under directory, sorted"""
+    videos = []
+    for root, _, files in os.walk(directory):
+        videos.extend(os.path.join(root, name) for name in files
+                      if name.lower().endswith(extensions))
+    return sorted(videos)
+
+
+def timeline_path(video, input_dir, output_dir):
+    """Return where the timeline for video is written"""
+    return os.path.join(output_dir, os.path.relpath(video, input_dir) + TIMELINE_SUFFIX)
+
+
+def source_signature(video):
+    """Return the size and modification time identifying a video's contents"""
+    stat = os.stat(video)
+    return {'size': stat.st_size, 'mtime': stat.st_mtime}
+
+
+def load_timeline(path):
+    """Load a timeline as a dict of column arrays plus its 'meta' dict"""
+    with np.load(path) as data:
+        columns = {name: data[name] for name in data.files if name != 'meta'}
+        columns['meta'] = json.loads(str(data['meta']))
+    return columns
+
+
+def is_complete(video, output):
+    """Return True if output holds a finished timeline of the current video"""
+    if not os.path.exists(output):
+        return False
+    try:
+        with np.load(output) as data:
+            meta = json.loads(str(data['meta']))
+    except (OSError, KeyError, ValueError):
+        return False
+    return meta.get('source') == source_signature(video)
+
+
+def write_timeline(output, columns, meta):
+    """Write the columns and metadata atomically"""
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    tmp = output + ".tmp"
+    with open(tmp, 'wb') as f:
+        np.savez_compressed(f, meta=np.array(json.dumps(meta)), **columns)
+    os.replace(tmp, output)
+
+
+def process_video(video, output, settings=None, flip=True, max_frames=None, hands_factory=None):
+    """Classify every frame of video, write its timeline and return a summary dict"""
+    import cv2
+    from controller_pipeline import ControllerConfig, ControllerPipeline, build_hands
+
+    config = ControllerConfig(settings)
+    settings = config.snapshot()[1]
+    pipeline = ControllerPipeline(config)
+    pipeline.drive_controls = False
+    pipeline.settings = settings
+    hands = (hands_factory or build_hands)(settings)
+
+    cap = cv2.VideoCapture(video)
+    if not cap.isOpened():
+        raise RuntimeError(f"Cannot open video {video}")
+    fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+    inference_width = settings['inference_width']
+    name = os.path.basename(video)
+
+    timestamps, gestures, landmarks = [], [], []
+    start = time.perf_counter()
+    try:
+        while max_frames is None or len(timestamps) < max_frames:
+            success, frame = cap.read()
+            if not success:
+                break
+            timestamps.append(cap.get(cv2.CAP_PROP_POS_MSEC))
+            if flip:
+                frame = cv2.flip(frame, 1)
+            height, width = frame.shape[:2]
+            if 0 < inference_width < width:
+                frame = cv2.resize(frame, (inference_width, height * inference_width // width),
+                                   interpolation=cv2.INTER_AREA)
+            results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+            row_gestures = [NO_GESTURE, NO_GESTURE]
+            row_landmarks = np.zeros((len(HAND_SLOTS), 21, 3), dtype=np.float16)
+            if results.multi_hand_landmarks:
+                for gesture, hand in pipeline.classify(results):
+                    slot = 0 if hand is pipeline.handmajor else 1
+                    row_gestures[slot] = int(gesture)
+                    row_landmarks[slot] = [(p.x, p.y, p.z) for p in hand.hand_result.landmark]
+            else:
+                pipeline.reset_gestures()
+            gestures.append(row_gestures)
+            landmarks.append(row_landmarks)
+
+            if len(timestamps) % PROGRESS_EVERY == 0:
+                print(f"  {name}: {len(timestamps)} frames", flush=True)
+    finally:
+        cap.release()
+        hands.close()
+    seconds = time.perf_counter() - start
+
+    frames = len(timestamps)
+    gestures = np.array(gestures, dtype=np.int16).reshape(frames, len(HAND_SLOTS))
+    columns = {
+        'frame': np.arange(frames, dtype=np.int32),
+        'timestamp_ms': np.array(timestamps, dtype=np.float64),
+        'present': (gestures != NO_GESTURE).astype(np.uint8),
+        'gesture': gestures,
+        'landmarks': (np.stack(landmarks) if landmarks
+                      else np.zeros((0, len(HAND_SLOTS), 21, 3), dtype=np.float16)),
+    }
+    meta = {
+        'video': os.path.basename(video),
+        'source': source_signature(video),
+        'fps': fps,
+        'frames': frames,
+        'flip': flip,
+        'hand_slots': HAND_SLOTS,
+        'settings': settings,
+        'processing_seconds': seconds,
+    }
+    write_timeline(output, columns, meta)
+    return {'video': video, 'frames': frames, 'seconds': seconds}
+
+
+def run_batch(input_dir, output_dir, jobs=1, settings=None, flip=True, max_frames=None,
+              overwrite=False, log=print, hands_factory=None):
+    """Process every pending video and return a report dict.
+
+    hands_factory replaces the settings' tracker backend. It only works in
+    this process, so it cannot be combined with more than one job.
+    """
+    if hands_factory is not None and jobs > 1:
+        raise ValueError("hands_factory needs jobs=1; pick a tracker_backend for worker processes")
+    videos = find_videos(input_dir)
+    pending = [(video, timeline_path(video, input_dir, output_dir)) for video in videos]
+    if not overwrite:
+        pending = [(video, output) for video, output in pending if not is_complete(video, output)]
+    log(f"{len(videos)} videos, {len(videos) - len(pending)} already processed, "
+        f"{len(pending)} to process with {jobs} worker(s)")
+
+    completed, failures = [], []
+    start = time.perf_counter()
+
+    def record(video, summary=None, error=None):
+        done = len(completed) + len(failures) + 1
+        name = os.path.relpath(video, input_dir)
+        if error is not None:
+            failures.append((video, str(error)))
+            log(f"[{done}/{len(pending)}] {name}: FAILED {error}")
+            return
+        completed.append(summary)
+        fps = summary['frames'] / summary['seconds'] if summary['seconds'] else 0.0
+        log(f"[{done}/{len(pending)}] {name}: {summary['frames']} frames in "
+            f"{summary['seconds']:.1f} s ({fps:.1f} fps)")
+
+    if jobs <= 1:
+        for video, output in pending:
+            try:
+                record(video, process_video(video, output, settings, flip, max_frames, hands_factory))
+            except Exception as e:
+                record(video, error=e)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(process_video, video, output, settings, flip, max_frames): video
+                       for video, output in pending}
+            for future in as_completed(futures):
+                try:
+                    record(futures[future], future.result())
+                except Exception as e:
+                    record(futures[future], error=e)
+
+    wall = time.perf_counter() - start
+    frames = sum(s['frames'] for s in completed)
+    busy = sum(s['seconds'] for s in completed)
+    report = {
+        'videos': len(videos),
+        'processed': len(completed),
+        'skipped': len(videos) - len(pending),
+        'failures': failures,
+        'frames': frames,
+        'wall_seconds': wall,
+        'fps': frames / wall if wall else 0.0,
+        # Throughput one worker core achieves while busy
+        'fps_per_core': frames / busy if busy else 0.0,
+    }
+    if completed:
+        log(f"{frames} frames in {wall:.1f} s: {report['fps']:.1f} fps total, "
+            f"{report['fps_per_core']:.1f} fps per core")
+    return report
+
+
+def main(argv=None):
+    """Process a directory of videos; exits non-zero if any video failed"""
+    parser = argparse.ArgumentParser(description="Batch gesture timelines from recorded videos")
+    parser.add_argument("input_dir", help="directory of recordings (searched recursively)")
+    parser.add_argument("--output", "-o", default="timelines", help="directory for .npz timelines")
+    parser.add_argument("--jobs", "-j", type=int, default=max(1, (os.cpu_count() or 2) - 1))
+    parser.add_argument("--inference-width", type=int, default=0)
+    parser.add_argument("--model-complexity", type=int, choices=(0, 1), default=1)
+    parser.add_argument("--single-hand", action="store_true", help="track one hand only")
+    parser.add_argument("--tracker", choices=list(BUILDERS),
+                        help="hand tracker backend; Stub plays a scripted hand, for tests")
+    parser.add_argument("--no-flip", action="store_true",
+                        help="don't mirror frames (the live controller mirrors the webcam)")
+    parser.add_argument("--max-frames", type=int, help="stop each video after this many frames")
+    parser.add_argument("--overwrite", action="store_true", help="reprocess finished videos")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.input_dir):
+        print(f"Not a directory: {args.input_dir}")
+        return 2
+    settings = default_settings()
+    settings.update(inference_width=args.inference_width, model_complexity=args.model_complexity,
+                    multi_hand_mode=not args.single_hand)
+    if args.tracker:
+        settings['tracker_backend'] = args.tracker
+    report = run_batch(args.input_dir, args.output, args.jobs, settings, not args.no_flip,
+                       args.max_frames, args.overwrite)
+    return 1 if report['failures'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,4 @@
+"""
+Benchmarks for the AI Virtual Mouse. Run from the repository root, e.g.
+``python -m benchmarks.auth_responsiveness``.
+"""
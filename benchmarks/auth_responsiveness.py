@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Tk event loop responsiveness during bursts of logins and registrations.
+
+A heartbeat is scheduled with ``after()`` every few milliseconds and the gap
+between beats is recorded while a burst of auth requests is processed, first
+synchronously inside the Tk callback (the old behaviour) and then through
+AsyncAuthService. The worst gap is how long the UI was frozen.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auth import AuthenticationManager, DEFAULT_HASH_ITERATIONS
+from auth_service import AsyncAuthService
+
+HEARTBEAT_MS = 5
+
+
+def percentile(values, pct):
+    """Return the pct-th percentile of values"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_burst(root, auth_manager, burst, use_service):
+    """Process a burst of registrations and logins, returning heartbeat gaps in ms"""
+    gaps = []
+    state = {'last': time.perf_counter(), 'done': 0, 'beating': True}
+    total = burst * 2
+
+    def heartbeat():
+        now = time.perf_counter()
+        gaps.append((now - state['last']) * 1000)
+        state['last'] = now
+        if state['beating']:
+            root.after(HEARTBEAT_MS, heartbeat)
+
+    def finished(success, message):
+        state['done'] += 1
+        if state['done'] == total:
+            state['beating'] = False
+            root.after(HEARTBEAT_MS * 2, root.quit)
+
+    service = AsyncAuthService(root, auth_manager) if use_service else None
+    tag = "async" if use_service else "sync"
+
+    def start_burst():
+        for i in range(burst):
+            username = f"bench_{tag}_{i}"
+            if service:
+                service.register(username, "secret", finished)
+                service.authenticate(username, "secret", finished)
+            else:
+                finished(*auth_manager.add_user(username, "secret"))
+                finished(*auth_manager.authenticate_user(username, "secret"))
+
+    root.after(HEARTBEAT_MS, heartbeat)
+    root.after(20, start_burst)
+    root.mainloop()
+    if service:
+        service.shutdown()
+    return gaps
+
+
+def main(argv=None):
+    """Run the benchmark and print the heartbeat gap statistics"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--burst", type=int, default=10, help="logins and registrations per burst")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_HASH_ITERATIONS, help="PBKDF2 hash cost")
+    args = parser.parse_args(argv)
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Skipping benchmark, no display available: {e}")
+        return 0
+    root.withdraw()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for use_service in (False, True):
+            data_file = os.path.join(tmp_dir, f"users_{int(use_service)}.json")
+            auth_manager = AuthenticationManager(hash_iterations=args.iterations, data_file=data_file)
+            start = time.perf_counter()
+            gaps = run_burst(root, auth_manager, args.burst, use_service)
+            elapsed = time.perf_counter() - start
+            mode = "AsyncAuthService" if use_service else "synchronous"
+            print(f"{mode:>17}: {args.burst * 2} requests in {elapsed:.2f}s, "
+                  f"heartbeat gap p50={percentile(gaps, 50):.1f}ms "
+                  f"p99={percentile(gaps, 99):.1f}ms max={max(gaps):.1f}ms")
+    root.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
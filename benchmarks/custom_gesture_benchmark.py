@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark: custom gesture template matching latency and accuracy.
+
+Templates are recorded from one synthetic corpus and queried with frames
+from another, so matching sees different positions, scales, tilts and
+jitter than it was trained on. Latency covers a full per-frame match:
+reading the landmarks, normalizing them and the nearest-template search.
+Exits non-zero when the mean or median latency exceeds the frame budget.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_gestures import TemplateMatcher, landmark_array, normalize_landmarks
+from gesture_fixtures import LandmarkList, synthetic_sequence
+
+# Poses that differ in the image plane; MID and PINCH_MINOR only differ
+# from TWO_FINGER_CLOSED and PINCH_MAJOR in depth or handedness
+TEMPLATE_LABELS = ('FIST', 'PINKY', 'RING', 'LAST3', 'INDEX', 'FIRST2', 'LAST4', 'THUMB',
+                   'V_GEST', 'TWO_FINGER_CLOSED', 'PINCH_MAJOR')
+
+DEFAULT_TEMPLATES = 100
+DEFAULT_BUDGET_MS = 0.2
+
+
+def build_matcher(template_count=DEFAULT_TEMPLATES, seed=0):
+    """Return a matcher holding template_count templates spread over TEMPLATE_LABELS"""
+    rng = random.Random(seed)
+    samples = {label: [] for label in TEMPLATE_LABELS}
+    for index in range(template_count):
+        label = TEMPLATE_LABELS[index % len(TEMPLATE_LABELS)]
+        frame = synthetic_sequence(label, rng, frames=1).frames[0]
+        samples[label].append(normalize_landmarks(landmark_array(LandmarkList(frame))))
+    matcher = TemplateMatcher(confirm_frames=1)
+    for label, vectors in samples.items():
+        if vectors:
+            matcher.add(label, vectors)
+    return matcher
+
+
+def query_frames(count=500, seed=1):
+    """Return [(label, LandmarkList)] query frames from an independent corpus"""
+    rng = random.Random(seed)
+    frames = []
+    for index in range(count):
+        label = TEMPLATE_LABELS[index % len(TEMPLATE_LABELS)]
+        frames.append((label, LandmarkList(synthetic_sequence(label, rng, frames=1).frames[0])))
+    return frames
+
+
+def run_benchmark(template_count=DEFAULT_TEMPLATES, queries=500, rounds=5):
+    """Match the query frames and return a report dict"""
+    matcher = build_matcher(template_count)
+    frames = query_frames(queries)
+    correct = sum(matcher.match(hand) == label for label, hand in frames)
+
+    latencies = []
+    clock = time.perf_counter
+    for _ in range(rounds):
+        for _, hand in frames:
+            start = clock()
+            matcher.match(hand)
+            latencies.append((clock() - start) * 1000.0)
+    latencies.sort()
+    return {
+        'templates': len(matcher),
+        'queries': len(frames),
+        'accuracy': correct / len(frames),
+        'mean_ms': sum(latencies) / len(latencies),
+        'p50_ms': latencies[len(latencies) // 2],
+        'p99_ms': latencies[int(len(latencies) * 0.99)],
+    }
+
+
+def check_report(report, budget_ms=DEFAULT_BUDGET_MS):
+    """Return a list of regression messages, empty if the report passes"""
+    failures = []
+    for key in ('mean_ms', 'p50_ms'):
+        if report[key] > budget_ms:
+            failures.append(f"{key} {report[key]:.3f} ms > {budget_ms:.3f} ms")
+    return failures
+
+
+def format_report(report):
+    """Render a report as text"""
+    return (f"{report['templates']} templates, {report['queries']} queries, "
+            f"accuracy {report['accuracy']:.1%}\n"
+            f"match latency mean {report['mean_ms'] * 1000:.1f} us, "
+            f"p50 {report['p50_ms'] * 1000:.1f} us, p99 {report['p99_ms'] * 1000:.1f} us")
+
+
+def main(argv=None):
+    """Run the benchmark and exit non-zero when over budget"""
+    parser = argparse.ArgumentParser(description="Custom gesture matching benchmark")
+    parser.add_argument("--templates", type=int, default=DEFAULT_TEMPLATES)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.templates)
+    print(format_report(report))
+    failures = check_report(report, args.budget_ms)
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
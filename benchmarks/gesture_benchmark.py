@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark: HandRecog accuracy, confirmation latency and throughput on a labeled corpus.
+
+Each sequence is fed frame by frame through a fresh HandRecog
+(update_hand_result -> set_finger_state -> get_gesture). The gesture emitted
+on the last frame is the prediction; the first frame on which the label is
+emitted is the confirmation latency. Labels in EXPECTED_GESTURES are scored
+against the gesture HandRecog is expected to confirm instead. Exits non-zero
+when accuracy or throughput falls below the given thresholds.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gesture_fixtures import EXPECTED_GESTURES, FINGER_STATE_LABELS, load_corpus
+
+# One label of the default corpus failing drops accuracy to about 0.93
+DEFAULT_MIN_ACCURACY = 0.95
+DEFAULT_MIN_THROUGHPUT = 5000.0  # classifications per second
+
+
+def classify_sequence(seq, hand_recog_cls, hlabel, gest):
+    """Return the gesture names emitted for each frame of seq"""
+    hand = hand_recog_cls(hlabel.MINOR if seq.hand == 'minor' else hlabel.MAJOR)
+    by_finger_state = seq.label in FINGER_STATE_LABELS
+    emitted = []
+    for hand_result in seq.hand_results():
+        hand.update_hand_result(hand_result)
+        hand.set_finger_state()
+        gesture = hand.get_gesture()
+        if by_finger_state and hand_result is not None:
+            gesture = hand.finger
+        try:
+            emitted.append(gest(gesture).name)
+        except ValueError:
+            emitted.append(str(gesture))
+    return emitted
+
+
+def measure_throughput(sequences, hand_recog_cls, hlabel, min_seconds=0.5):
+    """Return classifications per second over the corpus"""
+    hand_results = [(seq, seq.hand_results()) for seq in sequences]
+    count = 0
+    start = time.perf_counter()
+    while True:
+        for seq, frames in hand_results:
+            hand = hand_recog_cls(hlabel.MINOR if seq.hand == 'minor' else hlabel.MAJOR)
+            for hand_result in frames:
+                hand.update_hand_result(hand_result)
+                hand.set_finger_state()
+                hand.get_gesture()
+            count += len(frames)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return count / elapsed
+
+
+def run_benchmark(sequences, hand_recog_cls=None, hlabel=None, gest=None):
+    """Run the corpus through HandRecog and return a report dict"""
+    if hand_recog_cls is None:
+        from ai_virtual_mouse import Gest, HLabel, HandRecog
+        hand_recog_cls, hlabel, gest = HandRecog, HLabel, Gest
+
+    confusion = defaultdict(lambda: defaultdict(int))
+    latencies = defaultdict(list)
+    correct = 0
+    for seq in sequences:
+        emitted = classify_sequence(seq, hand_recog_cls, hlabel, gest)
+        predicted = emitted[-1] if emitted else None
+        expected = EXPECTED_GESTURES.get(seq.label, seq.label)
+        confusion[seq.label][predicted] += 1
+        if predicted == expected:
+            correct += 1
+        if expected in emitted:
+            frames = emitted.index(expected) + 1
+            latencies[seq.label].append((frames, frames * 1000.0 / seq.fps))
+
+    per_label = {}
+    for label, row in confusion.items():
+        total = sum(row.values())
+        label_latencies = latencies.get(label, [])
+        per_label[label] = {
+            'recall': row.get(EXPECTED_GESTURES.get(label, label), 0) / total,
+            'latency_frames': (sum(f for f, _ in label_latencies) / len(label_latencies)
+                               if label_latencies else None),
+            'latency_ms': (sum(ms for _, ms in label_latencies) / len(label_latencies)
+                           if label_latencies else None),
+        }
+
+    return {
+        'sequences': len(sequences),
+        'accuracy': correct / len(sequences) if sequences else 0.0,
+        'per_label': per_label,
+        'confusion': {label: dict(row) for label, row in confusion.items()},
+        'throughput': measure_throughput(sequences, hand_recog_cls, hlabel),
+    }
+
+
+def check_report(report, min_accuracy=DEFAULT_MIN_ACCURACY, min_throughput=DEFAULT_MIN_THROUGHPUT):
+    """Return a list of regression messages, empty if the report passes"""
+    failures = []
+    if report['accuracy'] < min_accuracy:
+        failures.append(f"accuracy {report['accuracy']:.3f} < {min_accuracy:.3f}")
+    if report['throughput'] < min_throughput:
+        failures.append(f"throughput {report['throughput']:.0f}/s < {min_throughput:.0f}/s")
+    return failures
+
+
+def format_report(report):
+    """Render a report as text"""
+    lines = [f"{report['sequences']} sequences, accuracy {report['accuracy']:.1%}, "
+             f"{report['throughput']:.0f} classifications/s", ""]
+    lines.append(f"{'label':<18} {'recall':>7} {'frames':>7} {'ms':>7}  predictions")
+    for label in sorted(report['per_label']):
+        stats = report['per_label'][label]
+        frames = "-" if stats['latency_frames'] is None else f"{stats['latency_frames']:.1f}"
+        ms = "-" if stats['latency_ms'] is None else f"{stats['latency_ms']:.0f}"
+        predictions = ", ".join(f"{p}={n}" for p, n in sorted(report['confusion'][label].items(),
+                                                              key=lambda item: -item[1]))
+        lines.append(f"{label:<18} {stats['recall']:>7.0%} {frames:>7} {ms:>7}  {predictions}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Run the benchmark and exit non-zero on regression"""
+    parser = argparse.ArgumentParser(description="Gesture classifier benchmark")
+    parser.add_argument("--corpus", help="JSON lines corpus (default: synthetic corpus)")
+    parser.add_argument("--min-accuracy", type=float, default=DEFAULT_MIN_ACCURACY)
+    parser.add_argument("--min-throughput", type=float, default=DEFAULT_MIN_THROUGHPUT)
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(load_corpus(args.corpus))
+    print(format_report(report))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    failures = check_report(report, args.min_accuracy, args.min_throughput)
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cost of following hand identities across frames.
+
+HandTracker.update runs on every processed frame, so its cost comes out of
+the frame budget. Scripted streams of one and two slowly moving hands, with
+a flipped handedness label every tenth frame, are fed through a fresh
+tracker; the best of several runs is reported per frame. Exits non-zero if
+a stream costs more than the per-frame budget or a hand changes track
+during it.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gesture_fixtures import LandmarkList, base_pose, place_pose
+from hand_tracking import LEFT, RIGHT, HandTracker
+
+# Milliseconds per frame; well under a millisecond even with two hands
+DEFAULT_BUDGET_MS = 0.2
+FLIP_EVERY = 10
+
+
+def hand_at(pose, x, y=0.7):
+    """A hand whose wrist sits at (x, y)"""
+    return LandmarkList(place_pose(pose, x, y, 1.0, 0.0))
+
+
+def streams(frames):
+    """Return {name: [(hands, labels)]} of scripted frames"""
+    pose = base_pose('LAST4')
+    one, two = [], []
+    for i in range(frames):
+        flipped = i % FLIP_EVERY == FLIP_EVERY - 1
+        right, left = (LEFT, RIGHT) if flipped else (RIGHT, LEFT)
+        one.append(([hand_at(pose, 0.4 + i * 0.001)], [right]))
+        two.append(([hand_at(pose, 0.3 + i * 0.001), hand_at(pose, 0.7 - i * 0.001)], [right, left]))
+    return {'one hand': one, 'two hands': two}
+
+
+def run_stream(frames, repeats):
+    """Track one stream repeats times and return its stats"""
+    best = None
+    for _ in range(repeats):
+        tracker = HandTracker()
+        ids = set()
+        start = time.perf_counter()
+        for hands, labels in frames:
+            tracker.update(hands, labels)
+            ids.update(track.id for track in tracker.tracks)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return {
+        'frames': len(frames),
+        'per_frame_ms': best * 1000.0 / len(frames),
+        'tracks': len(ids),
+        'hands': len(frames[0][0]),
+    }
+
+
+def run_benchmark(frames=200, repeats=5):
+    """Run every stream and return a report dict"""
+    return {name: run_stream(stream, repeats) for name, stream in streams(frames).items()}
+
+
+def check_report(report, budget_ms=DEFAULT_BUDGET_MS):
+    """Return a list of regression messages, empty if the report passes"""
+    failures = []
+    for name, stats in report.items():
+        if stats['per_frame_ms'] > budget_ms:
+            failures.append(f"{name}: {stats['per_frame_ms']:.3f} ms per frame, budget {budget_ms} ms")
+        if stats['tracks'] != stats['hands']:
+            failures.append(f"{name}: {stats['tracks']} tracks for {stats['hands']} hands")
+    return failures
+
+
+def format_report(report):
+    """Render a report as text"""
+    lines = [f"{'stream':<10} {'frames':>6} {'ms/frame':>9} {'tracks':>6}"]
+    for name, stats in report.items():
+        lines.append(f"{name:<10} {stats['frames']:>6} {stats['per_frame_ms']:>9.3f} {stats['tracks']:>6}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Run the benchmark and exit non-zero on failure"""
+    parser = argparse.ArgumentParser(description="Hand identity tracking benchmark")
+    parser.add_argument("--frames", type=int, default=200, help="frames per stream")
+    parser.add_argument("--repeats", type=int, default=5, help="runs per stream; the best is kept")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="allowed tracking time per frame")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.frames, args.repeats)
+    print(format_report(report))
+    failures = check_report(report, args.budget_ms)
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark: OverlayRenderer against MediaPipe's drawing_utils.draw_landmarks.
+
+Both draw the same two synthetic hands onto a frame of the given size;
+the renderer is also timed on a frame scaled down to the preview width, the
+way the pipeline uses it. draw_landmarks is only measured when MediaPipe is
+installed. Exits non-zero when the renderer is over budget.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_gestures import landmark_array
+from gesture_fixtures import LandmarkList, synthetic_sequence
+from overlay import OverlayRenderer
+
+DEFAULT_SIZE = (1280, 720)
+DEFAULT_PREVIEW_WIDTH = 480
+DEFAULT_BUDGET_MS = 1.0
+STATUS = "V_GEST | 30 fps"
+
+
+def sample_hands(seed=0):
+    """Return two synthetic hands as LandmarkLists"""
+    rng = random.Random(seed)
+    return [LandmarkList(synthetic_sequence(label, rng, frames=1).frames[0])
+            for label in ('V_GEST', 'LAST4')]
+
+
+def time_calls(draw, frame, rounds):
+    """Return the mean milliseconds of draw(frame) over rounds, after a warm-up call"""
+    image = frame.copy()
+    draw(image)
+    clock = time.perf_counter
+    start = clock()
+    for _ in range(rounds):
+        draw(image)
+    return (clock() - start) * 1000.0 / rounds
+
+
+def mediapipe_draw():
+    """Return a draw(image, hands) using draw_landmarks, or None without MediaPipe"""
+    try:
+        from mediapipe.framework.formats import landmark_pb2
+        import mediapipe.python.solutions.drawing_utils as drawing_utils
+        import mediapipe.python.solutions.hands as hands_module
+    except ImportError:
+        return None
+
+    def to_proto(hand):
+        return landmark_pb2.NormalizedLandmarkList(landmark=[
+            landmark_pb2.NormalizedLandmark(x=p.x, y=p.y, z=p.z) for p in hand.landmark])
+
+    def draw(image, hands):
+        for proto in [to_proto(hand) for hand in hands]:
+            drawing_utils.draw_landmarks(image, proto, hands_module.HAND_CONNECTIONS)
+    return draw
+
+
+def run_benchmark(size=DEFAULT_SIZE, preview_width=DEFAULT_PREVIEW_WIDTH, rounds=200):
+    """Time each renderer and return a report dict"""
+    width, height = size
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    preview = np.zeros((height * preview_width // width, preview_width, 3), dtype=np.uint8)
+    hands = sample_hands()
+    arrays = [landmark_array(hand) for hand in hands]
+    renderer = OverlayRenderer()
+
+    report = {
+        'size': f"{width}x{height}",
+        'preview_width': preview_width,
+        'overlay_ms': time_calls(lambda image: renderer.draw(image, arrays, STATUS), frame, rounds),
+        'overlay_preview_ms': time_calls(lambda image: renderer.draw(image, arrays, STATUS),
+                                         preview, rounds),
+        # Includes reading the protobufs into arrays, as the pipeline does
+        'overlay_with_conversion_ms': time_calls(
+            lambda image: renderer.draw(image, [landmark_array(hand) for hand in hands], STATUS),
+            frame, rounds),
+        'draw_landmarks_ms': None,
+    }
+    draw = mediapipe_draw()
+    if draw is not None:
+        report['draw_landmarks_ms'] = time_calls(lambda image: draw(image, hands), frame, rounds)
+    return report
+
+
+def check_report(report, budget_ms=DEFAULT_BUDGET_MS):
+    """Return a list of regression messages, empty if the report passes"""
+    failures = []
+    for key in ('overlay_ms', 'overlay_preview_ms'):
+        if report[key] > budget_ms:
+            failures.append(f"{key} {report[key]:.3f} ms > {budget_ms:.3f} ms")
+    baseline = report['draw_landmarks_ms']
+    if baseline is not None and report['overlay_ms'] > baseline:
+        failures.append(f"overlay {report['overlay_ms']:.3f} ms slower than "
+                        f"draw_landmarks {baseline:.3f} ms")
+    return failures
+
+
+def format_report(report):
+    """Render a report as text"""
+    lines = [f"two hands on {report['size']}:",
+             f"  OverlayRenderer           {report['overlay_ms'] * 1000:8.1f} us",
+             f"  + protobuf conversion     {report['overlay_with_conversion_ms'] * 1000:8.1f} us",
+             f"  at {report['preview_width']} px preview      {report['overlay_preview_ms'] * 1000:8.1f} us"]
+    if report['draw_landmarks_ms'] is None:
+        lines.append("  draw_landmarks            (MediaPipe not installed)")
+    else:
+        lines.append(f"  draw_landmarks            {report['draw_landmarks_ms'] * 1000:8.1f} us "
+                     f"({report['draw_landmarks_ms'] / report['overlay_ms']:.1f}x slower)")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Run the benchmark and exit non-zero when over budget"""
+    parser = argparse.ArgumentParser(description="Landmark overlay benchmark")
+    parser.add_argument("--width", type=int, default=DEFAULT_SIZE[0])
+    parser.add_argument("--height", type=int, default=DEFAULT_SIZE[1])
+    parser.add_argument("--preview-width", type=int, default=DEFAULT_PREVIEW_WIDTH)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args(argv)
+
+    report = run_benchmark((args.width, args.height), args.preview_width)
+    print(format_report(report))
+    failures = check_report(report, args.budget_ms)
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark: scroll events and latency of each Scrolling mode in the simulation harness.
+
+Scripted minor-hand pinches (a vertical hold, a horizontal hold and a
+vertical flick that lets go) run through simulation.Simulation once per
+Scrolling mode, with pyautogui's default pause charged to the simulated
+clock. For each mode the report counts scroll events and every input call
+they took (the Classic horizontal chord is five), the notches scrolled, the
+delay from the pinch being confirmed to its first scroll event, the
+shortest gap between scroll events and the frame rate the loop kept. Exits
+non-zero if a smooth mode sends events faster than its rate bound, needs
+modifier keys to scroll sideways, or reacts later than the Classic mode.
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_virtual_mouse import Gest
+from gesture_fixtures import trajectory
+from scroll_engine import DEFAULT_MAX_RATE, NATIVE_HSCROLL, WHEEL_DELTA
+from settings_profile import SCROLL_MODES
+from simulation import PYAUTOGUI_PAUSE, Simulation
+
+SCROLL_KINDS = ('scroll', 'hscroll')
+INPUT_KINDS = SCROLL_KINDS + ('key_down', 'key_up')
+START = (0.5, 0.7)
+
+
+def pinch_scripts(hold=45):
+    """Return {name: [sequences]} of minor-hand pinches that scroll"""
+    def pinch(end, frames=hold):
+        return [trajectory('PINCH_MINOR', 8, START),
+                trajectory('PINCH_MINOR', 4, START, end),
+                trajectory('PINCH_MINOR', frames, end)]
+    return {
+        'vertical': pinch((0.5, 0.6)),
+        'horizontal': pinch((0.62, 0.7)),
+        'flick': pinch((0.5, 0.6), frames=6) + [trajectory('PALM', 30, None)],
+    }
+
+
+def run_script(mode, sequences, pause=PYAUTOGUI_PAUSE):
+    """Play one script in one mode and return its stats"""
+    with Simulation({'multi_hand_mode': True, 'scroll_mode': mode}, pause=pause) as sim:
+        sim.play(*sequences)
+    scrolls = sim.sink.of(*SCROLL_KINDS)
+    confirmed = [t for _, t, gesture in sim.gestures if gesture == Gest.PINCH_MINOR]
+    gaps = [b.time - a.time for a, b in zip(scrolls, scrolls[1:]) if a.kind == b.kind]
+    return {
+        'events': len(scrolls),
+        'input_calls': len(sim.sink.of(*INPUT_KINDS)),
+        'key_calls': len(sim.sink.of('key_down', 'key_up')),
+        'notches': sum(abs(event.args[0]) for event in scrolls) / WHEEL_DELTA,
+        'latency': scrolls[0].time - confirmed[0] if scrolls and confirmed else None,
+        'min_gap': min(gaps) if gaps else None,
+        'fps': sim.fps,
+    }
+
+
+def run_benchmark(modes=SCROLL_MODES, pause=PYAUTOGUI_PAUSE):
+    """Run every script in every mode and return a report dict"""
+    scripts = pinch_scripts()
+    return {
+        'pause': pause,
+        'modes': {mode: {name: run_script(mode, sequences, pause) for name, sequences in scripts.items()}
+                  for mode in modes},
+    }
+
+
+def check_report(report, max_rate=DEFAULT_MAX_RATE):
+    """Return a list of regression messages, empty if the report passes"""
+    failures = []
+    classic = report['modes'].get("Classic")
+    for mode, scripts in report['modes'].items():
+        if mode == "Classic":
+            continue
+        for name, stats in scripts.items():
+            if not stats['events']:
+                failures.append(f"{mode} {name}: no scroll events")
+                continue
+            if stats['min_gap'] is not None and stats['min_gap'] < 1.0 / max_rate - 1e-6:
+                failures.append(f"{mode} {name}: events {stats['min_gap'] * 1000:.0f} ms apart, "
+                                f"bound is {1000.0 / max_rate:.0f} ms")
+            if NATIVE_HSCROLL and stats['key_calls']:
+                failures.append(f"{mode} {name}: {stats['key_calls']} modifier key calls")
+            reference = classic and classic[name]['latency']
+            if reference is not None and reference and stats['latency'] > reference:
+                failures.append(f"{mode} {name}: first event after {stats['latency'] * 1000:.0f} ms, "
+                                f"Classic {reference * 1000:.0f} ms")
+    return failures
+
+
+def format_report(report):
+    """Render a report as text"""
+    lines = [f"pyautogui pause {report['pause'] * 1000:.0f} ms per call",
+             f"{'mode':<10} {'script':<11} {'events':>6} {'calls':>6} {'notches':>8} "
+             f"{'latency':>8} {'min gap':>8} {'fps':>5}"]
+    for mode, scripts in report['modes'].items():
+        for name, stats in scripts.items():
+            latency = "-" if stats['latency'] is None else f"{stats['latency'] * 1000:.0f} ms"
+            gap = "-" if stats['min_gap'] is None else f"{stats['min_gap'] * 1000:.0f} ms"
+            lines.append(f"{mode:<10} {name:<11} {stats['events']:>6} {stats['input_calls']:>6} "
+                         f"{stats['notches']:>8.1f} {latency:>8} {gap:>8} {stats['fps']:>5.1f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Run the benchmark and exit non-zero on failure"""
+    parser = argparse.ArgumentParser(description="Scroll engine benchmark")
+    parser.add_argument("--pause", type=float, default=PYAUTOGUI_PAUSE,
+                        help="seconds each input call blocks, as pyautogui.PAUSE")
+    parser.add_argument("--mode", action="append", choices=SCROLL_MODES,
+                        help="Scrolling mode to run (repeatable; default: all)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.mode or SCROLL_MODES, args.pause)
+    print(format_report(report))
+    failures = check_report(report)
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
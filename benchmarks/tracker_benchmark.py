@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Benchmark: hand tracker backends on a paced frame stream.
+
+Frames are handed to each backend at the camera's rate, as the capture
+loop would: a frame is available at every tick, or at once if processing
+fell behind. A synchronous backend's frame rate is bounded by its
+inference time, while the Tasks LIVE_STREAM backend returns immediately and
+reports how far its newest result lags behind. Frames come from a video
+file if given, else blank frames (MediaPipe then runs palm detection on
+every frame, its slowest path). Backends that cannot be built here, e.g.
+without MediaPipe or the Tasks model file, are reported as skipped.
+Exits non-zero if a backend fails while processing or the stub falls
+below the camera rate.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from settings_profile import default_settings
+from trackers import BUILDERS, build_tracker
+
+# Every backend, including the Stub the dashboard does not offer
+BACKENDS = list(BUILDERS)
+
+DEFAULT_FRAMES = 90
+DEFAULT_CAMERA_FPS = 30.0
+DEFAULT_SIZE = (640, 480)
+# The stub must keep up with the camera within this fraction
+STUB_MIN_RATE = 0.9
+
+
+def load_frames(video=None, count=DEFAULT_FRAMES, size=DEFAULT_SIZE):
+    """Return count RGB frames from video, or blank frames"""
+    if video is None:
+        return [np.zeros((size[1], size[0], 3), dtype=np.uint8)] * count
+    import cv2
+    cap = cv2.VideoCapture(video)
+    frames = []
+    try:
+        while len(frames) < count:
+            success, frame = cap.read()
+            if not success:
+                break
+            frames.append(cv2.cvtColor(cv2.flip(frame, 1), cv2.COLOR_BGR2RGB))
+    finally:
+        cap.release()
+    if not frames:
+        raise RuntimeError(f"No frames in {video}")
+    return frames
+
+
+def run_backend(name, frames, camera_fps=DEFAULT_CAMERA_FPS, settings=None, clock=time.perf_counter,
+                sleep=time.sleep):
+    """Feed frames to one backend at the camera's pace and return its stats"""
+    settings = dict(settings or default_settings())
+    settings['tracker_backend'] = name
+    try:
+        tracker = build_tracker(settings)
+    except (ImportError, RuntimeError) as e:
+        return {'backend': name, 'skipped': str(e)}
+
+    interval = 1.0 / camera_fps if camera_fps > 0 else 0.0
+    durations, hands, lags = [], 0, []
+    try:
+        start = clock()
+        for index, frame in enumerate(frames):
+            # The next frame arrives on the camera's tick, or at once if we fell behind
+            wait = start + index * interval - clock()
+            if wait > 0:
+                sleep(wait)
+            t = clock()
+            results = tracker.process(frame)
+            durations.append((clock() - t) * 1000.0)
+            if results.multi_hand_landmarks:
+                hands += 1
+            lag = getattr(tracker, 'lag_ms', None)
+            if lag is not None:
+                lags.append(lag)
+        elapsed = clock() - start
+    except Exception as e:
+        return {'backend': name, 'error': str(e)}
+    finally:
+        tracker.close()
+
+    durations.sort()
+    return {
+        'backend': name,
+        'frames': len(frames),
+        'fps': len(frames) / elapsed if elapsed > 0 else 0.0,
+        'process_mean_ms': sum(durations) / len(durations),
+        'process_p95_ms': durations[int(len(durations) * 0.95)],
+        'frames_with_hands': hands,
+        'lag_ms': sum(lags) / len(lags) if lags else None,
+    }
+
+
+def run_benchmark(frames, backends=BACKENDS, camera_fps=DEFAULT_CAMERA_FPS):
+    """Run every backend over frames and return a report dict"""
+    return {
+        'camera_fps': camera_fps,
+        'frames': len(frames),
+        'backends': [run_backend(name, frames, camera_fps) for name in backends],
+    }
+
+
+def check_report(report):
+    """Return a list of regression messages, empty if the report passes"""
+    failures = []
+    for stats in report['backends']:
+        if 'error' in stats:
+            failures.append(f"{stats['backend']} failed: {stats['error']}")
+        elif stats['backend'] == "Stub" and 'fps' in stats and report['camera_fps'] > 0:
+            floor = report['camera_fps'] * STUB_MIN_RATE
+            if stats['fps'] < floor:
+                failures.append(f"Stub {stats['fps']:.1f} fps < {floor:.1f} fps")
+    return failures
+
+
+def format_report(report):
+    """Render a report as text"""
+    lines = [f"{report['frames']} frames at {report['camera_fps']:.0f} fps camera pace",
+             f"{'backend':<10} {'fps':>6} {'mean ms':>8} {'p95 ms':>8} {'hands':>6} {'lag ms':>7}"]
+    for stats in report['backends']:
+        name = stats['backend']
+        if 'skipped' in stats:
+            lines.append(f"{name:<10} skipped: {stats['skipped']}")
+        elif 'error' in stats:
+            lines.append(f"{name:<10} error: {stats['error']}")
+        else:
+            lag = "-" if stats['lag_ms'] is None else f"{stats['lag_ms']:.0f}"
+            lines.append(f"{name:<10} {stats['fps']:>6.1f} {stats['process_mean_ms']:>8.2f} "
+                         f"{stats['process_p95_ms']:>8.2f} {stats['frames_with_hands']:>6} {lag:>7}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Run the benchmark and exit non-zero on failure"""
+    parser = argparse.ArgumentParser(description="Hand tracker backend benchmark")
+    parser.add_argument("--video", help="video file to track (default: blank frames)")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES)
+    parser.add_argument("--camera-fps", type=float, default=DEFAULT_CAMERA_FPS,
+                        help="pace of the frame stream; 0 feeds frames as fast as possible")
+    parser.add_argument("--backend", action="append", choices=BACKENDS,
+                        help="backend to run (repeatable; default: all)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(load_frames(args.video, args.frames), args.backend or BACKENDS,
+                           args.camera_fps)
+    print(format_report(report))
+    failures = check_report(report)
+    for failure in failures:
+        print(f"REGRESSION: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
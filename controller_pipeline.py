@@ -0,0 +1,651 @@
+"""
+Camera-to-cursor pipeline driven by the dashboard's controller thread.
+
+Settings reach a running pipeline through ControllerConfig. Cheap settings
+are applied on the next frame; settings baked into the hand tracker (see
+trackers.py) trigger a background rebuild that is swapped in between
+frames, so the camera stream keeps running.
+"""
+
+import threading
+import time
+import cv2
+from ai_virtual_mouse import Gest, HLabel, HandRecog, Controller
+from custom_gestures import landmark_array
+from dwell import DwellClicker
+from gesture_cache import CachedHandRecog, GestureCacheStats
+import gesture_actions
+from gesture_actions import CURSOR, CUSTOM_ACTIONS, GESTURE_MODES, HANDS, SCROLLER
+from gesture_dispatch import GestureDispatcher
+from hand_tracking import HandTracker
+from overlay import OverlayRenderer, status_text
+from presence import PresenceGate
+from power import ACTIVE, PowerPolicy
+from screen_mapping import DEFAULT_CAMERA_ASPECT, ScreenMapping, desktop_bounds
+from settings_profile import default_settings, parse_camera_mode
+from trackers import build_tracker
+
+PREVIEW_WINDOW = 'AI Virtual Mouse - Press ESC to stop'
+TRACE_TRACK = "controller pipeline"
+
+# Consecutive failed reads before the camera is reopened
+REOPEN_AFTER_EMPTY_FRAMES = 30
+REOPEN_DELAY = 0.5
+# Seconds between checks for monitor changes while settings are unchanged
+DISPLAY_CHECK_INTERVAL = 2.0
+
+# Settings baked into the hand tracker; changing one requires a rebuild
+MODEL_KEYS = ('tracker_backend', 'multi_hand_mode', 'hand_detection_confidence',
+              'tracking_confidence', 'model_complexity')
+
+
+def model_key(settings):
+    """Return the part of settings that determines the hand tracker"""
+    return tuple(settings[key] for key in MODEL_KEYS)
+
+
+def build_hands(settings):
+    """Build the hand tracker backend chosen by the settings; see trackers.py"""
+    return build_tracker(settings)
+
+
+class ControllerConfig:
+    """Thread-safe settings channel from the UI to a running pipeline.
+
+    Writers call update() from any thread. The pipeline compares ``version``
+    against the last version it applied once per frame, which is a single
+    attribute read, and only takes the lock when something changed.
+    """
+
+    def __init__(self, settings=None):
+        """Initialize the channel with defaults overridden by settings"""
+        self.lock = threading.Lock()
+        self.settings = default_settings()
+        self.settings.update(settings or {})
+        self.version = 0
+
+    def update(self, **changes):
+        """Change one or more settings"""
+        with self.lock:
+            changed = {k: v for k, v in changes.items() if self.settings.get(k) != v}
+            if changed:
+                self.settings.update(changed)
+                self.version += 1
+
+    def snapshot(self):
+        """Return (version, copy of settings)"""
+        with self.lock:
+            return self.version, dict(self.settings)
+
+
+class HandsModel:
+    """Owns the hand tracker and rebuilds it in the background on demand.
+
+    The rebuilt graph is handed over by current(), which the pipeline thread
+    calls between frames, so the swap never races an in-flight process().
+    """
+
+    def __init__(self, settings, factory=build_hands):
+        """Build the initial graph synchronously"""
+        self.factory = factory
+        self.key = model_key(settings)
+        self.hands = factory(settings)
+        self.lock = threading.Lock()
+        # Key of the latest request; builds for any other key are discarded
+        self.target = self.key
+        self.wanted = None
+        self.ready = None
+        self.builder = None
+        self.rebuild_count = 0
+
+    def request(self, settings):
+        """Ask for a graph matching settings; returns immediately"""
+        with self.lock:
+            key = model_key(settings)
+            self.target = key
+            self.wanted = None if key == self.key else dict(settings)
+            stale = None
+            if self.ready is not None and self.ready[0] != key:
+                stale, self.ready = self.ready, None
+            if self.wanted and self.builder is None:
+                self.builder = threading.Thread(target=self.build_loop, daemon=True)
+                self.builder.start()
+        if stale:
+            stale[1].close()
+
+    def build_loop(self):
+        """Build graphs until the latest requested settings are ready"""
+        while True:
+            with self.lock:
+                settings = self.wanted
+                self.wanted = None
+                if settings is None:
+                    self.builder = None
+                    return
+            try:
+                hands = self.factory(settings)
+            except Exception as e:
+                # Keep the current tracker, e.g. when a backend's model file is missing
+                print(f"Cannot build hand tracker: {e}")
+                continue
+            key = model_key(settings)
+            with self.lock:
+                if key == self.target:
+                    stale, self.ready = self.ready, (key, hands)
+                else:
+                    # Superseded or reverted while building
+                    stale = (key, hands)
+            if stale:
+                stale[1].close()
+
+    def current(self):
+        """Return the graph to use for the next frame, swapping in a rebuilt one"""
+        if self.ready is not None:
+            with self.lock:
+                ready, self.ready = self.ready, None
+            if ready:
+                old = self.hands
+                self.key, self.hands = ready
+                self.rebuild_count += 1
+                old.close()
+        return self.hands
+
+    def close(self):
+        """Release the active graph and any graph waiting to be swapped in"""
+        with self.lock:
+            # A build still running is superseded and closes its own graph
+            self.target = None
+            self.wanted = None
+            ready, self.ready = self.ready, None
+        if ready:
+            ready[1].close()
+        self.hands.close()
+
+
+class ControllerPipeline:
+    """Turns camera frames into cursor control"""
+
+    def __init__(self, config, on_gesture=None, hands_factory=build_hands, memory_profiler=None,
+                 tracer=None, metrics=None, pointer=None, on_action=None, gesture_modes=GESTURE_MODES,
+                 analytics=None):
+        """Initialize the pipeline.
+
+        on_gesture(gesture) is called when a hand's gesture changes and
+        on_action(stat) when a gesture mapped to a dashboard counter starts.
+        analytics is an optional analytics.DashboardAnalytics fed per frame.
+        """
+        self.config = config
+        self.memory_profiler = memory_profiler
+        self.tracer = tracer
+        self.metrics = metrics
+        self.analytics = analytics
+        self.frame_started = 0.0
+        self.pointer = pointer
+        self.cursor = CURSOR
+        self.scroller = SCROLLER
+        # Fixed (left, top, width, height) desktop; None reads the monitors
+        self.desktop = None
+        self.screen_key = None
+        self.display_checked = 0.0
+        self.dwell = None
+        self.presence_gate = None
+        self.power = None
+        self.hands_visible = False
+        self.active_fps = 0
+        self.clock = time.perf_counter
+        self.camera_index = None
+        self.on_gesture = on_gesture
+        self.on_action = on_action
+        self.hands_factory = hands_factory
+        self.dispatcher = GestureDispatcher(gesture_modes, HANDS, on_action=self.report_action)
+        # A custom_gestures.TemplateMatcher; replaced, never mutated, while running
+        self.custom_gestures = None
+        self.custom_bound = None
+        self.last_major = None
+        self.hand_tracker = HandTracker()
+        # Shared by both hands' CachedHandRecog while the gesture cache is on
+        self.gesture_cache = GestureCacheStats()
+        # Track id each HandRecog last followed; its state belongs to that hand
+        self.slot_tracks = {HLabel.MAJOR: None, HLabel.MINOR: None}
+        self.handmajor = HandRecog(HLabel.MAJOR)
+        self.handminor = HandRecog(HLabel.MINOR)
+        self.prev_gest_major = None
+        self.prev_gest_minor = None
+        self.config_version = -1
+        self.settings = None
+        self.model = None
+        self.last_preview = 0.0
+        self.last_preview_frame = 0
+        self.preview_open = False
+        self.overlay = OverlayRenderer()
+        # (21, 2) landmark arrays of the hands in the latest processed frame
+        self.overlay_hands = []
+        self.frame_index = 0
+        # Calibration runs the pipeline without moving the real cursor
+        self.drive_controls = True
+
+    def open_camera(self, index=0):
+        """Open the capture device, raising RuntimeError if unavailable"""
+        cap = cv2.VideoCapture(index)
+        if not cap.isOpened():
+            raise RuntimeError("Cannot open camera")
+        self.camera_index = index
+        self.apply_camera_mode(cap, self.config.snapshot()[1]['camera_mode'])
+        return cap
+
+    def apply_camera_mode(self, cap, mode):
+        """Request a resolution and frame rate from an open capture"""
+        camera_mode = parse_camera_mode(mode)
+        if camera_mode:
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, camera_mode[0])
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, camera_mode[1])
+            cap.set(cv2.CAP_PROP_FPS, camera_mode[2])
+
+    def poll_config(self, cap=None):
+        """Apply settings changed since the last frame"""
+        if self.model is not None and self.config.version == self.config_version:
+            if self.clock() - self.display_checked >= DISPLAY_CHECK_INTERVAL:
+                self.update_screen_mapping(cap)
+            return
+        previous = self.settings
+        self.config_version, self.settings = self.config.snapshot()
+        if previous is None or previous['gesture_cache'] != self.settings['gesture_cache']:
+            self.handmajor = self.new_hand_recog(HLabel.MAJOR)
+            self.handminor = self.new_hand_recog(HLabel.MINOR)
+        if self.model is None:
+            self.model = HandsModel(self.settings, self.hands_factory)
+        else:
+            self.model.request(self.settings)
+        if cap is not None and previous and previous['camera_mode'] != self.settings['camera_mode']:
+            self.apply_camera_mode(cap, self.settings['camera_mode'])
+        self.dispatcher.set_mode(self.settings['gesture_mode'])
+        scroll_mode = self.settings['scroll_mode']
+        self.scroller.configure(self.settings['scroll_speed'], inertia=scroll_mode == "Inertial",
+                                enabled=scroll_mode != "Classic", clock=self.clock)
+        if self.settings['idle_timeout'] <= 0:
+            if self.power is not None and self.power.idle and cap is not None:
+                self.power.enter(ACTIVE, self.power.clock())
+                self.apply_power_state(cap)
+            self.power = None
+        elif self.power is None:
+            self.power = PowerPolicy(self.settings['idle_timeout'], clock=self.clock)
+        else:
+            self.power.idle_after = self.settings['idle_timeout']
+        if not self.settings['presence_gate']:
+            self.presence_gate = None
+        elif self.presence_gate is None:
+            self.presence_gate = PresenceGate()
+        if self.settings['autoclick_enabled']:
+            if self.dwell is None:
+                self.dwell = DwellClicker(self.settings['autoclick_delay'], clock=self.clock)
+            self.dwell.delay = self.settings['autoclick_delay']
+        else:
+            self.dwell = None
+        self.update_screen_mapping(cap)
+
+    def update_screen_mapping(self, cap=None):
+        """Rebuild the cursor's screen mapping if the display or its settings changed"""
+        self.display_checked = self.clock()
+        if not self.drive_controls:
+            return
+        settings = self.settings
+        camera_aspect = DEFAULT_CAMERA_ASPECT
+        if cap is not None:
+            width, height = cap.get(cv2.CAP_PROP_FRAME_WIDTH), cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
+            if width > 0 and height > 0:
+                camera_aspect = width / height
+        key = (self.desktop or desktop_bounds(), settings['active_region'], settings['aspect_correction'],
+               camera_aspect, settings['mouse_sensitivity'])
+        if key == self.screen_key:
+            return
+        self.screen_key = key
+        mapping = ScreenMapping.build(key[0], settings['active_region'] / 100.0, camera_aspect,
+                                      settings['aspect_correction'])
+        self.cursor.configure(mapping, settings['mouse_sensitivity'])
+
+    def process_frame(self, image):
+        """Detect hands in a BGR frame, drive the controller and return the annotated frame"""
+        settings = self.settings
+        self.frame_index += 1
+        if self.analytics is not None:
+            self.frame_started = self.clock()
+        stride = settings['inference_stride']
+        if self.power is not None:
+            stride = self.power.inference_stride(stride)
+        if self.frame_index % stride:
+            if self.metrics:
+                self.metrics.skipped_frames.inc()
+            return cv2.flip(image, 1)
+
+        gate = self.presence_gate
+        if gate is not None and not gate.check(image):
+            self.hands_visible = False
+            self.overlay_hands = []
+            if self.metrics:
+                self.metrics.gated_frames.inc()
+            return cv2.flip(image, 1)
+
+        timed = self.timing_enabled()
+        t = self.clock() if timed else 0.0
+
+        image = cv2.cvtColor(cv2.flip(image, 1), cv2.COLOR_BGR2RGB)
+        image.flags.writeable = False
+        # Landmarks are normalised, so inference can run on a smaller copy
+        height, width = image.shape[:2]
+        inference_width = settings['inference_width']
+        if 0 < inference_width < width:
+            small = cv2.resize(image, (inference_width, height * inference_width // width),
+                               interpolation=cv2.INTER_AREA)
+        else:
+            small = image
+        if timed:
+            t = self.mark("preprocess", t)
+
+        inference_start = self.clock() if gate is not None else 0.0
+        results = self.model.current().process(small)
+        self.hands_visible = bool(results.multi_hand_landmarks)
+        if gate is not None:
+            gate.observe(self.hands_visible, self.clock() - inference_start)
+        if timed:
+            t = self.mark("hands.process", t)
+
+        image.flags.writeable = True
+        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+
+        self.apply_results(results, t if timed else None)
+        return image
+
+    def apply_results(self, results, t=None):
+        """Classify the hands in a Hands result and act on their gestures.
+
+        Stage timings are marked from t when given. The simulation harness
+        calls this directly, without a camera frame.
+        """
+        settings = self.settings
+        if results.multi_hand_landmarks:  # type: ignore
+            controls = self.classify(results)
+            if t is not None:
+                t = self.mark("classify", t)
+
+            if self.drive_controls:
+                dispatcher = self.dispatcher
+                for gesture, hand in controls:
+                    dispatcher.dispatch(gesture, hand.hand_label, hand.hand_result)
+                dispatcher.retain([hand.hand_label for _, hand in controls])
+                if self.dwell is not None:
+                    self.update_dwell(controls)
+                if self.scroller.active:
+                    self.scroller.tick()
+                if t is not None:
+                    t = self.mark("handle_controls", t)
+
+            # Drawn in show_preview, only on the frames that are shown
+            if settings['show_landmarks'] and settings['preview_rate'] > 0:
+                self.overlay_hands = [landmark_array(hand) for hand in results.multi_hand_landmarks]  # type: ignore
+
+        else:
+            self.overlay_hands = []
+            self.reset_gestures()
+            if self.drive_controls and self.scroller.active:
+                self.scroller.tick()
+
+    def classify(self, results):
+        """Assign hands to major/minor, update gestures and return [(gesture, HandRecog)] to act on"""
+        hand_landmarks = results.multi_hand_landmarks[:2]  # type: ignore
+        labels = []
+        for index in range(len(hand_landmarks)):
+            try:
+                labels.append(results.multi_handedness[index].classification[0].label)  # type: ignore
+            except (AttributeError, IndexError, TypeError):
+                labels.append(None)
+        hr_major, hr_minor = self.hand_tracker.update(hand_landmarks, labels,
+                                                      self.settings['dominant_hand'])
+        self.follow_tracks()
+        self.handmajor.update_hand_result(hr_major)
+        self.handminor.update_hand_result(hr_minor)
+
+        self.handmajor.set_finger_state()
+        self.handminor.set_finger_state()
+        self.last_major = hr_major
+        controls = []
+        if hr_major is not None:
+            gest_major = self.handmajor.get_gesture()
+            matcher = self.custom_gestures
+            if matcher is not None:
+                if matcher is not self.custom_bound:
+                    self.bind_custom_gestures(matcher)
+                custom = matcher.update(hr_major)
+                if custom is not None:
+                    gest_major = custom
+            if gest_major != self.prev_gest_major:
+                self.prev_gest_major = gest_major
+                if self.on_gesture:
+                    self.on_gesture(gest_major)
+                if self.analytics is not None:
+                    self.analytics.gesture(gest_major)
+            controls.append((gest_major, self.handmajor))
+        if hr_minor is not None and self.settings['multi_hand_mode']:
+            gest_minor = self.handminor.get_gesture()
+            if gest_minor != self.prev_gest_minor:
+                self.prev_gest_minor = gest_minor
+                if self.on_gesture:
+                    self.on_gesture(gest_minor)
+            controls.append((gest_minor, self.handminor))
+        return controls
+
+    def bind_custom_gestures(self, matcher):
+        """Route a matcher's gestures to their actions on the major hand"""
+        self.dispatcher.set_custom({(name, HLabel.MAJOR): CUSTOM_ACTIONS[action]
+                                    for name, action in matcher.actions.items()
+                                    if action in CUSTOM_ACTIONS})
+        self.custom_bound = matcher
+
+    def timing_enabled(self):
+        """Return True if stage timings are being traced or exported"""
+        return self.metrics is not None or (self.tracer is not None and self.tracer.enabled)
+
+    def mark(self, name, start, args=None):
+        """Record a pipeline stage that began at start and return its end time"""
+        end = self.clock()
+        if self.tracer is not None and self.tracer.enabled:
+            self.tracer.complete(name, start, TRACE_TRACK, end, args)
+        if self.metrics is not None:
+            self.metrics.observe_stage(name, end - start)
+        return end
+
+    def update_dwell(self, controls):
+        """Feed the cursor position to the dwell clicker while the hand steers the cursor"""
+        gesture, hand = controls[0] if controls else (None, None)
+        if hand is not self.handmajor or gesture != Gest.V_GEST:
+            self.dwell.reset()
+            return
+        # Looked up per call so a patched gesture_actions sink sees dwell clicks too
+        pointer = self.pointer or gesture_actions.pointer()
+        # The cursor mapper knows where it put the cursor; only ask the OS before it has
+        x, y = self.cursor.cursor or pointer.position()
+        if self.dwell.update(x, y):
+            pointer.click()
+            self.report_action('click_count')
+
+    def follow_tracks(self):
+        """Start fresh HandRecog state when a different hand takes over a slot"""
+        for label, track in ((HLabel.MAJOR, self.hand_tracker.major),
+                             (HLabel.MINOR, self.hand_tracker.minor)):
+            if track is None or track.id == self.slot_tracks[label]:
+                continue
+            if self.slot_tracks[label] is not None:
+                self.dispatcher.release(label)
+                if label == HLabel.MAJOR:
+                    self.handmajor = self.new_hand_recog(HLabel.MAJOR)
+                    self.prev_gest_major = None
+                    if self.custom_gestures is not None:
+                        self.custom_gestures.reset()
+                else:
+                    self.handminor = self.new_hand_recog(HLabel.MINOR)
+                    self.prev_gest_minor = None
+            self.slot_tracks[label] = track.id
+
+    def new_hand_recog(self, label):
+        """Return fresh gesture state for a hand slot, memoized if the gesture cache is on"""
+        if self.settings is not None and self.settings['gesture_cache']:
+            return CachedHandRecog(label, stats=self.gesture_cache)
+        return HandRecog(label)
+
+    def report_action(self, stat):
+        """Forward a dispatched action's dashboard counter, timing it from its frame"""
+        if self.analytics is not None:
+            self.analytics.action(stat, self.clock() - self.frame_started)
+        if self.on_action:
+            self.on_action(stat)
+
+    def reset_gestures(self):
+        """Forget the previous gestures, e.g. when no hand is visible"""
+        self.hand_tracker.update((), ())
+        if self.analytics is not None and self.prev_gest_major is not None:
+            self.analytics.gesture(None)
+        self.prev_gest_major = None
+        self.prev_gest_minor = None
+        Controller.prev_hand = None
+        self.cursor.reset()
+        self.dispatcher.release()
+        if self.dwell is not None:
+            self.dwell.reset()
+        if self.custom_gestures is not None:
+            self.custom_gestures.reset()
+
+    def show_preview(self, image):
+        """Show the frame at the configured preview rate; returns False on ESC"""
+        settings = self.settings
+        preview_rate = settings['preview_rate']
+        now = time.perf_counter()
+        if preview_rate <= 0 or now - self.last_preview < 1.0 / preview_rate:
+            return True
+        fps = ((self.frame_index - self.last_preview_frame) / (now - self.last_preview)
+               if self.last_preview else None)
+        self.last_preview, self.last_preview_frame = now, self.frame_index
+        # The preview freezes while idle; keep polling for ESC
+        if self.power is None or not self.power.idle:
+            height, width = image.shape[:2]
+            preview_width = settings['preview_width']
+            if 0 < preview_width < width:
+                image = cv2.resize(image, (preview_width, height * preview_width // width),
+                                   interpolation=cv2.INTER_AREA)
+            if settings['show_landmarks']:
+                timed = self.timing_enabled()
+                t = self.clock() if timed else 0.0
+                text = status_text(self.gesture_name(self.prev_gest_major), fps)
+                self.overlay.draw(image, self.overlay_hands, text)
+                if timed:
+                    self.mark("draw_landmarks", t)
+            self.preview_open = True
+            cv2.imshow(PREVIEW_WINDOW, image)
+        key = cv2.waitKey(1) & 0xFF
+        return key != 27
+
+    @staticmethod
+    def gesture_name(gesture):
+        """Return a Gest value's name, or a custom gesture's own name"""
+        if gesture is None:
+            return None
+        try:
+            return Gest(gesture).name
+        except (ValueError, TypeError):
+            return str(gesture)
+
+    def run(self, cap, should_run):
+        """Process frames from cap until should_run() is false or ESC is pressed.
+
+        Returns the capture in use at the end, which differs from cap if the
+        camera had to be reopened; the caller releases it.
+        """
+        profiler = self.memory_profiler
+        metrics = self.metrics
+        if profiler:
+            profiler.start()
+        camera_fps = cap.get(cv2.CAP_PROP_FPS) if metrics else 0.0
+        frame_interval = 1.0 / camera_fps if camera_fps and camera_fps > 0 else None
+        last_read = None
+        fps_window_start, fps_window_frames = self.clock(), 0
+        empty_frames = 0
+        try:
+            while should_run() and cap.isOpened():
+                self.poll_config(cap)
+                timed = self.timing_enabled()
+                frame_start = self.clock() if timed else 0.0
+                success, image = cap.read()
+                if timed:
+                    self.mark("capture", frame_start)
+
+                if not success:
+                    print("Ignoring empty camera frame.")
+                    empty_frames += 1
+                    if metrics:
+                        metrics.empty_frames.inc()
+                    if empty_frames >= REOPEN_AFTER_EMPTY_FRAMES and self.camera_index is not None:
+                        cap = self.reopen_camera(cap)
+                        empty_frames = 0
+                    continue
+                empty_frames = 0
+
+                if metrics:
+                    now = self.clock()
+                    metrics.frames.inc()
+                    if frame_interval and last_read is not None and not (self.power and self.power.idle):
+                        missed = int((now - last_read) / frame_interval + 0.5) - 1
+                        if missed > 0:
+                            metrics.dropped_frames.inc(missed)
+                    last_read = now
+                    fps_window_frames += 1
+                    if now - fps_window_start >= 1.0:
+                        metrics.fps.set(fps_window_frames / (now - fps_window_start))
+                        fps_window_start, fps_window_frames = now, 0
+
+                image = self.process_frame(image)
+                if self.analytics is not None:
+                    self.analytics.frame(self.clock() - self.frame_started)
+                if self.power is not None and self.power.update(self.hands_visible):
+                    self.apply_power_state(cap)
+                    # The frame interval changed; don't count the switch as dropped frames
+                    last_read = None
+                if profiler:
+                    profiler.frame()
+                t = self.clock() if timed else 0.0
+                keep_running = self.show_preview(image)
+                if timed:
+                    self.mark("preview", t)
+                    self.mark("frame", frame_start, {'index': self.frame_index})
+                if not keep_running:
+                    break
+        finally:
+            if profiler:
+                profiler.collect()
+                profiler.stop()
+            if self.model is not None:
+                self.model.close()
+                self.model = None
+            if self.preview_open:
+                self.preview_open = False
+                cv2.destroyAllWindows()
+            if metrics:
+                metrics.fps.set(0)
+        return cap
+
+    def apply_power_state(self, cap):
+        """Switch the camera frame rate to match the power state"""
+        if self.power.idle:
+            self.active_fps = cap.get(cv2.CAP_PROP_FPS)
+            cap.set(cv2.CAP_PROP_FPS, self.power.idle_fps)
+        elif self.active_fps > 0:
+            cap.set(cv2.CAP_PROP_FPS, self.active_fps)
+        print(f"Power state: {self.power.state}")
+
+    def reopen_camera(self, cap):
+        """Release a failing camera and open it again"""
+        cap.release()
+        time.sleep(REOPEN_DELAY)
+        cap = cv2.VideoCapture(self.camera_index)
+        if self.metrics:
+            self.metrics.camera_reopens.inc()
+        if cap.isOpened():
+            self.apply_camera_mode(cap, self.settings['camera_mode'])
+        return cap
@@ -0,0 +1,140 @@
+"""
+Per-user custom gestures matched against recorded landmark templates.
+
+A pose is normalized by moving the wrist to the origin, rotating the
+wrist-to-middle-knuckle axis to point up and scaling that axis to unit
+length, so templates don't depend on where the hand is, how far it is from
+the camera or how it is tilted. All templates live in one float32 matrix
+with precomputed squared norms; matching a frame is a single matrix-vector
+product and an argmin.
+"""
+
+import numpy as np
+
+LANDMARK_COUNT = 21
+WRIST, MIDDLE_MCP = 0, 9
+VECTOR_SIZE = LANDMARK_COUNT * 2
+
+# RMS landmark distance, in palm lengths, below which a pose matches a template
+DEFAULT_MATCH_THRESHOLD = 0.12
+# Consecutive matching frames before a custom gesture is reported
+DEFAULT_CONFIRM_FRAMES = 3
+SAMPLES_PER_GESTURE = 5
+
+
+def landmark_array(hand_landmarks):
+    """Return a hand's (x, y) landmarks as a (21, 2) float32 array"""
+    return np.array([(p.x, p.y) for p in hand_landmarks.landmark], dtype=np.float32)
+
+
+def normalize_landmarks(points):
+    """Return the normalized pose vector for (21, 2+) points, or None if degenerate"""
+    points = np.asarray(points, dtype=np.float32)[:, :2]
+    points = points - points[WRIST]
+    axis = points[MIDDLE_MCP]
+    scale = float(np.hypot(axis[0], axis[1]))
+    if scale < 1e-6:
+        return None
+    ux, uy = axis / scale
+    # Rotation taking the palm axis to (0, -1), i.e. fingers up in image coordinates
+    rotation = np.array([[-uy, ux], [-ux, -uy]], dtype=np.float32)
+    return (points @ rotation.T / scale).ravel()
+
+
+class TemplateMatcher:
+    """Nearest-template classifier over normalized poses"""
+
+    def __init__(self, threshold=DEFAULT_MATCH_THRESHOLD, confirm_frames=DEFAULT_CONFIRM_FRAMES):
+        """Initialize an empty matcher"""
+        self.threshold = threshold
+        self.confirm_frames = confirm_frames
+        self.gestures = {}
+        self.actions = {}
+        self.names = []
+        self.matrix = np.empty((0, VECTOR_SIZE), dtype=np.float32)
+        self.sq_norms = np.empty(0, dtype=np.float32)
+        self.owners = np.empty(0, dtype=np.intp)
+        self.candidate = None
+        self.streak = 0
+
+    def __len__(self):
+        """Return the number of templates"""
+        return len(self.owners)
+
+    def add(self, name, samples, action=None):
+        """Store normalized samples for a gesture, replacing any with the same name"""
+        vectors = [np.asarray(s, dtype=np.float32) for s in samples if s is not None]
+        if not vectors:
+            raise ValueError("A custom gesture needs at least one sample")
+        self.gestures[name] = np.stack(vectors)
+        self.actions[name] = action
+        self.rebuild()
+
+    def remove(self, name):
+        """Forget a gesture"""
+        self.gestures.pop(name, None)
+        self.actions.pop(name, None)
+        self.rebuild()
+
+    def rebuild(self):
+        """Restack the template matrix after gestures changed"""
+        self.names = list(self.gestures)
+        if self.names:
+            self.matrix = np.concatenate([self.gestures[n] for n in self.names])
+            self.owners = np.concatenate([np.full(len(self.gestures[n]), i, dtype=np.intp)
+                                          for i, n in enumerate(self.names)])
+        else:
+            self.matrix = np.empty((0, VECTOR_SIZE), dtype=np.float32)
+            self.owners = np.empty(0, dtype=np.intp)
+        self.sq_norms = np.einsum('ij,ij->i', self.matrix, self.matrix)
+        self.reset()
+
+    def reset(self):
+        """Forget the gesture being confirmed, e.g. when the hand changes"""
+        self.candidate = None
+        self.streak = 0
+
+    def nearest(self, vector):
+        """Return (gesture name, RMS distance) of the closest template"""
+        distances = self.sq_norms - 2.0 * (self.matrix @ vector) + float(vector @ vector)
+        index = int(distances.argmin())
+        rms = float(np.sqrt(max(float(distances[index]), 0.0) / LANDMARK_COUNT))
+        return self.names[self.owners[index]], rms
+
+    def match(self, hand_landmarks):
+        """Return the gesture a single frame matches, or None"""
+        if not len(self.owners) or hand_landmarks is None:
+            return None
+        vector = normalize_landmarks(landmark_array(hand_landmarks))
+        if vector is None:
+            return None
+        name, rms = self.nearest(vector)
+        return name if rms <= self.threshold else None
+
+    def update(self, hand_landmarks):
+        """Return the gesture confirmed over the last confirm_frames frames, or None"""
+        name = self.match(hand_landmarks)
+        if name is not None and name == self.candidate:
+            self.streak += 1
+        else:
+            self.candidate = name
+            self.streak = 1
+        return name if name is not None and self.streak >= self.confirm_frames else None
+
+    def to_profile(self):
+        """Return the templates in their stored JSON form"""
+        return [{'name': name, 'action': self.actions[name],
+                 'samples': [[round(float(v), 4) for v in sample] for sample in samples]}
+                for name, samples in self.gestures.items()]
+
+    @classmethod
+    def from_profile(cls, data, **kwargs):
+        """Build a matcher from stored templates, skipping malformed entries"""
+        matcher = cls(**kwargs)
+        for entry in data or []:
+            try:
+                samples = [s for s in entry['samples'] if len(s) == VECTOR_SIZE]
+                matcher.add(str(entry['name']), samples, entry.get('action'))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return matcher
@@ -0,0 +1,85 @@
+"""
+Dwell clicking: click when the cursor rests in place.
+
+DwellClicker is fed one cursor position per frame. It keeps the positions
+from the last ``delay`` seconds in a rolling window together with monotonic
+min/max queues for each axis, so the window's bounding box is available in
+amortized O(1) per frame without rescanning history.
+"""
+
+import time
+from collections import deque
+from operator import gt, lt
+
+# Pixels the cursor may wander while still counting as resting
+DEFAULT_DWELL_RADIUS = 12
+
+
+class DwellClicker:
+    """Fires one click when the cursor stays within radius for delay seconds.
+
+    The cursor has to leave the radius before another click can fire, so
+    resting in place clicks exactly once.
+    """
+
+    def __init__(self, delay=1.0, radius=DEFAULT_DWELL_RADIUS, clock=time.monotonic):
+        """Initialize an empty window"""
+        self.delay = delay
+        self.radius = radius
+        self.clock = clock
+        self.reset()
+
+    def reset(self):
+        """Forget all positions, e.g. when the hand is lost"""
+        self.samples = deque()
+        self.min_x, self.max_x = deque(), deque()
+        self.min_y, self.max_y = deque(), deque()
+        self.seq = 0
+        self.fired = False
+
+    def push_extreme(self, queue, value, seq, keep):
+        """Append to a monotonic queue, dropping entries for which keep(entry, value) fails"""
+        while queue and not keep(queue[-1][0], value):
+            queue.pop()
+        queue.append((value, seq))
+
+    def drop_oldest(self):
+        """Remove the oldest sample from the window and the extreme queues"""
+        _, _, _, seq = self.samples.popleft()
+        for queue in (self.min_x, self.max_x, self.min_y, self.max_y):
+            if queue and queue[0][1] == seq:
+                queue.popleft()
+
+    def spread(self):
+        """Return the larger side of the window's bounding box"""
+        return max(self.max_x[0][0] - self.min_x[0][0], self.max_y[0][0] - self.min_y[0][0])
+
+    def update(self, x, y, now=None):
+        """Add a cursor position; return True if a click should fire now"""
+        if now is None:
+            now = self.clock()
+        seq = self.seq
+        self.seq += 1
+        self.samples.append((now, x, y, seq))
+        self.push_extreme(self.min_x, x, seq, lt)
+        self.push_extreme(self.max_x, x, seq, gt)
+        self.push_extreme(self.min_y, y, seq, lt)
+        self.push_extreme(self.max_y, y, seq, gt)
+
+        # The cursor moved: shrink the window until it fits the radius again
+        moved = False
+        while self.spread() > 2 * self.radius:
+            self.drop_oldest()
+            moved = True
+        if moved:
+            self.fired = False
+
+        # Keep one sample at or before the start of the dwell period
+        cutoff = now - self.delay
+        while len(self.samples) > 1 and self.samples[1][0] <= cutoff:
+            self.drop_oldest()
+
+        if not self.fired and now - self.samples[0][0] >= self.delay:
+            self.fired = True
+            return True
+        return False
@@ -0,0 +1,174 @@
+"""
+Gesture Mode profiles for the dashboard's Gesture Mode setting.
+
+Basic is the classic mapping: V gesture moves the cursor, the fist drags,
+middle/index fingers click, two closed fingers double-click, the minor hand
+pinches to scroll and the major hand pinches for brightness and volume.
+Advanced adds browser back/forward on the minor hand. Gaming drops the
+system-control pinch and lets clicks repeat without returning to the V
+gesture in between. CUSTOM_ACTIONS are what a user's recorded custom
+gestures can trigger.
+"""
+
+from ai_virtual_mouse import Gest, HLabel, Controller
+from gesture_dispatch import Binding
+from screen_mapping import CursorMapper
+from scroll_engine import ScrollEngine
+
+HANDS = (HLabel.MAJOR, HLabel.MINOR)
+# Shared like Controller's class state; the pipeline configures them
+CURSOR = CursorMapper()
+SCROLLER = ScrollEngine()
+# Imported on first use: pyautogui loads Tk through pymsgbox, which headless
+# runs avoid. The simulation harness swaps in its own sink here.
+pyautogui = None
+
+
+def pointer():
+    """Return the module that performs input, importing pyautogui on first use"""
+    global pyautogui
+    if pyautogui is None:
+        import pyautogui as module
+        pyautogui = module
+    return pyautogui
+
+
+def move_cursor(hand_result):
+    """Move the cursor to the hand's smoothed position"""
+    x, y = CURSOR.position(hand_result)
+    pointer().moveTo(x, y, duration=0.1)
+
+
+def arm_click(hand_result):
+    """Allow the next click gesture to fire"""
+    Controller.flag = True
+    CURSOR.sync()
+
+
+def grab(hand_result):
+    """Press the left button for dragging"""
+    Controller.grabflag = True
+    CURSOR.sync()
+    pointer().mouseDown(button="left")
+
+
+def release_grab():
+    """Release the left button after dragging"""
+    Controller.grabflag = False
+    pointer().mouseUp(button="left")
+
+
+def armed(action):
+    """Wrap a click so it only fires once per return to the V gesture"""
+    def fire(hand_result):
+        if Controller.flag:
+            Controller.flag = False
+            action(hand_result)
+    return fire
+
+
+def left_click(hand_result):
+    """Click the left button"""
+    pointer().click()
+
+
+def right_click(hand_result):
+    """Click the right button"""
+    pointer().click(button='right')
+
+
+def double_click(hand_result):
+    """Double-click the left button"""
+    pointer().doubleClick()
+
+
+def middle_click(hand_result):
+    """Click the middle button"""
+    pointer().click(button='middle')
+
+
+def browser_back(hand_result):
+    """Go back in the browser"""
+    pointer().hotkey('alt', 'left')
+
+
+def browser_forward(hand_result):
+    """Go forward in the browser"""
+    pointer().hotkey('alt', 'right')
+
+
+def start_pinch(hand_result):
+    """Take the pinch's starting point as the reference for pinch control"""
+    Controller.pinch_control_init(hand_result)
+
+
+def start_scroll(hand_result):
+    """Take the pinch's starting point as the scroll origin"""
+    Controller.pinch_control_init(hand_result)
+    if SCROLLER.enabled:
+        SCROLLER.start(hand_result)
+
+
+def scroll(hand_result):
+    """Scroll by the pinch offset, with Controller's stepped scrolling in the Classic mode"""
+    if SCROLLER.enabled:
+        SCROLLER.update(hand_result)
+    else:
+        Controller.pinch_control(hand_result, Controller.scrollHorizontal, Controller.scrollVertical)
+
+
+def stop_scroll():
+    """End the pinch; the pipeline's ticks let an inertial scroll coast"""
+    SCROLLER.release()
+
+
+def system_controls(hand_result):
+    """Change brightness and volume by the pinch offset"""
+    Controller.pinch_control(hand_result, Controller.changesystembrightness, Controller.changesystemvolume)
+
+
+MOVE = Binding(start=arm_click, update=move_cursor, stat='v_gest_count')
+DRAG = Binding(start=grab, update=move_cursor, stop=release_grab, stat='fist_count')
+SCROLL = Binding(start=start_scroll, update=scroll, stop=stop_scroll, stat='scroll_count')
+SYSTEM = Binding(start=start_pinch, update=system_controls, stat='pinch_count')
+
+BASIC = {
+    (Gest.V_GEST, None): MOVE,
+    (Gest.FIST, None): DRAG,
+    (Gest.MID, None): Binding(start=armed(left_click), stat='click_count'),
+    (Gest.INDEX, None): Binding(start=armed(right_click), stat='right_click_count'),
+    (Gest.TWO_FINGER_CLOSED, None): Binding(start=armed(double_click), stat='double_click_count'),
+    (Gest.PINCH_MINOR, None): SCROLL,
+    (Gest.PINCH_MAJOR, None): SYSTEM,
+}
+
+ADVANCED = dict(BASIC)
+ADVANCED.update({
+    (Gest.INDEX, HLabel.MINOR): Binding(start=armed(browser_back)),
+    (Gest.MID, HLabel.MINOR): Binding(start=armed(browser_forward)),
+    (Gest.TWO_FINGER_CLOSED, HLabel.MINOR): Binding(start=armed(middle_click), stat='click_count'),
+})
+
+GAMING = {key: binding for key, binding in BASIC.items() if binding is not SYSTEM}
+GAMING.update({
+    (Gest.MID, None): Binding(start=left_click, stat='click_count'),
+    (Gest.INDEX, None): Binding(start=right_click, stat='right_click_count'),
+})
+
+# Actions a user can attach to a custom gesture
+CUSTOM_ACTIONS = {
+    "Left Click": Binding(start=left_click, stat='click_count'),
+    "Right Click": Binding(start=right_click, stat='right_click_count'),
+    "Double Click": Binding(start=double_click, stat='double_click_count'),
+    "Middle Click": Binding(start=middle_click, stat='click_count'),
+    "Browser Back": Binding(start=browser_back),
+    "Browser Forward": Binding(start=browser_forward),
+    "Drag": DRAG,
+}
+
+# The first mode is the fallback for unknown names
+GESTURE_MODES = {
+    "Basic": BASIC,
+    "Advanced": ADVANCED,
+    "Gaming": GAMING,
+}
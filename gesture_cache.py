@@ -0,0 +1,160 @@
+"""
+Memoized gesture classification for hands that hold their pose.
+
+CachedHandRecog is a HandRecog that keeps the finger state and landmark
+distances of the last pose it classified. The pose is the wrist-relative
+position of the landmarks HandRecog compares, so a hand that moves without
+changing shape, as when steering the cursor, still counts as the same
+pose. While every one of those landmarks stays within ``tolerance`` of the
+reference, set_finger_state and the distance helpers return the memoized
+values; the first frame that moves further invalidates the cache. A fixed
+reference (rather than a hash of rounded coordinates) keeps landmark jitter
+from straddling rounding boundaries and bounds the error by the tolerance.
+get_gesture's confirmation counting still runs on every frame, so
+gestures are confirmed on the same frames as without the cache.
+"""
+
+import time
+from operator import sub
+
+from ai_virtual_mouse import HandRecog
+
+# Landmarks HandRecog reads: thumb tip and each finger's knuckle and tip
+CLASSIFIED_POINTS = (4, 5, 8, 9, 12, 13, 16, 17, 20)
+WRIST = 0
+# Fingertips whose depth difference separates MID from TWO_FINGER_CLOSED
+DEPTH_PAIR = (8, 12)
+# Normalised units a landmark may drift from the reference pose
+DEFAULT_TOLERANCE = 0.008
+
+
+def pose_vector(landmark):
+    """Return the wrist-relative coordinates the stillness check compares"""
+    wrist = landmark[WRIST]
+    wx, wy = wrist.x, wrist.y
+    points = [landmark[index] for index in CLASSIFIED_POINTS]
+    vector = [point.x - wx for point in points]
+    vector += [point.y - wy for point in points]
+    vector.append(landmark[DEPTH_PAIR[0]].z - landmark[DEPTH_PAIR[1]].z)
+    return vector
+
+
+class GestureCacheStats:
+    """Hit rate and CPU time of cached classifications, shared by both hands"""
+
+    def __init__(self):
+        """Initialize empty counters"""
+        self.hits = 0
+        self.misses = 0
+        self.hit_seconds = 0.0
+        self.miss_seconds = 0.0
+
+    def record(self, hit, seconds):
+        """Count one classification and the time it took"""
+        if hit:
+            self.hits += 1
+            self.hit_seconds += seconds
+        else:
+            self.misses += 1
+            self.miss_seconds += seconds
+
+    @property
+    def frames(self):
+        """Classifications counted so far"""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self):
+        """Fraction of classifications answered from the cache"""
+        return self.hits / self.frames if self.frames else 0.0
+
+    @property
+    def saved_seconds(self):
+        """CPU time saved, estimated from the mean cost of hits and misses; negative if a net cost"""
+        if not self.hits or not self.misses:
+            return 0.0
+        return self.hits * (self.miss_seconds / self.misses - self.hit_seconds / self.hits)
+
+    def report(self):
+        """Render the statistics as text"""
+        return (f"Gesture cache: reused {self.hits}/{self.frames} classifications "
+                f"({self.hit_rate:.0%}), saved ~{self.saved_seconds * 1000:.1f} ms of CPU")
+
+
+class CachedHandRecog(HandRecog):
+    """HandRecog that reuses its finger state and distances while the hand holds its pose"""
+
+    def __init__(self, hand_label, tolerance=DEFAULT_TOLERANCE, stats=None, clock=time.perf_counter):
+        """Initialize with an empty cache; stats may be shared between hands"""
+        super().__init__(hand_label)
+        self.tolerance = tolerance
+        self.stats = GestureCacheStats() if stats is None else stats
+        self.clock = clock
+        self.reference = None
+        self.cached_finger = None
+        self.distances = {}
+        self.hit = False
+        self.started = None
+
+    def invalidate(self):
+        """Drop the memoized pose, e.g. on significant motion"""
+        self.reference = None
+        self.cached_finger = None
+        if self.distances:
+            self.distances = {}
+        self.hit = False
+
+    def holds_pose(self, vector):
+        """Return True if every coordinate of vector is within tolerance of the reference"""
+        return max(map(abs, map(sub, vector, self.reference))) <= self.tolerance
+
+    def update_hand_result(self, hand_result):
+        """Take a new frame's landmarks, invalidating the cache if the pose changed"""
+        super().update_hand_result(hand_result)
+        if hand_result is None:
+            self.invalidate()
+            self.started = None
+            return
+        self.started = self.clock()
+        vector = pose_vector(hand_result.landmark)
+        self.hit = self.reference is not None and self.holds_pose(vector)
+        if not self.hit:
+            self.invalidate()
+            self.reference = vector
+
+    def set_finger_state(self):
+        """Compute the finger bits, or reuse them for a held pose"""
+        if self.hit and self.cached_finger is not None:
+            self.finger = self.cached_finger
+            return
+        super().set_finger_state()
+        if self.hand_result is not None:
+            self.cached_finger = self.finger
+
+    def get_dist(self, point):
+        """Distance between two landmarks, memoized from the first frame that holds the pose"""
+        if not self.hit:
+            return super().get_dist(point)
+        key = ('dist', point[0], point[1])
+        value = self.distances.get(key)
+        if value is None:
+            value = self.distances[key] = super().get_dist(point)
+        return value
+
+    def get_dz(self, point):
+        """Depth difference between two landmarks, memoized like get_dist"""
+        if not self.hit:
+            return super().get_dz(point)
+        key = ('dz', point[0], point[1])
+        value = self.distances.get(key)
+        if value is None:
+            value = self.distances[key] = super().get_dz(point)
+        return value
+
+    def get_gesture(self):
+        """Return the confirmed gesture, counting the frame's cost in the stats"""
+        gesture = super().get_gesture()
+        if self.started is not None:
+            self.stats.record(self.hit, self.clock() - self.started)
+            self.started = None
+        return gesture
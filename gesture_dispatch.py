@@ -0,0 +1,98 @@
+"""
+Table-driven gesture dispatch.
+
+A Gesture Mode is a dict mapping (gesture, hand label) to a Binding; a hand
+label of None applies the binding to every hand unless a hand-specific entry
+overrides it. Modes are compiled once into flat dicts, so dispatching a
+hand's gesture is a single dict lookup and switching modes swaps one
+reference. Adding a gesture means adding a table entry.
+"""
+
+from collections import namedtuple
+
+# start(hand_result) runs when a hand enters the gesture, update(hand_result)
+# on every frame it is held and stop() when it ends; stat names the
+# dashboard counter bumped each time the gesture starts
+Binding = namedtuple('Binding', 'start update stop stat', defaults=(None, None, None, None))
+
+
+def compile_table(entries, hands):
+    """Flatten {(gesture, hand or None): Binding} into {(gesture, hand): Binding}"""
+    table = {}
+    for (gesture, hand), binding in entries.items():
+        if hand is None:
+            for label in hands:
+                table[(gesture, label)] = binding
+    for (gesture, hand), binding in entries.items():
+        if hand is not None:
+            table[(gesture, hand)] = binding
+    return table
+
+
+class GestureDispatcher:
+    """Runs the bindings of the active Gesture Mode for each hand"""
+
+    def __init__(self, modes, hands, mode=None, on_action=None):
+        """Compile modes; on_action(stat) is called whenever a counted gesture starts"""
+        self.modes = modes
+        self.hands = hands
+        self.custom = {}
+        self.tables = {name: compile_table(entries, hands) for name, entries in modes.items()}
+        self.default_mode = next(iter(modes))
+        self.on_action = on_action
+        self.active = {}
+        self.mode = None
+        self.table = {}
+        self.set_mode(mode)
+
+    def set_mode(self, mode):
+        """Switch Gesture Mode, ending held gestures; unknown modes use the default"""
+        if mode not in self.tables:
+            mode = self.default_mode
+        if mode == self.mode:
+            return
+        self.release()
+        self.mode = mode
+        self.table = self.tables[mode]
+
+    def set_custom(self, entries):
+        """Add user-defined bindings on top of every mode, replacing earlier ones"""
+        self.release()
+        self.custom = entries
+        self.tables = {name: compile_table({**mode_entries, **entries}, self.hands)
+                       for name, mode_entries in self.modes.items()}
+        self.table = self.tables[self.mode]
+
+    def dispatch(self, gesture, hand, hand_result):
+        """Act on one hand's gesture for this frame"""
+        previous = self.active.get(hand)
+        if previous is None or previous[0] != gesture:
+            if previous is not None and previous[1].stop:
+                previous[1].stop()
+            binding = self.table.get((gesture, hand))
+            if binding is None:
+                self.active.pop(hand, None)
+                return
+            self.active[hand] = (gesture, binding)
+            if binding.stat and self.on_action:
+                self.on_action(binding.stat)
+            if binding.start:
+                binding.start(hand_result)
+        else:
+            binding = previous[1]
+        if binding.update:
+            binding.update(hand_result)
+
+    def retain(self, hands):
+        """End the held gestures of hands that are no longer in view"""
+        for label in list(self.active):
+            if label not in hands:
+                self.release(label)
+
+    def release(self, hand=None):
+        """End the held gesture of one hand, or of every hand"""
+        hands = list(self.active) if hand is None else [hand]
+        for label in hands:
+            active = self.active.pop(label, None)
+            if active is not None and active[1].stop:
+                active[1].stop()
@@ -0,0 +1,206 @@
+"""
+Labeled hand-landmark sequences for testing and benchmarking gesture recognition.
+
+Sequences are lists of 21-point MediaPipe hand landmark frames (normalised
+x, y, z) labeled with the ``Gest`` member name HandRecog should confirm.
+The synthetic corpus is generated deterministically from a seed, and
+recorded corpora can be stored as JSON lines with save_corpus().
+"""
+
+import json
+import math
+import random
+from collections import namedtuple
+
+Landmark = namedtuple('Landmark', 'x y z')
+
+NOMINAL_FPS = 30
+
+# (mcp, pip, dip, tip) landmark indices per finger
+FINGERS = {
+    'index': (5, 6, 7, 8),
+    'middle': (9, 10, 11, 12),
+    'ring': (13, 14, 15, 16),
+    'pinky': (17, 18, 19, 20),
+}
+THUMB = (1, 2, 3, 4)
+
+# Fingers extended for each finger-state gesture; the thumb is listed
+# separately because HandRecog ignores it for the finger bits
+POSES = {
+    'FIST': (),
+    'PINKY': ('pinky',),
+    'RING': ('ring',),
+    'MID': ('index', 'middle'),
+    'LAST3': ('middle', 'ring', 'pinky'),
+    'INDEX': ('index',),
+    'FIRST2': ('index', 'middle'),
+    'LAST4': ('index', 'middle', 'ring', 'pinky'),
+    'THUMB': (),
+    'V_GEST': ('index', 'middle'),
+    'TWO_FINGER_CLOSED': ('index', 'middle'),
+    'PINCH_MAJOR': ('middle', 'ring', 'pinky'),
+    'PINCH_MINOR': ('middle', 'ring', 'pinky'),
+}
+
+# PALM is what HandRecog reports when no hand is present
+GESTURE_LABELS = sorted(POSES) + ['PALM']
+
+# FIRST2 is a finger state that get_gesture always refines into V_GEST,
+# TWO_FINGER_CLOSED or MID, so it is checked against set_finger_state
+FINGER_STATE_LABELS = ('FIRST2',)
+
+# HandRecog ignores the thumb, so a thumbs-up is confirmed as FIST; only
+# the custom gesture matcher tells THUMB apart
+EXPECTED_GESTURES = {'THUMB': 'FIST'}
+
+
+class LandmarkList:
+    """Minimal stand-in for MediaPipe's NormalizedLandmarkList"""
+
+    __slots__ = ('landmark',)
+
+    def __init__(self, points):
+        """Wrap a sequence of (x, y, z) points"""
+        self.landmark = [Landmark(*p) for p in points]
+
+    def points(self):
+        """Return the landmarks as a list of [x, y, z]"""
+        return [[p.x, p.y, p.z] for p in self.landmark]
+
+
+class Sequence:
+    """A labeled sequence of landmark frames; a None frame means no hand"""
+
+    def __init__(self, label, frames, hand='major', fps=NOMINAL_FPS):
+        """Initialize the sequence"""
+        self.label = label
+        self.frames = frames
+        self.hand = hand
+        self.fps = fps
+
+    def hand_results(self):
+        """Return the frames as LandmarkList objects for HandRecog"""
+        return [None if frame is None else LandmarkList(frame) for frame in self.frames]
+
+
+def base_pose(label):
+    """Build the canonical 21-point pose for a gesture label in a unit hand frame.
+
+    Coordinates are relative to the wrist with y pointing down the image,
+    roughly matching a right hand seen by a mirrored webcam.
+    """
+    points = [[0.0, 0.0, 0.0] for _ in range(21)]
+    extended = POSES[label]
+    spread = {'index': -0.09, 'middle': -0.03, 'ring': 0.03, 'pinky': 0.085}
+
+    for name, (mcp, pip, dip, tip) in FINGERS.items():
+        x = spread[name]
+        points[mcp] = [x, -0.20, 0.0]
+        if name in extended:
+            lean = 0.0
+            if label == 'V_GEST':
+                lean = {'index': -0.06, 'middle': 0.06}[name]
+            points[pip] = [x + lean * 0.4, -0.29, 0.0]
+            points[dip] = [x + lean * 0.7, -0.34, 0.0]
+            points[tip] = [x + lean, -0.39, 0.0]
+        else:
+            points[pip] = [x, -0.25, -0.02]
+            points[dip] = [x, -0.20, -0.04]
+            points[tip] = [x, -0.16, -0.03]
+
+    if label in ('TWO_FINGER_CLOSED', 'MID'):
+        # Tips pressed together; MID lifts the middle finger off the index
+        points[8] = [-0.065, -0.39, 0.0]
+        points[12] = [-0.055, -0.39, 0.15 if label == 'MID' else 0.0]
+
+    thumb_up = label == 'THUMB'
+    points[THUMB[0]] = [-0.05, -0.05, 0.0]
+    points[THUMB[1]] = [-0.10, -0.10, 0.0]
+    points[THUMB[2]] = [-0.14, -0.16 if thumb_up else -0.14, 0.0]
+    points[THUMB[3]] = [-0.15 if thumb_up else -0.19, -0.24 if thumb_up else -0.16, 0.0]
+
+    if label in ('PINCH_MAJOR', 'PINCH_MINOR'):
+        points[8] = [-0.12, -0.17, -0.02]
+        points[THUMB[3]] = [-0.125, -0.175, -0.02]
+    return points
+
+
+def place_pose(points, cx, cy, scale, angle):
+    """Scale, rotate and translate a wrist-relative pose into image coordinates"""
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    placed = []
+    for x, y, z in points:
+        placed.append([cx + scale * (x * cos_a - y * sin_a),
+                       cy + scale * (x * sin_a + y * cos_a),
+                       scale * z])
+    return placed
+
+
+def synthetic_sequence(label, rng, frames=12, jitter=0.002):
+    """Generate one jittered, slowly drifting sequence for label"""
+    hand = 'minor' if label == 'PINCH_MINOR' else 'major'
+    if label == 'PALM':
+        return Sequence(label, [None] * frames, hand)
+
+    pose = base_pose(label)
+    cx, cy = rng.uniform(0.35, 0.65), rng.uniform(0.65, 0.8)
+    scale = rng.uniform(0.85, 1.15)
+    angle = rng.uniform(-0.15, 0.15)
+    drift_x, drift_y = rng.uniform(-0.002, 0.002), rng.uniform(-0.002, 0.002)
+
+    sequence = []
+    for i in range(frames):
+        frame = place_pose(pose, cx + drift_x * i, cy + drift_y * i, scale, angle)
+        sequence.append([[round(x + rng.gauss(0, jitter), 5),
+                          round(y + rng.gauss(0, jitter), 5),
+                          round(z, 5)] for x, y, z in frame])
+    return Sequence(label, sequence, hand)
+
+
+def trajectory(label, frames, start, end=None, hand=None, scale=1.0, angle=0.0):
+    """A noise-free sequence moving the pose's wrist linearly from start to end.
+
+    start and end are (x, y) image positions; the last frame lands on end.
+    """
+    if hand is None:
+        hand = 'minor' if label == 'PINCH_MINOR' else 'major'
+    if label == 'PALM':
+        return Sequence(label, [None] * frames, hand)
+    end = end or start
+    pose = base_pose(label)
+    sequence = []
+    for i in range(frames):
+        f = i / (frames - 1) if frames > 1 else 1.0
+        cx = start[0] + (end[0] - start[0]) * f
+        cy = start[1] + (end[1] - start[1]) * f
+        sequence.append(place_pose(pose, cx, cy, scale, angle))
+    return Sequence(label, sequence, hand)
+
+
+def synthetic_corpus(seed=0, per_label=4, frames=12, labels=GESTURE_LABELS):
+    """Generate a deterministic corpus covering every gesture label"""
+    rng = random.Random(seed)
+    return [synthetic_sequence(label, rng, frames) for label in labels for _ in range(per_label)]
+
+
+def save_corpus(path, sequences):
+    """Write sequences to a JSON lines file"""
+    with open(path, 'w') as f:
+        for seq in sequences:
+            f.write(json.dumps({'label': seq.label, 'hand': seq.hand,
+                                'fps': seq.fps, 'frames': seq.frames}) + "\n")
+
+
+def load_corpus(path=None):
+    """Load a JSON lines corpus, or the synthetic corpus when path is None"""
+    if path is None:
+        return synthetic_corpus()
+    sequences = []
+    with open(path, 'r') as f:
+        for line in f:
+            if line.strip():
+                data = json.loads(line)
+                sequences.append(Sequence(data['label'], data['frames'],
+                                          data.get('hand', 'major'), data.get('fps', NOMINAL_FPS)))
+    return sequences
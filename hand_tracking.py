@@ -0,0 +1,141 @@
+"""
+Frame-to-frame hand identity tracking.
+
+MediaPipe reports a handedness label per hand per frame, and the label
+occasionally flips for a frame or two. HandTracker instead keeps a track per
+physical hand: detections are associated with the nearest track by palm
+centroid (wrist plus the four knuckles), and each track's handedness is a
+clamped vote over the labels it has received, so one flipped frame cannot
+move a hand between the major and minor slots.
+"""
+
+import itertools
+
+PALM_POINTS = (0, 5, 9, 13, 17)
+# Normalized image distance a palm may move between frames and keep its track
+DEFAULT_MAX_JUMP = 0.25
+# Frames a track survives without a detection
+DEFAULT_MAX_MISSED = 5
+# Votes saturate here; a label needs this many contrary frames to flip back
+VOTE_LIMIT = 6
+
+RIGHT, LEFT = 'Right', 'Left'
+
+
+def palm_centroid(hand_landmarks):
+    """Return the mean (x, y) of the wrist and knuckles"""
+    landmark = hand_landmarks.landmark
+    x = sum(landmark[i].x for i in PALM_POINTS) / len(PALM_POINTS)
+    y = sum(landmark[i].y for i in PALM_POINTS) / len(PALM_POINTS)
+    return x, y
+
+
+class HandTrack:
+    """One physical hand followed across frames"""
+
+    __slots__ = ('id', 'centroid', 'votes', 'missed', 'landmarks')
+
+    def __init__(self, track_id, centroid, label):
+        """Start a track from its first detection"""
+        self.id = track_id
+        self.centroid = centroid
+        self.votes = 0
+        self.missed = 0
+        self.landmarks = None
+        self.vote(label)
+
+    def vote(self, label):
+        """Count a handedness label; positive votes mean right"""
+        if label == RIGHT:
+            self.votes = min(self.votes + 1, VOTE_LIMIT)
+        elif label == LEFT:
+            self.votes = max(self.votes - 1, -VOTE_LIMIT)
+
+    @property
+    def label(self):
+        """Return the voted handedness"""
+        return RIGHT if self.votes >= 0 else LEFT
+
+
+class HandTracker:
+    """Associates detected hands with persistent tracks and picks major/minor"""
+
+    def __init__(self, max_jump=DEFAULT_MAX_JUMP, max_missed=DEFAULT_MAX_MISSED):
+        """Initialize with no tracks"""
+        self.max_jump = max_jump
+        self.max_missed = max_missed
+        self.tracks = []
+        self.ids = itertools.count(1)
+        self.major = None
+        self.minor = None
+
+    def associate(self, detections):
+        """Match (centroid, landmarks, label) detections to tracks, greedily by distance"""
+        limit = self.max_jump * self.max_jump
+        pairs = []
+        for d, (centroid, _, _) in enumerate(detections):
+            for track in self.tracks:
+                dx = centroid[0] - track.centroid[0]
+                dy = centroid[1] - track.centroid[1]
+                distance = dx * dx + dy * dy
+                if distance <= limit:
+                    pairs.append((distance, d, track))
+        pairs.sort(key=lambda pair: pair[0])
+
+        matched, used = {}, set()
+        for _, d, track in pairs:
+            if d not in matched and track.id not in used:
+                matched[d] = track
+                used.add(track.id)
+        return matched
+
+    def update(self, hand_landmarks, labels, dominant=RIGHT):
+        """Track this frame's hands; return (major landmarks, minor landmarks)"""
+        detections = [(palm_centroid(hand), hand, label) for hand, label in zip(hand_landmarks, labels)]
+        matched = self.associate(detections) if self.tracks else {}
+
+        seen = []
+        for d, (centroid, hand, label) in enumerate(detections):
+            track = matched.get(d)
+            if track is None:
+                track = HandTrack(next(self.ids), centroid, label)
+                self.tracks.append(track)
+            else:
+                track.centroid = centroid
+                track.vote(label)
+            track.missed = 0
+            track.landmarks = hand
+            seen.append(track)
+
+        for track in self.tracks:
+            if track not in seen:
+                track.missed += 1
+                track.landmarks = None
+        self.tracks = [t for t in self.tracks if t.missed <= self.max_missed]
+        self.assign(seen, dominant)
+        return (self.major.landmarks if self.major else None,
+                self.minor.landmarks if self.minor else None)
+
+    def assign(self, visible, dominant):
+        """Choose the major and minor tracks among the visible ones"""
+        sign = 1 if dominant == RIGHT else -1
+        ranked = sorted(visible, key=lambda track: (-sign * track.votes, track.id))
+        major = minor = None
+        if len(ranked) >= 2:
+            major, minor = ranked[0], ranked[1]
+        elif ranked:
+            if ranked[0].label == dominant:
+                major = ranked[0]
+            else:
+                minor = ranked[0]
+        self.major, self.minor = major, minor
+
+    @property
+    def major_id(self):
+        """Return the id of the track in the major slot, or None"""
+        return self.major.id if self.major else None
+
+    def reset(self):
+        """Forget all tracks"""
+        self.tracks = []
+        self.major = self.minor = None
@@ -0,0 +1,108 @@
+import os
+from collections import OrderedDict
+
+import cv2
+from PIL import Image, ImageTk
+
+# Square thumbnail sizes the UI displays; generated once at capture time
+PROFILE_THUMBNAIL_SIZE = 100
+THUMBNAIL_SIZES = (PROFILE_THUMBNAIL_SIZE,)
+
+
+def thumbnail_path(image_path, size):
+    """Return the thumbnail path for an image at the given size"""
+    base, ext = os.path.splitext(image_path)
+    return f"{base}_{size}x{size}{ext or '.jpg'}"
+
+
+def write_thumbnails(frame, image_path, sizes=THUMBNAIL_SIZES):
+    """Write downscaled copies of a BGR frame next to image_path"""
+    for size in sizes:
+        thumb = cv2.resize(frame, (size, size), interpolation=cv2.INTER_AREA)
+        cv2.imwrite(thumbnail_path(image_path, size), thumb)
+
+
+def save_user_image(frame, image_path, sizes=THUMBNAIL_SIZES):
+    """Save a captured BGR frame and its thumbnails"""
+    cv2.imwrite(image_path, frame)
+    write_thumbnails(frame, image_path, sizes)
+
+
+class PhotoImageCache:
+    """Bounded LRU cache of decoded PhotoImages keyed by path, mtime, file size and display size"""
+
+    def __init__(self, max_entries=16):
+        """Initialize an empty cache"""
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, image_path, size=PROFILE_THUMBNAIL_SIZE):
+        """Return the cache key for image_path at size, or None if the image is missing"""
+        thumb_path = thumbnail_path(image_path, size)
+        source_path = thumb_path if os.path.exists(thumb_path) else image_path
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+        # The file size catches rewrites within the filesystem's mtime granularity
+        return (source_path, stat.st_mtime, stat.st_size, size)
+
+    def get(self, image_path, size=PROFILE_THUMBNAIL_SIZE):
+        """Return a PhotoImage of image_path at size x size, or None if missing"""
+        key = self.key(image_path, size)
+        if key is None:
+            return None
+        photo = self.cached(key)
+        if photo is None:
+            photo = self.store(key, self.load(image_path, key[0], size))
+        return photo
+
+    def cached(self, key):
+        """Return the PhotoImage stored under key, counting a hit or a miss"""
+        photo = self.entries.get(key)
+        if photo is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+        return photo
+
+    def decode(self, image_path, size=PROFILE_THUMBNAIL_SIZE):
+        """Return (key, PIL image) for image_path, or None if missing.
+
+        This is the slow half of get() and touches neither Tk nor the cache,
+        so it can run on a worker thread; store() finishes on the Tk thread.
+        """
+        key = self.key(image_path, size)
+        if key is None:
+            return None
+        image = self.load(image_path, key[0], size)
+        image.load()
+        return key, image
+
+    def store(self, key, image):
+        """Wrap a decoded image in a PhotoImage, cache it and return it"""
+        photo = ImageTk.PhotoImage(image)
+        self.entries[key] = photo
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return photo
+
+    def load(self, image_path, source_path, size):
+        """Decode an image, generating the thumbnail for legacy full-size captures"""
+        image = Image.open(source_path)
+        if image.size != (size, size):
+            image = image.resize((size, size))
+            if source_path == image_path:
+                try:
+                    image.convert("RGB").save(thumbnail_path(image_path, size))
+                except OSError:
+                    pass
+        return image
+
+    def clear(self):
+        """Drop all cached images"""
+        self.entries.clear()
@@ -0,0 +1,58 @@
+"""
+Notebook tabs that are built the first time they are shown.
+
+LazyNotebook wraps a ttk.Notebook. Each tab is added with a builder that
+fills its frame; the builder runs when <<NotebookTabChanged>> first selects
+the tab, or when build() asks for it, and the content is kept for later
+selections. Tabs that are never opened are never built, so logging in only
+pays for the tab on screen.
+"""
+
+import time
+
+TAB_CHANGED = "<<NotebookTabChanged>>"
+
+
+class LazyNotebook:
+    """Runs each tab's builder on its first selection"""
+
+    def __init__(self, notebook, tracer=None, track=None, on_built=None, clock=time.perf_counter):
+        """Wrap notebook; on_built(name, seconds) is called after each tab is built"""
+        self.notebook = notebook
+        self.tracer = tracer
+        self.track = track
+        self.on_built = on_built
+        self.clock = clock
+        # Frame path -> (frame, builder, tab text) of tabs not built yet
+        self.pending = {}
+        self.build_seconds = {}
+        notebook.bind(TAB_CHANGED, self.on_tab_changed, add="+")
+
+    def add(self, frame, builder, **options):
+        """Add frame as a tab whose content builder(frame) creates on first selection"""
+        self.notebook.add(frame, **options)
+        self.pending[str(frame)] = (frame, builder, options.get('text', str(frame)))
+
+    def on_tab_changed(self, event=None):
+        """Build the newly selected tab if needed"""
+        self.build(self.notebook.select())
+
+    def build(self, tab):
+        """Build a tab's content unless it already exists; returns True if the builder ran"""
+        entry = self.pending.pop(str(tab), None)
+        if entry is None:
+            return False
+        frame, builder, name = entry
+        start = self.clock()
+        builder(frame)
+        end = self.clock()
+        self.build_seconds[name] = end - start
+        if self.tracer is not None and self.tracer.enabled:
+            self.tracer.complete(f"build {name} tab", start, self.track, end)
+        if self.on_built:
+            self.on_built(name, end - start)
+        return True
+
+    def built(self, tab):
+        """Return True if tab's content exists"""
+        return str(tab) not in self.pending
@@ -0,0 +1,236 @@
+"""
+Prometheus metrics for fleet monitoring.
+
+Metric updates are plain attribute increments so they are cheap enough for
+the frame loop. The optional HTTP server runs on its own daemon thread,
+binds to localhost only and just reads the current values when scraped.
+"""
+
+import os
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+METRICS_PORT_ENV_VAR = "VIRTUAL_MOUSE_METRICS_PORT"
+
+# Seconds; frame stages run from well under a millisecond to tens of milliseconds
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.02, 0.033, 0.05, 0.1, 0.25, 1.0)
+
+
+def format_labels(labels):
+    """Render a label dict in Prometheus syntax"""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in labels.items()) + "}"
+
+
+def format_value(value):
+    """Render a sample value"""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, float) and value == float("inf"):
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter"""
+
+    kind = "counter"
+
+    def __init__(self, name, help_text, labels=None):
+        """Initialize the counter at zero"""
+        self.name = name
+        self.help = help_text
+        self.labels = labels or {}
+        self.value = 0
+
+    def inc(self, amount=1):
+        """Increase the counter"""
+        self.value += amount
+
+    def samples(self):
+        """Return [(name, labels, value)]"""
+        return [(self.name, self.labels, self.value)]
+
+
+class Gauge:
+    """Value that can go up and down, optionally read from a callback at scrape time"""
+
+    kind = "gauge"
+
+    def __init__(self, name, help_text, labels=None, func=None):
+        """Initialize the gauge"""
+        self.name = name
+        self.help = help_text
+        self.labels = labels or {}
+        self.func = func
+        self.value = 0
+
+    def set(self, value):
+        """Set the gauge"""
+        self.value = value
+
+    def samples(self):
+        """Return [(name, labels, value)]"""
+        value = self.func() if self.func else self.value
+        return [(self.name, self.labels, value)]
+
+
+class Histogram:
+    """Fixed-bucket histogram; observe() is a bisect and two increments"""
+
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labels=None, buckets=LATENCY_BUCKETS):
+        """Initialize an empty histogram"""
+        self.name = name
+        self.help = help_text
+        self.labels = labels or {}
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value):
+        """Record one observation"""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def samples(self):
+        """Return cumulative bucket, sum and count samples"""
+        samples = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            labels = dict(self.labels, le=format_value(float(bound)))
+            samples.append((self.name + "_bucket", labels, cumulative))
+        samples.append((self.name + "_sum", self.labels, self.sum))
+        samples.append((self.name + "_count", self.labels, cumulative))
+        return samples
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together in text exposition format"""
+
+    def __init__(self):
+        """Initialize an empty registry"""
+        self.metrics = []
+        self.lock = threading.Lock()
+
+    def register(self, metric):
+        """Add a metric and return it"""
+        with self.lock:
+            self.metrics.append(metric)
+        return metric
+
+    def counter(self, name, help_text, labels=None):
+        """Create and register a Counter"""
+        return self.register(Counter(name, help_text, labels))
+
+    def gauge(self, name, help_text, labels=None, func=None):
+        """Create and register a Gauge"""
+        return self.register(Gauge(name, help_text, labels, func))
+
+    def histogram(self, name, help_text, labels=None, buckets=LATENCY_BUCKETS):
+        """Create and register a Histogram"""
+        return self.register(Histogram(name, help_text, labels, buckets))
+
+    def render(self):
+        """Return all metrics in Prometheus text format"""
+        with self.lock:
+            metrics = list(self.metrics)
+        lines = []
+        described = set()
+        for metric in metrics:
+            if metric.name not in described:
+                described.add(metric.name)
+                lines.append(f"# HELP {metric.name} {metric.help}")
+                lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{format_labels(labels)} {format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class PipelineMetrics:
+    """Metrics updated by the controller pipeline"""
+
+    STAGES = ("capture", "preprocess", "hands.process", "classify", "handle_controls",
+              "draw_landmarks", "preview", "frame")
+
+    def __init__(self, registry):
+        """Register the pipeline metrics in registry"""
+        self.frames = registry.counter("virtual_mouse_frames_total", "Camera frames read")
+        self.empty_frames = registry.counter("virtual_mouse_empty_frames_total",
+                                             "Camera reads that returned no frame")
+        self.dropped_frames = registry.counter("virtual_mouse_dropped_frames_total",
+                                               "Camera frames missed because the loop fell behind (estimated)")
+        self.skipped_frames = registry.counter("virtual_mouse_skipped_frames_total",
+                                               "Frames processed without hand inference")
+        self.gated_frames = registry.counter("virtual_mouse_gated_frames_total",
+                                             "Frames the presence gate kept from hand inference")
+        self.camera_reopens = registry.counter("virtual_mouse_camera_reopens_total",
+                                               "Times the camera was reopened after failing")
+        self.fps = registry.gauge("virtual_mouse_fps", "Frames processed per second over the last second")
+        self.stage_latency = {
+            stage: registry.histogram("virtual_mouse_stage_latency_seconds",
+                                      "Time spent in each pipeline stage", {'stage': stage})
+            for stage in self.STAGES
+        }
+
+    def observe_stage(self, stage, seconds):
+        """Record a stage latency"""
+        histogram = self.stage_latency.get(stage)
+        if histogram is not None:
+            histogram.observe(seconds)
+
+
+class MetricsServer:
+    """Serves a registry at http://127.0.0.1:<port>/metrics from a daemon thread"""
+
+    def __init__(self, registry, port, host="127.0.0.1"):
+        """Bind the server; call start() to begin serving"""
+        self.registry = registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(handler):
+                if handler.path.split("?")[0] not in ("/metrics", "/"):
+                    handler.send_error(404)
+                    return
+                body = registry.render().encode()
+                handler.send_response(200)
+                handler.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                handler.send_header("Content-Length", str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+
+            def log_message(handler, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def port(self):
+        """Return the bound port"""
+        return self.httpd.server_address[1]
+
+    def start(self):
+        """Start serving in the background"""
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="metrics-server", daemon=True)
+        self.thread.start()
+        return self
+
+    def close(self):
+        """Stop serving and release the socket"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def metrics_port_from_env():
+    """Return the metrics port requested through the environment, or None"""
+    try:
+        port = int(os.environ.get(METRICS_PORT_ENV_VAR, ""))
+    except ValueError:
+        return None
+    return port if port > 0 else None
@@ -0,0 +1,85 @@
+"""
+Landmark overlay for the preview window.
+
+OverlayRenderer draws hands from (21, 2) arrays of normalised landmarks
+rather than MediaPipe protobufs: every connection of every hand goes to a
+single cv2.polylines call and every joint is stamped with one NumPy
+assignment of a precomputed disk, so the cost barely depends on how many
+hands are drawn. The pipeline draws it only on frames that are actually
+shown, after scaling them down to the preview width.
+"""
+
+import cv2
+import numpy as np
+
+# MediaPipe Hands' HAND_CONNECTIONS, kept here so drawing needs no MediaPipe import
+HAND_CONNECTIONS = (
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),
+)
+CONNECTION_INDEX = np.array(HAND_CONNECTIONS, dtype=np.intp)
+
+# BGR colours matching MediaPipe's default drawing specs
+JOINT_COLOR = (0, 0, 255)
+LINE_COLOR = (224, 224, 224)
+TEXT_COLOR = (255, 255, 255)
+TEXT_SHADOW = (0, 0, 0)
+
+
+def disk_offsets(radius):
+    """Return the (dy, dx) offsets of the pixels within radius of a point"""
+    span = np.arange(-radius, radius + 1)
+    dy, dx = np.meshgrid(span, span, indexing='ij')
+    inside = dy * dy + dx * dx <= radius * radius
+    return np.stack([dy[inside], dx[inside]], axis=1)
+
+
+class OverlayRenderer:
+    """Draws hand skeletons and a status line onto BGR frames"""
+
+    def __init__(self, joint_radius=3, line_thickness=2, joint_color=JOINT_COLOR,
+                 line_color=LINE_COLOR, text_scale=0.6):
+        """Initialize the drawing style"""
+        self.offsets = disk_offsets(joint_radius)
+        self.line_thickness = line_thickness
+        self.joint_color = np.array(joint_color, dtype=np.uint8)
+        self.line_color = line_color
+        self.text_scale = text_scale
+
+    def draw(self, image, hands, text=None):
+        """Draw the (21, 2) normalised landmark arrays in hands, and text, onto image in place"""
+        if len(hands):
+            height, width = image.shape[:2]
+            points = (np.asarray(hands, dtype=np.float32).reshape(-1, 21, 2)
+                      * (width, height)).astype(np.int32)
+            segments = points[:, CONNECTION_INDEX].reshape(-1, 2, 2)
+            cv2.polylines(image, segments, False, self.line_color, self.line_thickness)
+
+            joints = points.reshape(-1, 2)
+            ys = (joints[:, None, 1] + self.offsets[:, 0]).ravel()
+            xs = (joints[:, None, 0] + self.offsets[:, 1]).ravel()
+            visible = (ys >= 0) & (ys < height) & (xs >= 0) & (xs < width)
+            image[ys[visible], xs[visible]] = self.joint_color
+        if text:
+            self.draw_text(image, text)
+        return image
+
+    def draw_text(self, image, text):
+        """Draw a status line in the top-left corner"""
+        origin = (10, int(30 * self.text_scale / 0.6))
+        # Anti-aliased text costs more than the whole skeleton
+        cv2.putText(image, text, origin, cv2.FONT_HERSHEY_SIMPLEX, self.text_scale, TEXT_SHADOW, 3)
+        cv2.putText(image, text, origin, cv2.FONT_HERSHEY_SIMPLEX, self.text_scale, TEXT_COLOR, 1)
+
+
+def status_text(gesture_name, fps):
+    """Return the overlay's status line"""
+    parts = []
+    if gesture_name:
+        parts.append(gesture_name)
+    if fps:
+        parts.append(f"{fps:.0f} fps")
+    return " | ".join(parts)
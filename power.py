@@ -0,0 +1,98 @@
+"""
+Idle power-saving policy for the controller.
+
+After ``idle_after`` seconds without a detected hand the controller drops to
+the IDLE state: the camera runs at a lower frame rate, hand inference runs on
+every ``idle_stride``-th frame and the preview stops repainting. The first
+detected hand switches straight back to ACTIVE, so the resume time is bounded
+by how often inference runs while idle.
+"""
+
+import time
+
+ACTIVE = "active"
+IDLE = "idle"
+
+DEFAULT_IDLE_AFTER = 30.0
+IDLE_CAMERA_FPS = 10
+IDLE_INFERENCE_STRIDE = 2
+
+
+def format_duration(seconds):
+    """Render seconds as 1h 02m, 3m 05s or 12s"""
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+class PowerPolicy:
+    """Tracks hand activity and decides between the ACTIVE and IDLE states"""
+
+    def __init__(self, idle_after=DEFAULT_IDLE_AFTER, idle_fps=IDLE_CAMERA_FPS,
+                 idle_stride=IDLE_INFERENCE_STRIDE, clock=time.monotonic):
+        """Initialize in the ACTIVE state"""
+        self.idle_after = idle_after
+        self.idle_fps = idle_fps
+        self.idle_stride = idle_stride
+        self.clock = clock
+        now = clock()
+        self.state = ACTIVE
+        self.state_since = now
+        self.last_hand = now
+        self.time_in_state = {ACTIVE: 0.0, IDLE: 0.0}
+        self.transitions = []
+
+    def update(self, hand_found, now=None):
+        """Record one frame's outcome; return the new state if it changed, else None"""
+        if now is None:
+            now = self.clock()
+        if hand_found:
+            self.last_hand = now
+            if self.state == IDLE:
+                return self.enter(ACTIVE, now)
+        elif self.state == ACTIVE and now - self.last_hand >= self.idle_after:
+            return self.enter(IDLE, now)
+        return None
+
+    def enter(self, state, now):
+        """Switch to state at time now and return it"""
+        self.time_in_state[self.state] += now - self.state_since
+        self.state = state
+        self.state_since = now
+        self.transitions.append((now, state))
+        return state
+
+    @property
+    def idle(self):
+        """True while in the IDLE state"""
+        return self.state == IDLE
+
+    def inference_stride(self, stride):
+        """Return the inference stride to use given the configured one"""
+        return max(stride, self.idle_stride) if self.state == IDLE else stride
+
+    def max_resume_seconds(self, wake_frames=1):
+        """Worst-case time from a hand appearing to the ACTIVE state.
+
+        wake_frames is how many inference opportunities may pass before one
+        actually runs, e.g. PresenceGate.max_wake_frames for a hand that
+        enters without moving.
+        """
+        return self.idle_stride * wake_frames / self.idle_fps
+
+    def durations(self, now=None):
+        """Return {state: seconds} including the time in the current state"""
+        if now is None:
+            now = self.clock()
+        durations = dict(self.time_in_state)
+        durations[self.state] += now - self.state_since
+        return durations
+
+    def summary(self, now=None):
+        """Render the state and time per state for the dashboard"""
+        durations = self.durations(now)
+        return (f"{self.state.capitalize()} - active {format_duration(durations[ACTIVE])}, "
+                f"idle {format_duration(durations[IDLE])}")
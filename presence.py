@@ -0,0 +1,84 @@
+"""
+Motion/presence gate in front of hand inference.
+
+A hand cannot appear without changing the picture, so while no hand has been
+seen recently and a tiny grayscale thumbnail of the frame matches the last
+inferred one, MediaPipe can be skipped. Inference is still forced every
+``max_skip`` frames, which bounds how long a hand can go unnoticed.
+"""
+
+import cv2
+
+THUMBNAIL_SIZE = (32, 24)
+# Mean absolute difference, in gray levels, that counts as motion
+DEFAULT_MOTION_THRESHOLD = 3.0
+DEFAULT_MAX_SKIP_FRAMES = 10
+# Frames to keep inferring after the last hand was seen
+DEFAULT_HAND_GRACE_FRAMES = 30
+
+
+class PresenceGate:
+    """Decides per frame whether hand inference is worth running"""
+
+    def __init__(self, threshold=DEFAULT_MOTION_THRESHOLD, max_skip=DEFAULT_MAX_SKIP_FRAMES,
+                 hand_grace=DEFAULT_HAND_GRACE_FRAMES, size=THUMBNAIL_SIZE):
+        """Initialize an open gate"""
+        self.threshold = threshold
+        self.max_skip = max_skip
+        self.hand_grace = hand_grace
+        self.size = size
+        self.reference = None
+        self.skipped_in_row = 0
+        self.frames_since_hand = 0
+        self.frames = 0
+        self.gated = 0
+        self.inferences = 0
+        self.inference_seconds = 0.0
+
+    def thumbnail(self, image):
+        """Return a tiny grayscale copy of a BGR frame"""
+        small = cv2.resize(image, self.size, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+    def check(self, image):
+        """Return True if inference should run on this frame"""
+        self.frames += 1
+        thumb = self.thumbnail(image)
+        if (self.reference is None or self.frames_since_hand < self.hand_grace
+                or self.skipped_in_row >= self.max_skip
+                or cv2.absdiff(thumb, self.reference).mean() > self.threshold):
+            self.reference = thumb
+            self.skipped_in_row = 0
+            return True
+        self.skipped_in_row += 1
+        self.gated += 1
+        return False
+
+    def observe(self, hand_found, seconds=0.0):
+        """Record the outcome and cost of an inference the gate let through"""
+        self.frames_since_hand = 0 if hand_found else self.frames_since_hand + 1
+        self.inferences += 1
+        self.inference_seconds += seconds
+
+    @property
+    def max_wake_frames(self):
+        """Worst-case frames between a hand appearing and inference running"""
+        return self.max_skip + 1
+
+    @property
+    def gated_fraction(self):
+        """Fraction of frames on which inference was skipped"""
+        return self.gated / self.frames if self.frames else 0.0
+
+    @property
+    def saved_seconds(self):
+        """Inference time saved, estimated from the mean cost of inferences that ran"""
+        if not self.inferences:
+            return 0.0
+        return self.gated * self.inference_seconds / self.inferences
+
+    def report(self, fps=30):
+        """Render the gate's statistics as text"""
+        return (f"Presence gate: skipped {self.gated}/{self.frames} frames "
+                f"({self.gated_fraction:.0%}), saved ~{self.saved_seconds:.1f} s of inference, "
+                f"max wake-up {self.max_wake_frames / fps * 1000:.0f} ms at {fps} fps")
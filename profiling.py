@@ -0,0 +1,136 @@
+"""
+Memory profiling mode for long-running controller sessions.
+
+MemoryProfiler is ticked once per processed frame. Every ``interval`` frames
+it takes a tracemalloc snapshot, diffs it against the previous one to get
+bytes and blocks allocated per frame by call site, and samples the process
+RSS so growth can be tracked over hours.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+PROFILE_ENV_VAR = "VIRTUAL_MOUSE_PROFILE_MEMORY"
+
+
+def current_rss():
+    """Return the resident set size of this process in bytes, or None"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm", 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:
+        return None
+
+
+def profiling_requested():
+    """Return True if memory profiling was enabled through the environment"""
+    return os.environ.get(PROFILE_ENV_VAR, "") not in ("", "0")
+
+
+class MemoryProfiler:
+    """Periodic tracemalloc snapshots and RSS samples, ticked per frame"""
+
+    def __init__(self, interval=300, top=10, traceback_depth=1, clock=time.monotonic,
+                 name="controller", log=None):
+        """Initialize the profiler; log(report) is called after each snapshot"""
+        self.interval = interval
+        self.top = top
+        self.traceback_depth = traceback_depth
+        self.clock = clock
+        self.name = name
+        self.log = log
+        self.frames = 0
+        self.frames_at_snapshot = 0
+        self.snapshot = None
+        self.started_tracing = False
+        self.rss_samples = []
+        self.traced_samples = []
+        self.top_sites = []
+
+    def start(self):
+        """Start tracing allocations and take the baseline snapshot"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.traceback_depth)
+            self.started_tracing = True
+        self.snapshot = self.take_snapshot()
+        self.frames_at_snapshot = self.frames
+        self.sample(self.snapshot)
+
+    def stop(self):
+        """Stop tracing if this profiler started it"""
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+    def take_snapshot(self):
+        """Take a snapshot that ignores tracemalloc's own bookkeeping"""
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+
+    def sample(self, snapshot):
+        """Record the current RSS and the memory traced by snapshot.
+
+        The total comes from the filtered snapshot rather than
+        get_traced_memory(), which would also count the profiler's own
+        snapshots.
+        """
+        now = self.clock()
+        self.rss_samples.append((now, current_rss()))
+        traced = sum(stat.size for stat in snapshot.statistics('filename'))
+        self.traced_samples.append((now, traced))
+
+    def frame(self):
+        """Count a processed frame and snapshot every interval frames"""
+        self.frames += 1
+        if self.snapshot is not None and self.frames - self.frames_at_snapshot >= self.interval:
+            self.collect()
+
+    def collect(self):
+        """Diff against the previous snapshot and record per-frame allocation by call site"""
+        snapshot = self.take_snapshot()
+        frames = max(1, self.frames - self.frames_at_snapshot)
+        stats = snapshot.compare_to(self.snapshot, 'traceback' if self.traceback_depth > 1 else 'lineno')
+        self.top_sites = [(str(stat.traceback), stat.size_diff / frames, stat.count_diff / frames, stat.size)
+                          for stat in stats[:self.top]]
+        self.snapshot = snapshot
+        self.frames_at_snapshot = self.frames
+        self.sample(snapshot)
+        if self.log:
+            self.log(self.report())
+
+    def growth(self, since=0):
+        """Return (rss growth, traced growth) in bytes since the given sample"""
+        rss = [r for _, r in self.rss_samples[since:] if r is not None]
+        traced = [t for _, t in self.traced_samples[since:]]
+        return ((rss[-1] - rss[0]) if len(rss) > 1 else 0,
+                (traced[-1] - traced[0]) if len(traced) > 1 else 0)
+
+    def report(self):
+        """Render the latest findings as text"""
+        rss_growth, traced_growth = self.growth()
+        lines = [f"[{self.name}] {self.frames} frames, RSS growth {rss_growth / 1024:.0f} KiB, "
+                 f"traced growth {traced_growth / 1024:.0f} KiB"]
+        if self.rss_samples and self.rss_samples[-1][1] is not None:
+            lines.append(f"  RSS now {self.rss_samples[-1][1] / 1048576:.1f} MiB "
+                         f"over {len(self.rss_samples)} samples")
+        for site, bytes_per_frame, blocks_per_frame, size in self.top_sites:
+            lines.append(f"  {bytes_per_frame:+9.1f} B/frame {blocks_per_frame:+7.2f} blocks/frame "
+                         f"(live {size / 1024:.0f} KiB)  {site}")
+        return "\n".join(lines)
@@ -0,0 +1,239 @@
+"""
+Replay sources that stand in for the camera and the Hands graph.
+
+ReplayCapture follows the cv2.VideoCapture interface and ReplayHands follows
+the Hands.process() interface, both driven by recorded landmark sequences,
+so the controller pipeline can run deterministically without a webcam or
+MediaPipe inference. HandsRecorder captures what a live Hands graph saw
+into a ``.landmarks.npz`` recording that load_recording turns back into
+replayable results; batch_process timelines load the same way.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from gesture_fixtures import LandmarkList
+
+Classification = namedtuple('Classification', 'label score index')
+Handedness = namedtuple('Handedness', 'classification')
+HandResults = namedtuple('HandResults', 'multi_hand_landmarks multi_handedness')
+
+NO_HANDS = HandResults(None, None)
+HAND_LABELS = {'major': 'Right', 'minor': 'Left'}
+
+RECORDING_SUFFIX = ".landmarks.npz"
+MAX_HANDS = 2
+# Handedness column codes; -1 marks an empty hand slot
+HANDEDNESS_CODES = {'Left': 0, 'Right': 1, None: 2}
+HANDEDNESS_LABELS = {code: label for label, code in HANDEDNESS_CODES.items()}
+
+
+def results_from_frames(frames):
+    """Build per-frame HandResults from [(hand, points) ...] lists"""
+    results = []
+    for hands in frames:
+        if not hands:
+            results.append(NO_HANDS)
+            continue
+        landmarks, handedness = [], []
+        for index, (hand, points) in enumerate(hands):
+            landmarks.append(LandmarkList(points))
+            handedness.append(Handedness([Classification(HAND_LABELS.get(hand, hand), 1.0, index)]))
+        results.append(HandResults(landmarks, handedness))
+    return results
+
+
+def results_from_sequences(sequences):
+    """Flatten labeled single-hand sequences into per-frame HandResults"""
+    return results_from_frames([[] if frame is None else [(seq.hand, frame)]
+                                for seq in sequences for frame in seq.frames])
+
+
+class ReplayCapture:
+    """cv2.VideoCapture look-alike producing blank frames for a fixed frame count"""
+
+    def __init__(self, frame_count, width=640, height=480, loop=False):
+        """Initialize a capture of frame_count frames, endless if loop is set"""
+        self.frame_count = frame_count
+        self.width = width
+        self.height = height
+        self.loop = loop
+        self.position = 0
+        self.opened = True
+
+    def isOpened(self):
+        """Return True until every frame has been read"""
+        return self.opened
+
+    def read(self):
+        """Return the next frame as (success, image)"""
+        if not self.opened:
+            return False, None
+        self.position += 1
+        if self.position >= self.frame_count and not self.loop:
+            self.opened = False
+        return True, np.zeros((self.height, self.width, 3), dtype=np.uint8)
+
+    def set(self, prop, value):
+        """Accept capture property changes; replay frames keep their size"""
+        return False
+
+    def get(self, prop):
+        """Return 0 for unsupported properties"""
+        return 0.0
+
+    def release(self):
+        """Close the capture"""
+        self.opened = False
+
+
+class FiniteCapture:
+    """Wraps a cv2.VideoCapture of a video file so it reports closed once the file ends"""
+
+    def __init__(self, cap):
+        """Wrap an opened capture"""
+        self.cap = cap
+        self.opened = cap.isOpened()
+
+    def isOpened(self):
+        """Return True until a read fails"""
+        return self.opened
+
+    def read(self):
+        """Return the next frame as (success, image)"""
+        success, image = self.cap.read()
+        if not success:
+            self.opened = False
+        return success, image
+
+    def set(self, prop, value):
+        """Forward property changes"""
+        return self.cap.set(prop, value)
+
+    def get(self, prop):
+        """Forward property reads"""
+        return self.cap.get(prop)
+
+    def release(self):
+        """Release the wrapped capture"""
+        self.opened = False
+        self.cap.release()
+
+
+class ReplayHands:
+    """Hands.process() look-alike returning recorded results in order"""
+
+    def __init__(self, results, loop=True):
+        """Initialize with a list of HandResults"""
+        self.results = results
+        self.loop = loop
+        self.position = 0
+
+    def process(self, image):
+        """Return the next recorded result, ignoring the image"""
+        if self.position >= len(self.results):
+            if not self.loop or not self.results:
+                return NO_HANDS
+            self.position = 0
+        result = self.results[self.position]
+        self.position += 1
+        return result
+
+    def close(self):
+        """Nothing to release"""
+
+
+def replay_hands_factory(results, loop=True):
+    """Return a hands factory for ControllerPipeline that replays results.
+
+    Rebuilt graphs continue from where the previous one stopped, as a real
+    rebuild would keep seeing the live camera.
+    """
+    shared = ReplayHands(results, loop)
+
+    def factory(settings):
+        return shared
+    return factory
+
+
+class HandsRecorder:
+    """Keeps the landmarks every Hands graph built through factory() returns"""
+
+    def __init__(self):
+        """Start an empty recording"""
+        self.landmarks = []
+        self.handedness = []
+
+    def factory(self, hands_factory):
+        """Return a hands factory whose graphs record into this recorder"""
+        def build(settings):
+            return RecordingHands(hands_factory(settings), self)
+        return build
+
+    def record(self, results):
+        """Append one frame's results"""
+        row = np.zeros((MAX_HANDS, 21, 3), dtype=np.float32)
+        codes = [-1] * MAX_HANDS
+        hands = (results.multi_hand_landmarks or [])[:MAX_HANDS]
+        for index, hand in enumerate(hands):
+            row[index] = [(p.x, p.y, p.z) for p in hand.landmark]
+            try:
+                label = results.multi_handedness[index].classification[0].label
+            except (AttributeError, IndexError, TypeError):
+                label = None
+            codes[index] = HANDEDNESS_CODES.get(label, HANDEDNESS_CODES[None])
+        self.landmarks.append(row)
+        self.handedness.append(codes)
+
+    def __len__(self):
+        """Return the number of recorded frames"""
+        return len(self.landmarks)
+
+    def save(self, path, meta=None):
+        """Write the recording atomically"""
+        from batch_process import write_timeline
+
+        frames = len(self.landmarks)
+        columns = {
+            'frame': np.arange(frames, dtype=np.int32),
+            'handedness': np.array(self.handedness, dtype=np.int8).reshape(frames, MAX_HANDS),
+            'landmarks': (np.stack(self.landmarks) if frames
+                          else np.zeros((0, MAX_HANDS, 21, 3), dtype=np.float32)),
+        }
+        write_timeline(path, columns, dict(meta or {}, frames=frames))
+
+
+class RecordingHands:
+    """Hands.process() wrapper that passes every result to a HandsRecorder"""
+
+    def __init__(self, hands, recorder):
+        """Wrap a Hands graph"""
+        self.hands = hands
+        self.recorder = recorder
+
+    def process(self, image):
+        """Run the wrapped graph and record its result"""
+        results = self.hands.process(image)
+        self.recorder.record(results)
+        return results
+
+    def close(self):
+        """Close the wrapped graph"""
+        self.hands.close()
+
+
+def load_recording(path):
+    """Return per-frame HandResults from a landmark recording or a batch_process timeline"""
+    with np.load(path) as data:
+        landmarks = data['landmarks'].astype(np.float32)
+        if 'handedness' in data.files:
+            handedness = data['handedness']
+        else:
+            # Timelines store classified major/minor slots
+            present = data['present'].astype(bool)
+            handedness = np.where(present, [HANDEDNESS_CODES['Right'], HANDEDNESS_CODES['Left']], -1)
+
+    return results_from_frames([[(HANDEDNESS_LABELS[int(code)], row[index].tolist())
+                                 for index, code in enumerate(codes) if code >= 0]
+                                for row, codes in zip(landmarks, handedness)])
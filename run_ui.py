@@ -1,23 +1,260 @@
 #!/usr/bin/env python3
 """
-Launcher script for the AI Virtual Mouse UI
+Launcher script for the AI Virtual Mouse UI.
+
+    python run_ui.py                              # dashboard with login
+    python run_ui.py --autostart --profile dana   # start the controller after login
+    python run_ui.py --headless --source 1        # controller only, no Tk
+    python run_ui.py --headless --record session.landmarks.npz
+    python run_ui.py --headless --replay session.landmarks.npz --dry-run --frames 300
+    python run_ui.py --headless --tracker Stub --dry-run --frames 300
+    python run_ui.py --benchmark                  # run the benchmark suite
+
+Headless runs never import Tk, stop cleanly on SIGTERM, Ctrl+C, ESC in the
+preview, --frames or --duration, and every mode exits non-zero on failure.
 """
 
-import sys
+import argparse
+import importlib
+import json
 import os
-import tkinter as tk
+import signal
+import sys
+import time
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-def main():
-    """Main entry point"""
+EXIT_OK = 0
+EXIT_FAILURE = 1
+EXIT_USAGE = 2
+EXIT_INTERRUPTED = 130
+
+# Benchmarks run by --benchmark without names; 'auth' needs a display
+BENCHMARKS = {
+    'gestures': "benchmarks.gesture_benchmark",
+    'custom-gestures': "benchmarks.custom_gesture_benchmark",
+    'overlay': "benchmarks.overlay_benchmark",
+    'trackers': "benchmarks.tracker_benchmark",
+    'hand-tracking': "benchmarks.hand_tracking_benchmark",
+    'scroll': "benchmarks.scroll_benchmark",
+    'auth': "benchmarks.auth_responsiveness",
+}
+DEFAULT_BENCHMARKS = ('gestures', 'custom-gestures', 'overlay', 'trackers', 'hand-tracking', 'scroll')
+# trackers.BUILDERS; Stub is offered here but not in the dashboard
+TRACKER_CHOICES = ("Solutions", "Tasks", "Stub")
+
+
+class UsageError(Exception):
+    """A command-line option that cannot be honoured"""
+
+
+def parse_source(source):
+    """Return a camera index for numeric sources, else the source unchanged"""
+    try:
+        return int(source)
+    except (TypeError, ValueError):
+        return source
+
+
+def load_profile(name):
+    """Return the settings of a named profile: a settings JSON file or a user's saved settings"""
+    from autotune import machine_settings
+    from settings_profile import migrate_settings
+
+    if os.path.isfile(name):
+        try:
+            with open(name, 'r') as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            raise UsageError(f"Cannot read settings profile {name}: {e}")
+        return migrate_settings(stored, machine_settings())
+
+    from user_store import AuthenticationManager
+    auth_manager = AuthenticationManager()
+    if not auth_manager.user_exists(name):
+        raise UsageError(f"No settings file or user named {name!r}")
+    return auth_manager.get_user_settings(name, machine_settings())
+
+
+def run_benchmarks(names, log=print):
+    """Run the named benchmarks (default suite if empty); returns an exit code"""
+    failed = []
+    for name in names or DEFAULT_BENCHMARKS:
+        log(f"== {name} ==")
+        try:
+            code = importlib.import_module(BENCHMARKS[name]).main([])
+        except Exception as e:
+            log(f"{name} failed: {e}")
+            code = EXIT_FAILURE
+        if code:
+            failed.append(name)
+    if failed:
+        log(f"Failed benchmarks: {', '.join(failed)}")
+        return EXIT_FAILURE
+    return EXIT_OK
+
+
+def open_source(pipeline, source, replay_frames=None, blank=False):
+    """Open the frame source: a camera index, a video file or blank replay frames.
+
+    Without a source, blank=True gives endless blank frames instead of camera 0.
+    """
+    import cv2
+    from replay import FiniteCapture, ReplayCapture
+
+    if source is None and replay_frames is not None:
+        return ReplayCapture(replay_frames)
+    if source is None and blank:
+        return ReplayCapture(1, loop=True)
+    if source is None:
+        source = 0
+    if isinstance(source, int):
+        return pipeline.open_camera(source)
+    if not os.path.isfile(source):
+        raise UsageError(f"No camera index or video file {source!r}")
+    cap = cv2.VideoCapture(source)
+    if not cap.isOpened():
+        raise RuntimeError(f"Cannot open video {source}")
+    return FiniteCapture(cap)
+
+
+def run_headless(args, log=print):
+    """Run the controller without the dashboard; returns an exit code"""
+    from replay import HandsRecorder, load_recording, replay_hands_factory
+
+    settings = load_profile(args.profile) if args.profile else None
+    if settings is None:
+        from autotune import machine_settings
+        from settings_profile import default_settings
+        settings = default_settings()
+        settings.update(machine_settings())
+    if not args.preview:
+        settings['preview_rate'] = 0
+    if args.tracker:
+        settings['tracker_backend'] = args.tracker
+
+    results = None
+    if args.replay:
+        try:
+            results = load_recording(args.replay)
+        except (OSError, KeyError, ValueError) as e:
+            raise UsageError(f"Cannot load recording {args.replay}: {e}")
+
+    # Imported only now so usage errors don't wait for MediaPipe to load
+    from controller_pipeline import ControllerConfig, ControllerPipeline, build_hands
+    from trackers import STUB_BACKEND
+
+    hands_factory = build_hands
+    replay_frames = None
+    if results is not None:
+        hands_factory = replay_hands_factory(results, loop=False)
+        replay_frames = len(results)
+    recorder = None
+    if args.record:
+        recorder = HandsRecorder()
+        hands_factory = recorder.factory(hands_factory)
+
+    pipeline = ControllerPipeline(ControllerConfig(settings), hands_factory=hands_factory)
+    pipeline.drive_controls = not args.dry_run
+    # The stub tracker ignores the image, so it needs no camera
+    stub = settings['tracker_backend'] == STUB_BACKEND
+    cap = open_source(pipeline, args.source, replay_frames, blank=stub)
+
+    stop = []
+    previous_handler = signal.signal(signal.SIGTERM, lambda signum, frame: stop.append(signum))
+    deadline = time.monotonic() + args.duration if args.duration else None
+
+    def should_run():
+        if stop or (args.frames and pipeline.frame_index >= args.frames):
+            return False
+        return deadline is None or time.monotonic() < deadline
+
+    # Video files and replays end by closing; a camera closing is a failure
+    live = isinstance(args.source, int) or (args.source is None and replay_frames is None and not stub)
+    start = time.perf_counter()
     try:
-        from virtual_mouse_ui import main
-        main()
+        cap = pipeline.run(cap, should_run)
+        camera_lost = live and not cap.isOpened()
+    finally:
+        cap.release()
+        signal.signal(signal.SIGTERM, previous_handler)
+    seconds = time.perf_counter() - start
+
+    frames = pipeline.frame_index
+    log(f"Processed {frames} frames in {seconds:.1f} s "
+        f"({frames / seconds if seconds else 0.0:.1f} fps)")
+    if pipeline.presence_gate is not None:
+        log(pipeline.presence_gate.report())
+    if settings['gesture_cache']:
+        log(pipeline.gesture_cache.report())
+    if pipeline.scroller.stats.gestures:
+        log(pipeline.scroller.stats.report())
+    if recorder is not None:
+        recorder.save(args.record, {'source': str(args.source), 'settings': settings})
+        log(f"Recorded {len(recorder)} frames to {args.record}")
+    if camera_lost:
+        log("Camera closed")
+        return EXIT_FAILURE
+    return EXIT_OK
+
+
+def run_gui(args):
+    """Run the dashboard; returns an exit code"""
+    source = 0 if args.source is None else args.source
+    if not isinstance(source, int):
+        raise UsageError("The dashboard reads from a camera; use --headless for video files")
+    if args.record or args.replay or args.tracker:
+        raise UsageError("--record, --replay and --tracker need --headless")
+    settings = load_profile(args.profile) if args.profile else None
+
+    from virtual_mouse_ui import main as ui_main
+    ui_main(autostart=args.autostart, launch_settings=settings, camera_index=source)
+    return EXIT_OK
+
+
+def build_parser():
+    """Return the command-line parser"""
+    parser = argparse.ArgumentParser(description="AI Virtual Mouse")
+    parser.add_argument("--source", type=parse_source,
+                        help="camera index or video file (default: camera 0, or the replay)")
+    parser.add_argument("--headless", action="store_true", help="run the controller without the dashboard")
+    parser.add_argument("--autostart", action="store_true", help="start the controller right after login")
+    parser.add_argument("--profile", help="settings JSON file or username whose saved settings to use")
+    parser.add_argument("--record", metavar="FILE", help="save the detected landmarks (headless)")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="replay recorded landmarks or a batch timeline instead of MediaPipe (headless)")
+    parser.add_argument("--tracker", choices=TRACKER_CHOICES,
+                        help="hand tracker backend, overriding the profile; Stub plays a "
+                             "scripted hand (headless)")
+    parser.add_argument("--dry-run", action="store_true", help="don't move the cursor (headless)")
+    parser.add_argument("--preview", action="store_true", help="show the preview window (headless)")
+    parser.add_argument("--frames", type=int, help="stop after this many frames (headless)")
+    parser.add_argument("--duration", type=float, help="stop after this many seconds (headless)")
+    parser.add_argument("--benchmark", nargs="*", choices=sorted(BENCHMARKS), metavar="NAME",
+                        help=f"run benchmarks and exit: {', '.join(sorted(BENCHMARKS))} "
+                             f"(default: {', '.join(DEFAULT_BENCHMARKS)})")
+    return parser
+
+
+def main(argv=None):
+    """Main entry point; returns the process exit code"""
+    args = build_parser().parse_args(argv)
+    try:
+        if args.benchmark is not None:
+            return run_benchmarks(args.benchmark)
+        if args.headless:
+            return run_headless(args)
+        return run_gui(args)
+    except UsageError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return EXIT_USAGE
+    except KeyboardInterrupt:
+        return EXIT_INTERRUPTED
     except Exception as e:
-        print(f"Error running the UI: {e}")
-        input("Press Enter to exit...")
+        print(f"Error running the UI: {e}", file=sys.stderr)
+        return EXIT_FAILURE
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
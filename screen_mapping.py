@@ -0,0 +1,156 @@
+"""
+Camera-to-screen mapping for the cursor.
+
+ScreenMapping is built once from the virtual desktop (the bounding box of
+every monitor), the active region of the camera frame and the camera's
+aspect ratio, and maps normalised landmark coordinates to desktop pixels
+with a precomputed affine transform. CursorMapper reproduces
+Controller.get_position's accelerated relative motion on top of a mapping
+but keeps track of the cursor itself, so moving the cursor makes no
+pyautogui.size() or pyautogui.position() calls. The pipeline rebuilds the
+mapping when the settings or the display configuration change.
+"""
+
+try:
+    from screeninfo import get_monitors
+except ImportError:
+    get_monitors = None
+
+DEFAULT_CAMERA_ASPECT = 4 / 3
+# The middle finger's knuckle steers the cursor, as in Controller.get_position
+POINTER_LANDMARK = 9
+
+
+def desktop_bounds():
+    """Return the virtual desktop spanning every monitor as (left, top, width, height)"""
+    if get_monitors is not None:
+        try:
+            monitors = get_monitors()
+        except Exception:
+            monitors = []
+        if monitors:
+            left = min(m.x for m in monitors)
+            top = min(m.y for m in monitors)
+            right = max(m.x + m.width for m in monitors)
+            bottom = max(m.y + m.height for m in monitors)
+            return left, top, right - left, bottom - top
+    # gesture_actions imports this module; import it here to share its pointer
+    from gesture_actions import pointer
+    width, height = pointer().size()
+    return 0, 0, width, height
+
+
+def active_region(size=1.0, camera_aspect=DEFAULT_CAMERA_ASPECT, desktop_aspect=None):
+    """Return the centred (x0, y0, x1, y1) part of the frame that spans the desktop.
+
+    size is the fraction of the frame's width and height used. With
+    desktop_aspect, one side is trimmed so the region has the desktop's
+    shape and hand motion moves the cursor equally fast in x and y.
+    """
+    width = height = min(max(size, 0.05), 1.0)
+    if desktop_aspect:
+        ratio = width * camera_aspect / (height * desktop_aspect)
+        if ratio > 1:
+            width /= ratio
+        else:
+            height *= ratio
+    x0, y0 = (1.0 - width) / 2, (1.0 - height) / 2
+    return x0, y0, x0 + width, y0 + height
+
+
+class ScreenMapping:
+    """Affine map from normalised camera coordinates to desktop pixels"""
+
+    __slots__ = ('desktop', 'region', 'scale_x', 'scale_y', 'offset_x', 'offset_y', 'bounds')
+
+    def __init__(self, desktop, region=(0.0, 0.0, 1.0, 1.0)):
+        """Map region of the frame onto the (left, top, width, height) desktop"""
+        left, top, width, height = desktop
+        x0, y0, x1, y1 = region
+        self.desktop = tuple(desktop)
+        self.region = tuple(region)
+        self.scale_x = width / (x1 - x0)
+        self.scale_y = height / (y1 - y0)
+        self.offset_x = left - x0 * self.scale_x
+        self.offset_y = top - y0 * self.scale_y
+        self.bounds = (left, top, left + width - 1, top + height - 1)
+
+    @classmethod
+    def build(cls, desktop=None, region_size=1.0, camera_aspect=DEFAULT_CAMERA_ASPECT,
+              aspect_correction=True):
+        """Build the mapping for the current display configuration"""
+        if desktop is None:
+            desktop = desktop_bounds()
+        desktop_aspect = desktop[2] / desktop[3] if aspect_correction and desktop[3] else None
+        return cls(desktop, active_region(region_size, camera_aspect, desktop_aspect))
+
+    def map(self, x, y):
+        """Return the desktop pixel for normalised (x, y); unclamped"""
+        return x * self.scale_x + self.offset_x, y * self.scale_y + self.offset_y
+
+    def clamp(self, x, y):
+        """Return (x, y) moved onto the desktop"""
+        left, top, right, bottom = self.bounds
+        return min(max(x, left), right), min(max(y, top), bottom)
+
+
+class CursorMapper:
+    """Accelerated relative cursor motion driven by a hand's landmarks"""
+
+    def __init__(self, mapping=None, gain=1.0, pointer=None):
+        """Initialize; the mapping is built on first use when not given"""
+        self.mapping = mapping
+        self.gain = gain
+        self.pointer = pointer
+        self.prev_hand = None
+        self.cursor = None
+
+    def configure(self, mapping, gain=1.0):
+        """Switch to a new mapping, e.g. after a display change"""
+        self.mapping = mapping
+        self.gain = gain
+        self.prev_hand = None
+        self.cursor = None
+
+    def sync(self):
+        """Re-read the real cursor position on the next move, e.g. when a gesture starts"""
+        self.cursor = None
+
+    def reset(self):
+        """Forget the hand's previous position"""
+        self.prev_hand = None
+
+    def read_cursor(self):
+        """Return the pointer's position from the OS"""
+        if self.pointer is not None:
+            return self.pointer.position()
+        from gesture_actions import pointer
+        return pointer().position()
+
+    def position(self, hand_result):
+        """Return the cursor position for the hand, like Controller.get_position"""
+        if self.mapping is None:
+            self.mapping = ScreenMapping.build()
+        landmark = hand_result.landmark[POINTER_LANDMARK]
+        x, y = self.mapping.map(landmark.x, landmark.y)
+        if self.prev_hand is None:
+            self.prev_hand = x, y
+        delta_x = x - self.prev_hand[0]
+        delta_y = y - self.prev_hand[1]
+        self.prev_hand = x, y
+
+        # Ignore jitter, scale small moves with their size and cap fast ones
+        distsq = delta_x * delta_x + delta_y * delta_y
+        if distsq <= 25:
+            ratio = 0
+        elif distsq <= 900:
+            ratio = 0.07 * distsq ** 0.5
+        else:
+            ratio = 2.1
+        ratio *= self.gain
+
+        if self.cursor is None:
+            self.cursor = self.read_cursor()
+        self.cursor = self.mapping.clamp(self.cursor[0] + delta_x * ratio,
+                                         self.cursor[1] + delta_y * ratio)
+        return self.cursor
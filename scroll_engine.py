@@ -0,0 +1,209 @@
+"""
+Smooth scrolling for the minor-hand pinch.
+
+Controller.pinch_control scrolls one full wheel notch each time the pinch
+level holds still for five frames, whatever the pinch's size, and scrolls
+sideways with a shift+ctrl chord, five input calls per notch that each
+block the loop for pyautogui.PAUSE. ScrollEngine instead turns the pinch's
+displacement from where it started into a scroll velocity along its
+dominant axis, scaled by the Scroll Speed setting, and integrates it into
+fractional wheel units. The accumulated whole units go out as one scroll
+call per axis at most ``max_rate`` times a second, so a long pinch makes
+small, evenly spaced events instead of bursts; the rate bound spaces them,
+so they skip pyautogui's pause. With inertia, letting go of the pinch keeps
+the last velocity and lets it decay, like a flicked touchpad.
+
+Amounts are in Controller's wheel units, WHEEL_DELTA per notch. pyautogui
+takes wheel units only on Windows; elsewhere each scroll click is a whole
+notch, so events there carry whole notches and the remainder waits in
+pending. The bindings set the velocity; the pipeline calls tick() once per
+frame to emit.
+"""
+
+import math
+import sys
+import time
+
+# One wheel notch, as Controller.scrollVertical scrolls
+WHEEL_DELTA = 120
+# Pinch offset ignored as jitter, in normalised frame units (Controller.pinch_threshold / 10)
+DEAD_ZONE = 0.03
+# Notches per second for each normalised unit the pinch moves beyond the dead zone
+NOTCHES_PER_UNIT = 100.0
+MAX_NOTCHES_PER_SECOND = 30.0
+# Scroll events per second per axis
+DEFAULT_MAX_RATE = 20.0
+# Seconds for a released scroll's velocity to fall to 1/e, and the velocity it stops at
+INERTIA_TIME_CONSTANT = 0.3
+STOP_VELOCITY = 0.5
+# pyautogui.hscroll scrolls vertically on Windows, so the shift+ctrl chord is kept there
+NATIVE_HSCROLL = sys.platform != 'win32'
+# Wheel units per pyautogui scroll click: fine-grained on Windows, a notch elsewhere
+SCROLL_UNIT = 1 if sys.platform == 'win32' else WHEEL_DELTA
+# Index fingertip, whose offset Controller.getpinchxlv/getpinchylv measure
+PINCH_LANDMARK = 8
+HORIZONTAL, VERTICAL = 0, 1
+
+
+class ScrollStats:
+    """Scroll events sent and how long each pinch took to send its first"""
+
+    def __init__(self):
+        """Initialize empty counters"""
+        self.gestures = 0
+        self.events = 0
+        self.units = 0
+        self.latencies = []
+
+    def record_event(self, amount, latency=None):
+        """Count one scroll event; latency is set on a pinch's first event"""
+        self.events += 1
+        self.units += abs(amount)
+        if latency is not None:
+            self.latencies.append(latency)
+
+    @property
+    def mean_latency(self):
+        """Mean seconds from the start of a pinch to its first scroll event"""
+        return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+    def report(self):
+        """Render the statistics as text"""
+        return (f"Scrolling: {self.events} events over {self.gestures} pinches, "
+                f"{self.units / WHEEL_DELTA:.1f} notches, first event after "
+                f"{self.mean_latency * 1000:.0f} ms on average")
+
+
+class ScrollEngine:
+    """Velocity-based, rate-limited scrolling driven by a pinch"""
+
+    def __init__(self, speed=1.0, inertia=False, enabled=True, max_rate=DEFAULT_MAX_RATE,
+                 pointer=None, clock=time.monotonic, stats=None, unit=SCROLL_UNIT):
+        """Initialize at rest; pointer defaults to pyautogui on first use.
+
+        unit is the wheel units one of the pointer's scroll clicks moves.
+        """
+        self.speed = speed
+        self.inertia = inertia
+        self.enabled = enabled
+        self.max_rate = max_rate
+        self.pointer = pointer
+        self.unit = unit
+        self.clock = clock
+        self.stats = ScrollStats() if stats is None else stats
+        self.reset()
+
+    def configure(self, speed=1.0, inertia=False, enabled=True, clock=None):
+        """Apply the scroll settings; disabling stops any scrolling"""
+        self.speed = speed
+        self.inertia = inertia
+        if clock is not None:
+            self.clock = clock
+        if enabled != self.enabled:
+            self.enabled = enabled
+            self.reset()
+
+    def reset(self):
+        """Stop scrolling and drop unsent fractions"""
+        self.origin = None
+        self.held = False
+        self.velocity = [0.0, 0.0]
+        self.pending = [0.0, 0.0]
+        self.last_tick = None
+        self.last_event = [-math.inf, -math.inf]
+        self.started = None
+
+    @property
+    def active(self):
+        """True while a pinch is held or a released scroll is still coasting"""
+        return self.held or self.velocity[0] != 0.0 or self.velocity[1] != 0.0
+
+    def start(self, hand_result, now=None):
+        """Take the pinch's starting point as the origin, stopping any coasting"""
+        now = self.clock() if now is None else now
+        point = hand_result.landmark[PINCH_LANDMARK]
+        self.reset()
+        self.origin = point.x, point.y
+        self.held = True
+        self.last_tick = self.started = now
+        self.stats.gestures += 1
+
+    def update(self, hand_result):
+        """Set the scroll velocity from the pinch's offset"""
+        if self.origin is None:
+            self.start(hand_result)
+        point = hand_result.landmark[PINCH_LANDMARK]
+        dx = point.x - self.origin[0]
+        dy = self.origin[1] - point.y
+        axis, offset = (VERTICAL, dy) if abs(dy) > abs(dx) else (HORIZONTAL, dx)
+        excess = abs(offset) - DEAD_ZONE
+        notches = min(excess * NOTCHES_PER_UNIT, MAX_NOTCHES_PER_SECOND) if excess > 0 else 0.0
+        self.velocity[axis] = math.copysign(notches * self.speed, offset)
+        if self.velocity[1 - axis]:
+            self.velocity[1 - axis] = 0.0
+            self.pending[1 - axis] = 0.0
+
+    def release(self):
+        """End the pinch; with inertia the scroll coasts to a stop"""
+        self.held = False
+        self.origin = None
+        self.started = None
+        if not self.inertia:
+            self.velocity = [0.0, 0.0]
+            self.pending = [0.0, 0.0]
+
+    def tick(self, now=None):
+        """Advance to now, sending the whole scroll clicks accumulated on each axis"""
+        now = self.clock() if now is None else now
+        if self.last_tick is None:
+            self.last_tick = now
+            return
+        dt = now - self.last_tick
+        self.last_tick = now
+        if dt <= 0.0:
+            return
+        decay = 1.0 if self.held else math.exp(-dt / INERTIA_TIME_CONSTANT)
+        # Allow for rounding, so events land on the frame that completes the interval
+        interval = 1.0 / self.max_rate - 1e-6
+        for axis in (HORIZONTAL, VERTICAL):
+            velocity = self.velocity[axis]
+            if not velocity:
+                continue
+            if decay < 1.0:
+                # Distance covered by an exponentially decaying velocity
+                self.pending[axis] += velocity * INERTIA_TIME_CONSTANT * (1.0 - decay)
+                velocity *= decay
+                self.velocity[axis] = velocity if abs(velocity) >= STOP_VELOCITY else 0.0
+            else:
+                self.pending[axis] += velocity * dt
+            amount = int(self.pending[axis] * WHEEL_DELTA / self.unit) * self.unit
+            if amount and now - self.last_event[axis] >= interval:
+                self.pending[axis] -= amount / WHEEL_DELTA
+                self.last_event[axis] = now
+                self.emit(axis, amount, now)
+        if not self.active:
+            self.pending = [0.0, 0.0]
+
+    def emit(self, axis, amount, now):
+        """Send one scroll event of amount wheel units, a whole number of clicks"""
+        if self.pointer is None:
+            import pyautogui
+            self.pointer = pyautogui
+        pointer = self.pointer
+        clicks = amount // self.unit
+        # The rate bound spaces the events, so pyautogui.PAUSE need not block the loop
+        if axis == VERTICAL:
+            pointer.scroll(clicks, _pause=False)
+        elif NATIVE_HSCROLL:
+            pointer.hscroll(clicks, _pause=False)
+        else:
+            pointer.keyDown('shift', _pause=False)
+            pointer.keyDown('ctrl', _pause=False)
+            pointer.scroll(-clicks, _pause=False)
+            pointer.keyUp('ctrl', _pause=False)
+            pointer.keyUp('shift', _pause=False)
+        latency = None
+        if self.started is not None:
+            latency = now - self.started
+            self.started = None
+        self.stats.record_event(amount, latency)
@@ -0,0 +1,116 @@
+"""
+Versioned controller settings stored per user alongside the account data.
+Kept free of Tk so headless tools can load the same profiles.
+"""
+
+import copy
+
+SETTINGS_VERSION = 3
+
+CAMERA_MODES = ["Default", "320x240@30", "640x480@30", "1280x720@30"]
+INFERENCE_WIDTHS = [0, 640, 480, 320]  # 0 runs inference at full camera resolution
+PREVIEW_RATES = [0, 10, 15, 30]  # 0 disables the preview window
+PREVIEW_WIDTHS = [0, 640, 480, 320]  # 0 shows the preview at full camera resolution
+MODEL_COMPLEXITIES = [0, 1]  # MediaPipe Hands: 0 is the lite model
+INFERENCE_STRIDES = [1, 2, 3]  # run hand inference on every Nth frame
+IDLE_TIMEOUTS = [0, 15, 30, 60, 300]  # seconds without a hand before idling; 0 never idles
+ACTIVE_REGIONS = [100, 90, 80, 70, 60]  # percent of the camera frame that spans the desktop
+DOMINANT_HANDS = ["Right", "Left"]  # MediaPipe handedness of the hand that moves the cursor
+TRACKER_BACKENDS = ["Solutions", "Tasks"]  # see trackers.py; its Stub is for tests and --headless
+SCROLL_MODES = ["Smooth", "Inertial", "Classic"]  # see scroll_engine.py; Classic is Controller's
+
+DEFAULT_SETTINGS = {
+    'multi_hand_mode': True,
+    'hand_detection_confidence': 0.7,
+    'tracking_confidence': 0.7,
+    'show_landmarks': True,
+    'mouse_sensitivity': 1.0,
+    'active_region': 100,
+    'aspect_correction': True,
+    'scroll_speed': 1.0,
+    'scroll_mode': "Smooth",
+    'click_delay': 0.3,
+    'gesture_mode': "Basic",
+    'dominant_hand': "Right",
+    'theme_color': "Blue",
+    'autoclick_enabled': False,
+    'autoclick_delay': 1.0,
+    # Performance
+    'camera_mode': "640x480@30",
+    'inference_width': 0,
+    'preview_rate': 30,
+    'preview_width': 0,
+    'model_complexity': 1,
+    'inference_stride': 1,
+    'tracker_backend': "Solutions",
+    'presence_gate': True,
+    'gesture_cache': True,
+    'idle_timeout': 30,
+}
+
+# Keys whose stored value must be one of the listed options
+CHOICES = {
+    'tracker_backend': TRACKER_BACKENDS,
+}
+
+# Keys that depend on the machine rather than the user; see autotune.py
+PERFORMANCE_KEYS = ('camera_mode', 'inference_width', 'preview_rate',
+                    'model_complexity', 'multi_hand_mode', 'inference_stride')
+
+
+def default_settings():
+    """Return a fresh copy of the default settings"""
+    return copy.deepcopy(DEFAULT_SETTINGS)
+
+
+def migrate_settings(stored, base=None):
+    """Upgrade stored settings of any version to the current schema.
+
+    Unknown keys are dropped, missing keys take their value from base (for
+    example the machine's tuned profile) or the defaults, and values that
+    cannot be coerced to the default's type fall back as well. Versions 1
+    and 2 stored every performance key whether or not the user chose it, so
+    those come from base too; unversioned settings files keep theirs.
+    """
+    settings = default_settings()
+    if base:
+        settings.update({k: v for k, v in base.items() if k in settings})
+    if not isinstance(stored, dict):
+        return settings
+    skipped = PERFORMANCE_KEYS if stored.get('version') in (1, 2) else ()
+    for key, default in DEFAULT_SETTINGS.items():
+        if key not in stored or key in skipped:
+            continue
+        try:
+            value = type(default)(stored[key])
+        except (TypeError, ValueError):
+            continue
+        if key in CHOICES and value not in CHOICES[key]:
+            continue
+        settings[key] = value
+    return settings
+
+
+def serialize_settings(settings, base=None):
+    """Return settings in their stored form, tagged with the schema version.
+
+    Performance keys that match base (the machine's tuned values) or the
+    defaults are left out, so they follow the next calibration.
+    """
+    data = migrate_settings(settings)
+    tuned = migrate_settings(None, base)
+    for key in PERFORMANCE_KEYS:
+        if data[key] == tuned[key]:
+            del data[key]
+    data['version'] = SETTINGS_VERSION
+    return data
+
+
+def parse_camera_mode(mode):
+    """Parse 'WxH@FPS' into (width, height, fps), or None for the camera default"""
+    try:
+        size, fps = mode.split("@")
+        width, height = size.split("x")
+        return int(width), int(height), int(fps)
+    except (AttributeError, ValueError):
+        return None
@@ -0,0 +1,261 @@
+"""
+Deterministic simulation of the controller's frame-count and timing logic.
+
+Simulation pushes scripted landmark trajectories through the same path as
+the camera loop: ControllerPipeline.classify (HandRecog.update_hand_result,
+set_finger_state and get_gesture) and then the Gesture Mode bindings that
+stand in for Controller.handle_controls, including Controller's pinch
+control. There is no camera, MediaPipe graph or display. Time comes from a
+FakeClock that moves one camera frame per step, and every mouse and
+keyboard call lands in an InputSink, a pyautogui look-alike that timestamps
+it and charges its duration and pause to the clock as pyautogui would block
+the loop. Thousands of simulated frames run per second of real time.
+"""
+
+import sys
+import types
+from collections import namedtuple
+
+from ai_virtual_mouse import Controller
+import gesture_actions
+from controller_pipeline import ControllerConfig, ControllerPipeline
+from replay import replay_hands_factory, results_from_frames, results_from_sequences
+from scroll_engine import ScrollStats
+
+DEFAULT_DESKTOP = (0, 0, 1920, 1080)
+# pyautogui.PAUSE's default: every call blocks this long after acting
+PYAUTOGUI_PAUSE = 0.1
+# Controller's OS controls, recorded by the sink under these event kinds
+SYSTEM_CONTROLS = {'changesystembrightness': 'brightness', 'changesystemvolume': 'volume'}
+
+# frame is the simulation step the call happened in; time is when it began
+InputEvent = namedtuple('InputEvent', 'frame time kind args')
+
+
+class FakeClock:
+    """A clock that only moves when told to"""
+
+    def __init__(self, start=0.0):
+        """Initialize at start seconds"""
+        self.now = start
+
+    def __call__(self):
+        """Return the current time"""
+        return self.now
+
+    def advance(self, seconds):
+        """Move the clock forward and return the new time"""
+        self.now += seconds
+        return self.now
+
+    def sleep(self, seconds):
+        """time.sleep look-alike that returns at once"""
+        self.advance(max(seconds, 0.0))
+
+
+class InputSink:
+    """Records the pyautogui calls the controller makes instead of performing them"""
+
+    def __init__(self, clock, desktop=DEFAULT_DESKTOP, pause=PYAUTOGUI_PAUSE, position=None):
+        """Initialize with the cursor in the middle of the desktop"""
+        self.clock = clock
+        self.desktop = desktop
+        self.pause = pause
+        left, top, width, height = desktop
+        self.cursor = position or (left + width // 2, top + height // 2)
+        self.frame = 0
+        self.events = []
+
+    def record(self, kind, *args, duration=0.0, pause=True):
+        """Log a call and block the simulated loop for its duration plus the pause.
+
+        pause=False is pyautogui's _pause=False, which skips the pause.
+        """
+        self.events.append(InputEvent(self.frame, self.clock(), kind, args))
+        self.clock.sleep(duration + (self.pause if pause else 0.0))
+
+    def of(self, *kinds):
+        """Return the recorded events of the given kinds"""
+        return [event for event in self.events if event.kind in kinds]
+
+    def kinds(self):
+        """Return the kinds of the recorded events, in order"""
+        return [event.kind for event in self.events]
+
+    def size(self):
+        """Return the primary screen's size"""
+        return self.desktop[2], self.desktop[3]
+
+    def position(self):
+        """Return the cursor position"""
+        return self.cursor
+
+    def moveTo(self, x=None, y=None, duration=0.0, **kwargs):
+        """Move the cursor, taking duration seconds"""
+        self.cursor = (int(x), int(y))
+        self.record('move', *self.cursor, duration=duration)
+
+    def click(self, x=None, y=None, clicks=1, interval=0.0, button='left', duration=0.0, **kwargs):
+        """Click button clicks times"""
+        self.record('click', button, clicks, duration=duration + interval * (clicks - 1))
+
+    def doubleClick(self, x=None, y=None, interval=0.0, button='left', duration=0.0, **kwargs):
+        """Click button twice"""
+        self.click(x, y, 2, interval, button, duration)
+
+    def mouseDown(self, x=None, y=None, button='left', **kwargs):
+        """Press button"""
+        self.record('mouse_down', button)
+
+    def mouseUp(self, x=None, y=None, button='left', **kwargs):
+        """Release button"""
+        self.record('mouse_up', button)
+
+    def scroll(self, clicks, x=None, y=None, _pause=True, **kwargs):
+        """Scroll vertically"""
+        self.record('scroll', clicks, pause=_pause)
+
+    def hscroll(self, clicks, x=None, y=None, _pause=True, **kwargs):
+        """Scroll horizontally"""
+        self.record('hscroll', clicks, pause=_pause)
+
+    def keyDown(self, key, _pause=True, **kwargs):
+        """Press a key"""
+        self.record('key_down', key, pause=_pause)
+
+    def keyUp(self, key, _pause=True, **kwargs):
+        """Release a key"""
+        self.record('key_up', key, pause=_pause)
+
+    def press(self, keys, presses=1, interval=0.0, **kwargs):
+        """Tap one key or a list of keys"""
+        self.record('press', keys, presses, duration=interval * (presses - 1))
+
+    def hotkey(self, *keys, **kwargs):
+        """Press keys together"""
+        self.record('hotkey', *keys)
+
+    def system_control(self, kind):
+        """Return a stand-in for one of Controller's OS controls"""
+        def control():
+            self.record(kind, getattr(Controller, 'pinchlv', None))
+        return control
+
+
+def controller_state():
+    """Return Controller's class-level state, without its methods"""
+    return {name: value for name, value in vars(Controller).items()
+            if not name.startswith('__')
+            and not isinstance(value, (staticmethod, classmethod, types.FunctionType))}
+
+
+class Simulation:
+    """Runs scripted hand results through a ControllerPipeline on simulated time.
+
+    Use it as a context manager. While active, gesture_actions and
+    ai_virtual_mouse send their input to the sink, the shared cursor maps
+    onto a fixed desktop, and Controller's class state, the cursor and the
+    scroll engine are restored on exit, so runs are repeatable.
+    scroll_stats counts the scroll engine's events and latency.
+    """
+
+    def __init__(self, settings=None, fps=30, desktop=DEFAULT_DESKTOP, pause=PYAUTOGUI_PAUSE):
+        """Initialize the pipeline, clock and sink; settings override the defaults"""
+        self.clock = FakeClock()
+        self.frame_interval = 1.0 / fps
+        self.sink = InputSink(self.clock, desktop, pause)
+        self.gestures = []
+        self.scroll_stats = ScrollStats()
+        self.pipeline = ControllerPipeline(ControllerConfig(settings),
+                                           on_gesture=self.record_gesture,
+                                           hands_factory=replay_hands_factory([], loop=False))
+        self.pipeline.clock = self.clock
+        self.pipeline.desktop = desktop
+        self.patched = []
+        self.saved_state = None
+        self.saved_cursor = None
+        self.saved_scroller = None
+
+    def record_gesture(self, gesture):
+        """Log a confirmed gesture change with its frame and time"""
+        self.gestures.append((self.pipeline.frame_index, self.clock(), gesture))
+
+    def __enter__(self):
+        """Route input to the sink"""
+        self.saved_state = controller_state()
+        cursor = self.pipeline.cursor
+        self.saved_cursor = dict(vars(cursor))
+        cursor.configure(None)
+        cursor.pointer = self.sink
+        scroller = self.pipeline.scroller
+        self.saved_scroller = dict(vars(scroller))
+        scroller.reset()
+        scroller.pointer = self.sink
+        # The sink counts wheel units, as pyautogui does on Windows and Controller assumes
+        scroller.unit = 1
+        scroller.stats = self.scroll_stats
+
+        modules = [gesture_actions, sys.modules.get(Controller.__module__)]
+        for module in modules:
+            if module is not None and hasattr(module, 'pyautogui'):
+                self.patched.append((module, 'pyautogui', module.pyautogui))
+                module.pyautogui = self.sink
+        for name, kind in SYSTEM_CONTROLS.items():
+            if name in vars(Controller):
+                self.patched.append((Controller, name, vars(Controller)[name]))
+                setattr(Controller, name, staticmethod(self.sink.system_control(kind)))
+        return self
+
+    def __exit__(self, *exc):
+        """Release held gestures into the sink, then undo every patch"""
+        try:
+            self.pipeline.reset_gestures()
+        finally:
+            while self.patched:
+                owner, name, value = self.patched.pop()
+                setattr(owner, name, value)
+            for name in set(controller_state()) - set(self.saved_state):
+                delattr(Controller, name)
+            for name, value in self.saved_state.items():
+                setattr(Controller, name, value)
+            vars(self.pipeline.cursor).update(self.saved_cursor)
+            vars(self.pipeline.scroller).update(self.saved_scroller)
+        return False
+
+    def step(self, results):
+        """Run one camera frame of Hands results, then wait for the next frame.
+
+        Input calls block the loop as pyautogui does; a frame that overruns
+        its interval is followed at once by the next, as with a buffered
+        camera.
+        """
+        pipeline = self.pipeline
+        start = self.clock()
+        pipeline.poll_config()
+        pipeline.frame_index += 1
+        self.sink.frame = pipeline.frame_index
+        pipeline.frame_started = start
+        pipeline.hands_visible = bool(results.multi_hand_landmarks)
+        pipeline.apply_results(results)
+        elapsed = self.clock() - start
+        if elapsed < self.frame_interval:
+            self.clock.advance(self.frame_interval - elapsed)
+
+    def run(self, results):
+        """Step through a list of Hands results and return the sink's events"""
+        for result in results:
+            self.step(result)
+        return self.sink.events
+
+    def play(self, *sequences):
+        """Run gesture_fixtures sequences back to back, one hand per frame"""
+        return self.run(results_from_sequences(sequences))
+
+    def play_frames(self, frames):
+        """Run per-frame [(hand, points) ...] lists, for scripts with both hands"""
+        return self.run(results_from_frames(frames))
+
+    @property
+    def fps(self):
+        """Frames per simulated second so far"""
+        return self.pipeline.frame_index / self.clock() if self.clock() else 0.0
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for the dashboard's rolling analytics
+"""
+
+import sys
+import os
+import random
+
+import pytest
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from analytics import (DashboardAnalytics, GestureTimer, LogHistogram, RollingCounter,
+                       RollingHistogram, Sparkline)
+
+
+class FakeClock:
+    """Manually advanced clock"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class RecordingCanvas:
+    """Canvas double that records item changes"""
+
+    def __init__(self):
+        self.calls = []
+
+    def create_line(self, *args, **kwargs):
+        return 1
+
+    def create_text(self, *args, **kwargs):
+        return 2
+
+    def coords(self, item, *coords):
+        self.calls.append(('coords', item))
+
+    def itemconfigure(self, item, **options):
+        self.calls.append(('itemconfigure', item))
+
+
+def test_rolling_counter_expires_old_seconds():
+    """Counts leave the window after it has passed"""
+    counter = RollingCounter(slots=60)
+    for second in range(30):
+        counter.add(100.0 + second, 2)
+    assert counter.per_minute(129.5) == 60
+    assert counter.series(129.5)[-30:] == [2] * 30
+    # Seconds 101..129 remain in the window ending at 160
+    assert counter.per_minute(160.0) == 2 * 29
+    assert counter.per_minute(500.0) == 0
+    assert counter.series(500.0) == [0] * 60
+
+
+def test_log_histogram_percentiles_are_close():
+    """Percentiles land within the histogram's precision of the exact values"""
+    rng = random.Random(3)
+    values = [rng.lognormvariate(2.0, 0.8) for _ in range(20000)]
+    histogram = LogHistogram()
+    for value in values:
+        histogram.record(value)
+    ordered = sorted(values)
+    for pct in (5, 50, 95, 99):
+        exact = ordered[int(pct / 100 * len(ordered)) - 1]
+        assert histogram.percentile(pct) == pytest.approx(exact, rel=0.03)
+    assert LogHistogram().percentile(50) is None
+
+
+def test_rolling_histogram_forgets_expired_slices():
+    """Only the last minute contributes to percentiles"""
+    histogram = RollingHistogram()
+    for i in range(100):
+        histogram.record(1000.0, now=i * 0.1)
+    for i in range(100):
+        histogram.record(10.0, now=30 + i * 0.1)
+    assert histogram.percentile(99, now=40) == pytest.approx(1000.0, rel=0.03)
+    assert histogram.percentile(99, now=65) == pytest.approx(10.0, rel=0.03)
+    assert histogram.percentile(50, now=200) is None
+    assert histogram.window.total == 0
+
+
+def test_gesture_timer_includes_the_current_gesture():
+    """Time accumulates per gesture, including the one still held"""
+    timer = GestureTimer()
+    timer.change('V_GEST', 0.0)
+    timer.change('FIST', 4.0)
+    timer.change(None, 5.0)
+    timer.change('V_GEST', 10.0)
+    assert timer.snapshot(12.0) == {'V_GEST': 6.0, 'FIST': 1.0}
+
+
+def test_dashboard_summary():
+    """Frames, actions and gestures feed the dashboard figures"""
+    clock = FakeClock()
+    analytics = DashboardAnalytics(clock)
+    for frame in range(300):
+        clock.now += 1 / 30
+        analytics.frame(0.012)
+        if frame % 30 == 0:
+            analytics.action('click_count', 0.015)
+            analytics.action('scroll_count', 0.5)
+    analytics.gesture('V_GEST')
+    clock.now += 2
+    summary = analytics.summary()
+    assert summary['gestures_per_minute'] == 20
+    assert summary['fps_p50'] == pytest.approx(30, rel=0.03)
+    assert summary['latency_p95_ms'] == pytest.approx(12, rel=0.03)
+    assert summary['click_p95_ms'] == pytest.approx(15, rel=0.03)
+    assert summary['gesture_seconds'] == {'V_GEST': pytest.approx(2.0)}
+    analytics.reset()
+    assert analytics.summary()['fps_p50'] is None
+
+
+def test_sparkline_touches_only_changed_items():
+    """Redrawing an unchanged series or caption makes no canvas calls"""
+    canvas = RecordingCanvas()
+    sparkline = Sparkline(canvas, 300, 50)
+    sparkline.update([0, 1, 2], "a")
+    assert canvas.calls == [('coords', 1), ('itemconfigure', 2)]
+    sparkline.update([0, 1, 2], "a")
+    sparkline.update([0, 1, 3], "a")
+    assert canvas.calls[2:] == [('coords', 1)]
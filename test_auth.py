@@ -10,6 +10,8 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from auth import AuthenticationManager
+from auth_service import AsyncAuthService
+from settings_profile import SETTINGS_VERSION
 
 def test_authentication():
     """Test the authentication system"""
@@ -51,5 +53,132 @@ def test_authentication():
     
     print("\nAll tests completed!")
 
+
+def test_password_hashing(tmp_path):
+    """New users get salted PBKDF2 hashes at the configured cost"""
+    auth_manager = AuthenticationManager(hash_iterations=1000,
+                                         data_file=str(tmp_path / "users.json"))
+    success, _ = auth_manager.add_user("alice", "secret")
+    assert success
+    stored = auth_manager.users["alice"]["password"]
+    assert stored.startswith("pbkdf2_sha256$1000$")
+    assert auth_manager.authenticate_user("alice", "secret")[0]
+    assert not auth_manager.authenticate_user("alice", "wrong")[0]
+
+    # Stored hashes keep their own cost when the configured cost changes
+    reloaded = AuthenticationManager(hash_iterations=2000,
+                                     data_file=str(tmp_path / "users.json"))
+    assert reloaded.authenticate_user("alice", "secret")[0]
+
+
+def test_legacy_sha256_hash(tmp_path):
+    """Accounts created before PBKDF2 still log in"""
+    auth_manager = AuthenticationManager(data_file=str(tmp_path / "users.json"))
+    auth_manager.users["bob"] = {
+        'password': "9f735e0df9a1ddc702bf0a1a7b83033f9f7153a00c29de82cedadc9957289b05",
+        'image_path': None
+    }
+    assert auth_manager.authenticate_user("bob", "testpassword")[0]
+    assert not auth_manager.authenticate_user("bob", "testpasswor")[0]
+
+
+def test_user_settings_roundtrip(tmp_path):
+    """Settings persist per user and older versions are upgraded on load"""
+    data_file = str(tmp_path / "users.json")
+    auth_manager = AuthenticationManager(hash_iterations=1000, data_file=data_file)
+    auth_manager.add_user("carol", "secret")
+    assert auth_manager.get_user_settings("carol")['scroll_speed'] == 1.0
+
+    settings = auth_manager.get_user_settings("carol")
+    settings['scroll_speed'] = 2.5
+    settings['inference_width'] = 320
+    assert auth_manager.set_user_settings("carol", settings)
+
+    reloaded = AuthenticationManager(data_file=data_file)
+    loaded = reloaded.get_user_settings("carol")
+    assert loaded['scroll_speed'] == 2.5
+    assert loaded['inference_width'] == 320
+    assert reloaded.users["carol"]['settings']['version'] == SETTINGS_VERSION
+
+    # An unversioned profile with stray keys keeps what it can
+    reloaded.users["carol"]['settings'] = {'click_delay': "0.5", 'obsolete': 1}
+    loaded = reloaded.get_user_settings("carol")
+    assert loaded['click_delay'] == 0.5
+    assert 'obsolete' not in loaded
+    assert loaded['preview_rate'] == 30
+
+    # Missing keys come from the machine's tuned profile when one is given
+    loaded = reloaded.get_user_settings("carol", base={'model_complexity': 0})
+    assert loaded['model_complexity'] == 0
+    assert loaded['click_delay'] == 0.5
+
+
+def test_performance_settings_follow_calibration(tmp_path):
+    """Only performance settings the user changed are stored; the rest track the machine"""
+    auth_manager = AuthenticationManager(hash_iterations=1000, data_file=str(tmp_path / "users.json"))
+    auth_manager.add_user("dana", "secret")
+    tuned = {'model_complexity': 0, 'inference_stride': 2}
+    settings = auth_manager.get_user_settings("dana", tuned)
+    settings['inference_width'] = 320
+    assert auth_manager.set_user_settings("dana", settings, base=tuned)
+    stored = auth_manager.users["dana"]['settings']
+    assert stored['inference_width'] == 320
+    assert 'model_complexity' not in stored and 'inference_stride' not in stored
+
+    retuned = auth_manager.get_user_settings("dana", {'model_complexity': 1, 'inference_stride': 3})
+    assert (retuned['model_complexity'], retuned['inference_stride']) == (1, 3)
+    assert retuned['inference_width'] == 320
+
+    # Versions 1 and 2 saved every performance key, so the machine profile wins over them;
+    # unversioned settings files and version 3 keep theirs
+    for version, stride in ((None, 1), (1, 3), (2, 3), (SETTINGS_VERSION, 1)):
+        stored = {'inference_stride': 1, 'camera_mode': "320x240@30", 'click_delay': 0.5}
+        if version is not None:
+            stored['version'] = version
+        auth_manager.users["dana"]['settings'] = stored
+        loaded = auth_manager.get_user_settings("dana", {'inference_stride': 3})
+        assert loaded['inference_stride'] == stride, version
+        assert loaded['camera_mode'] == ("320x240@30" if stride == 1 else "640x480@30"), version
+        assert loaded['click_delay'] == 0.5
+
+
+class ManualRoot:
+    """Stands in for Tk: after() callbacks run only when the test asks"""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, func):
+        self.scheduled.append(func)
+        return len(self.scheduled)
+
+    def run_pending(self):
+        while self.scheduled:
+            self.scheduled.pop(0)()
+
+
+def test_async_errors_name_the_failed_request(tmp_path):
+    """A request that raises is reported with its own error prefix, not as a login failure"""
+    auth_manager = AuthenticationManager(hash_iterations=1000, data_file=str(tmp_path / "users.json"))
+
+    def fail(*args):
+        raise OSError("disk full")
+    auth_manager.set_gesture_templates = fail
+    auth_manager.authenticate_user = fail
+
+    root = ManualRoot()
+    service = AsyncAuthService(root, auth_manager)
+    results = []
+    service.save_gesture_templates("dana", {}, lambda *result: results.append(result))
+    service.authenticate("dana", "secret", lambda *result: results.append(result))
+    service.submit(fail, (), lambda *result: results.append(result))
+    service.executor.shutdown(wait=True)
+    root.run_pending()
+    assert sorted(results) == sorted([(False, "Cannot save custom gestures: disk full"),
+                                      (False, "Authentication error: disk full"),
+                                      (False, "Request failed: disk full")])
+    assert service.pending == 0
+
+
 if __name__ == "__main__":
-    test_authentication()
\ No newline at end of file
+    test_authentication()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for hardware auto-tuning
+"""
+
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from autotune import calibrate, load_machine_profile, save_machine_profile, machine_settings
+
+
+def fake_measure(speeds):
+    """Return a measure function reporting a fixed fps per ladder rung"""
+    def measure(cap, candidate):
+        fps = speeds[candidate['rung']]
+        return {'fps': fps, 'latency_p50_ms': 1000 / fps, 'latency_p95_ms': 1000 / fps}
+    return measure
+
+
+def test_calibrate_picks_first_rung_meeting_target():
+    """The most expensive configuration that meets the target wins"""
+    ladder = [{'rung': i, 'inference_stride': i + 1} for i in range(4)]
+    profile = calibrate(None, target_fps=25, max_latency_ms=45, ladder=ladder,
+                        measure=fake_measure([10, 20, 30, 60]), log=lambda msg: None)
+    assert profile['settings']['rung'] == 2
+    assert profile['measured']['fps'] == 30
+
+
+def test_calibrate_stops_between_rungs():
+    """Calibration gives up, without a profile, once should_run turns false"""
+    ladder = [{'rung': i, 'inference_stride': i + 1} for i in range(4)]
+    measured = []
+
+    def measure(cap, candidate):
+        measured.append(candidate['rung'])
+        return fake_measure([10, 10, 10, 10])(cap, candidate)
+
+    profile = calibrate(None, target_fps=100, ladder=ladder, measure=measure, log=lambda msg: None,
+                        should_run=lambda: len(measured) < 2)
+    assert profile is None
+    assert measured == [0, 1]
+
+
+def test_calibrate_falls_back_to_cheapest_rung():
+    """A machine that misses every target gets the cheapest configuration"""
+    ladder = [{'rung': i, 'inference_stride': i + 1} for i in range(3)]
+    profile = calibrate(None, target_fps=100, ladder=ladder,
+                        measure=fake_measure([5, 8, 12]), log=lambda msg: None)
+    assert profile['settings']['inference_stride'] == 3
+
+
+def test_machine_profile_roundtrip(tmp_path):
+    """Stored profiles only contribute performance settings"""
+    path = str(tmp_path / "machine_profile.json")
+    assert load_machine_profile(path) is None
+    profile = calibrate(None, ladder=[{'rung': 0, 'inference_stride': 2}],
+                        measure=fake_measure([30]), log=lambda msg: None)
+    save_machine_profile(profile, path)
+    assert machine_settings(load_machine_profile(path)) == {'inference_stride': 2}
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for the offline batch processing CLI
+"""
+
+import sys
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+pytest.importorskip("ai_virtual_mouse")
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from batch_process import NO_GESTURE, load_timeline, main, run_batch, timeline_path
+from gesture_fixtures import synthetic_corpus
+from replay import replay_hands_factory, results_from_sequences
+
+
+def write_video(path, frames, size=(160, 120)):
+    """Write a short MJPG video of gray frames"""
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 30, size)
+    for i in range(frames):
+        writer.write(np.full((size[1], size[0], 3), i % 255, dtype=np.uint8))
+    writer.release()
+
+
+@pytest.fixture
+def recordings(tmp_path):
+    """A directory with two recordings, one in a subdirectory"""
+    input_dir = tmp_path / "recordings"
+    (input_dir / "day2").mkdir(parents=True)
+    write_video(str(input_dir / "a.avi"), 24)
+    write_video(str(input_dir / "day2" / "b.avi"), 12)
+    (input_dir / "notes.txt").write_text("not a video")
+    return str(input_dir), str(tmp_path / "timelines")
+
+
+def test_timelines_are_columnar_and_resumable(recordings):
+    """Each video gets a per-frame timeline and finished videos are skipped on rerun"""
+    input_dir, output_dir = recordings
+    results = results_from_sequences(synthetic_corpus(per_label=1, frames=6))
+    logs = []
+    report = run_batch(input_dir, output_dir, jobs=1, log=logs.append,
+                       hands_factory=replay_hands_factory(results))
+    assert report['processed'] == 2 and not report['failures']
+    assert report['frames'] == 36 and report['fps_per_core'] > 0
+
+    timeline = load_timeline(timeline_path(os.path.join(input_dir, "a.avi"), input_dir, output_dir))
+    assert timeline['meta']['frames'] == 24
+    assert timeline['gesture'].shape == (24, 2)
+    assert timeline['landmarks'].shape == (24, 2, 21, 3)
+    assert timeline['landmarks'].dtype == np.float16
+    assert (timeline['present'][:, 0] == (timeline['gesture'][:, 0] != NO_GESTURE)).all()
+    assert timeline['present'][:, 0].any()
+    assert np.all(np.diff(timeline['frame']) == 1)
+
+    report = run_batch(input_dir, output_dir, jobs=1, log=logs.append,
+                       hands_factory=replay_hands_factory(results))
+    assert report['skipped'] == 2 and report['processed'] == 0
+
+    # A changed recording is processed again
+    write_video(os.path.join(input_dir, "a.avi"), 30)
+    report = run_batch(input_dir, output_dir, jobs=1, log=logs.append,
+                       hands_factory=replay_hands_factory(results))
+    assert report['processed'] == 1
+
+
+def test_cli_runs_a_process_pool(recordings, capsys):
+    """The command line processes videos in worker processes"""
+    input_dir, output_dir = recordings
+    assert main([input_dir, "--output", output_dir, "--jobs", "2", "--max-frames", "5",
+                 "--tracker", "Stub"]) == 0
+    assert "fps per core" in capsys.readouterr().out
+    timeline = load_timeline(timeline_path(os.path.join(input_dir, "day2", "b.avi"), input_dir, output_dir))
+    assert timeline['meta']['frames'] == 5
+    assert main([os.path.join(input_dir, "missing")]) == 2
+    # Worker processes cannot use a factory from this one
+    with pytest.raises(ValueError):
+        run_batch(input_dir, output_dir, jobs=2, hands_factory=replay_hands_factory([]))
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for per-user custom gesture templates
+"""
+
+import sys
+import os
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from custom_gestures import TemplateMatcher, landmark_array, normalize_landmarks
+from gesture_fixtures import LandmarkList, base_pose, place_pose, synthetic_sequence
+from benchmarks.custom_gesture_benchmark import build_matcher, check_report, run_benchmark
+
+
+def samples(label, count, seed=0):
+    """Normalized samples of a synthetic pose"""
+    rng = random.Random(seed)
+    return [normalize_landmarks(landmark_array(LandmarkList(synthetic_sequence(label, rng, frames=1).frames[0])))
+            for _ in range(count)]
+
+
+def test_normalization_ignores_position_scale_and_tilt():
+    """The same pose placed anywhere in the image normalizes to the same vector"""
+    pose = base_pose('V_GEST')
+    a = normalize_landmarks(place_pose(pose, 0.3, 0.7, 0.8, -0.3))
+    b = normalize_landmarks(place_pose(pose, 0.6, 0.5, 1.2, 0.4))
+    assert np.allclose(a, b, atol=1e-5)
+    assert normalize_landmarks([[0.5, 0.5, 0.0]] * 21) is None
+
+
+def test_matches_recorded_pose_and_rejects_others():
+    """A recorded pose is recognized and an unrecorded one matches nothing"""
+    matcher = TemplateMatcher(confirm_frames=1)
+    matcher.add("rock", samples('LAST3', 5), "Browser Back")
+    matcher.add("point", samples('INDEX', 5))
+    rng = random.Random(7)
+    for label, expected in (('LAST3', "rock"), ('INDEX', "point"), ('FIST', None), ('LAST4', None)):
+        hand = LandmarkList(synthetic_sequence(label, rng, frames=1).frames[0])
+        assert matcher.match(hand) == expected, label
+
+
+def test_custom_gesture_needs_consecutive_frames():
+    """A match is only reported once it holds for confirm_frames frames"""
+    matcher = TemplateMatcher(confirm_frames=3)
+    matcher.add("rock", samples('LAST3', 3))
+    frames = [LandmarkList(frame) for frame in synthetic_sequence('LAST3', random.Random(1), frames=4).frames]
+    assert [matcher.update(hand) for hand in frames] == [None, None, "rock", "rock"]
+    assert matcher.update(None) is None
+    assert matcher.update(frames[0]) is None
+    matcher.update(frames[1])
+    matcher.reset()
+    assert (matcher.candidate, matcher.streak) == (None, 0)
+    assert [matcher.update(hand) for hand in frames[:3]] == [None, None, "rock"]
+
+
+def test_pipeline_resets_the_matcher_when_the_hand_is_lost():
+    """A custom gesture half confirmed before the hand left starts over"""
+    pytest.importorskip("ai_virtual_mouse")
+    from controller_pipeline import ControllerConfig, ControllerPipeline
+    from replay import replay_hands_factory
+
+    pipeline = ControllerPipeline(ControllerConfig(), hands_factory=replay_hands_factory([]))
+    matcher = TemplateMatcher(confirm_frames=3)
+    matcher.add("rock", samples('LAST3', 3))
+    pipeline.custom_gestures = matcher
+    frames = [LandmarkList(frame) for frame in synthetic_sequence('LAST3', random.Random(1), frames=2).frames]
+    for hand in frames:
+        matcher.update(hand)
+    pipeline.reset_gestures()
+    assert (matcher.candidate, matcher.streak) == (None, 0)
+
+
+def test_templates_roundtrip_through_user_profile(tmp_path):
+    """Templates persist per user and malformed entries are skipped on load"""
+    from auth import AuthenticationManager
+
+    data_file = str(tmp_path / "users.json")
+    auth_manager = AuthenticationManager(hash_iterations=1000, data_file=data_file)
+    auth_manager.add_user("dana", "secret")
+    matcher = TemplateMatcher()
+    matcher.add("rock", samples('LAST3', 5), "Browser Back")
+    assert auth_manager.set_gesture_templates("dana", matcher.to_profile())
+
+    stored = AuthenticationManager(data_file=data_file).get_gesture_templates("dana")
+    loaded = TemplateMatcher.from_profile(stored + [{'name': "broken", 'samples': [[1.0, 2.0]]}])
+    assert loaded.names == ["rock"]
+    assert loaded.actions == {"rock": "Browser Back"}
+    assert len(loaded) == 5
+    assert np.allclose(loaded.matrix, matcher.matrix, atol=1e-4)
+
+
+def test_matching_fits_the_frame_budget():
+    """100 templates match well under 0.2 ms per frame"""
+    report = run_benchmark(template_count=100, queries=200, rounds=3)
+    assert report['templates'] == 100
+    assert report['accuracy'] > 0.95
+    assert check_report(report) == []
+    assert len(build_matcher(1000)) == 1000
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for dwell clicking against recorded cursor traces
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from dwell import DwellClicker
+
+FRAME = 1 / 30
+
+
+def cursor_trace(*segments):
+    """Build a 30 fps [(t, x, y)] trace from (seconds, start, end) segments"""
+    trace, t = [], 0.0
+    for seconds, (x0, y0), (x1, y1) in segments:
+        frames = int(round(seconds / FRAME))
+        for i in range(frames):
+            f = i / max(1, frames - 1)
+            trace.append((t, x0 + (x1 - x0) * f, y0 + (y1 - y0) * f))
+            t += FRAME
+    return trace
+
+
+def click_times(clicker, trace):
+    """Replay a trace with its own timestamps and return when clicks fired"""
+    return [t for t, x, y in trace if clicker.update(x, y, now=t)]
+
+
+def test_rest_clicks_once():
+    """Resting past the delay fires exactly one click"""
+    trace = cursor_trace((0.5, (0, 0), (400, 300)), (3.0, (400, 300), (400, 300)))
+    clicks = click_times(DwellClicker(delay=1.0), trace)
+    assert len(clicks) == 1
+    assert 1.4 < clicks[0] < 1.6
+
+
+def test_jitter_within_radius_still_dwells():
+    """Hand tremor inside the radius does not reset the dwell"""
+    trace = [(i * FRAME, 200 + (i % 3) * 4, 200 - (i % 2) * 5) for i in range(60)]
+    assert len(click_times(DwellClicker(delay=1.0, radius=6), trace)) == 1
+
+
+def test_moving_cursor_never_clicks():
+    """A cursor that keeps moving does not click"""
+    trace = cursor_trace((4.0, (0, 0), (1200, 600)))
+    assert click_times(DwellClicker(delay=1.0), trace) == []
+
+
+def test_leaving_rearms_the_click():
+    """Moving away and resting again fires a second click"""
+    trace = cursor_trace((1.5, (100, 100), (100, 100)), (0.3, (100, 100), (500, 100)),
+                         (1.5, (500, 100), (500, 100)))
+    assert len(click_times(DwellClicker(delay=1.0), trace)) == 2
+
+
+def test_window_stays_bounded():
+    """Long rests keep only about delay seconds of samples"""
+    clicker = DwellClicker(delay=0.5)
+    for t, x, y in cursor_trace((60.0, (10, 10), (10, 10))):
+        clicker.update(x, y, now=t)
+    assert len(clicker.samples) <= 0.5 / FRAME + 2
+
+
+def test_reset_restarts_the_timer():
+    """Losing the hand restarts the dwell period"""
+    ticks = iter(i * 0.1 for i in range(100))
+    clicker = DwellClicker(delay=1.0, clock=lambda: next(ticks))
+    fired = [clicker.update(50, 50) for _ in range(8)]
+    clicker.reset()
+    fired += [clicker.update(50, 50) for _ in range(8)]
+    assert not any(fired)
+    assert any(clicker.update(50, 50) for _ in range(5))
+
+
+def test_dwell_click_is_counted_like_a_gesture_click():
+    """A dwell click reaches the dashboard's click counter through report_action"""
+    pytest.importorskip("ai_virtual_mouse")
+    from gesture_fixtures import trajectory
+    from simulation import Simulation
+
+    actions = []
+    with Simulation({'autoclick_enabled': True, 'autoclick_delay': 0.5}) as sim:
+        sim.pipeline.on_action = actions.append
+        sim.play(trajectory('V_GEST', 20, (0.5, 0.7)))
+    assert len(sim.sink.of('click')) >= 1
+    assert actions.count('click_count') == len(sim.sink.of('click'))
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for memoized gesture classification
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+pytest.importorskip("ai_virtual_mouse")
+
+from ai_virtual_mouse import Gest, HandRecog, HLabel
+from benchmarks.gesture_benchmark import classify_sequence
+from gesture_cache import CachedHandRecog, GestureCacheStats
+from gesture_fixtures import GESTURE_LABELS, synthetic_corpus, trajectory
+
+
+def cached(stats):
+    """A HandRecog factory sharing stats"""
+    return lambda label: CachedHandRecog(label, stats=stats)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_cache_never_changes_emitted_gestures(seed):
+    """Every sequence of the corpus emits the same gestures with and without the cache"""
+    stats = GestureCacheStats()
+    for seq in synthetic_corpus(seed=seed, per_label=3, frames=30):
+        assert (classify_sequence(seq, cached(stats), HLabel, Gest)
+                == classify_sequence(seq, HandRecog, HLabel, Gest)), seq.label
+    assert stats.hits > 0 and stats.misses > 0
+
+
+def test_moving_hand_that_holds_its_pose_hits():
+    """Steering the cursor moves the hand without changing its shape"""
+    stats = GestureCacheStats()
+    hand = CachedHandRecog(HLabel.MAJOR, stats=stats)
+    for hand_result in trajectory('V_GEST', 30, (0.3, 0.7), (0.7, 0.6)).hand_results():
+        hand.update_hand_result(hand_result)
+        hand.set_finger_state()
+        gesture = hand.get_gesture()
+    assert gesture == Gest.V_GEST
+    assert (stats.hits, stats.misses) == (29, 1)
+    assert "reused 29/30" in stats.report()
+
+
+def test_pose_change_and_lost_hand_invalidate():
+    """A different pose or a frame without a hand recomputes the finger state"""
+    stats = GestureCacheStats()
+    hand = CachedHandRecog(HLabel.MAJOR, stats=stats)
+    frames = (trajectory('V_GEST', 3, (0.5, 0.7)).hand_results()
+              + trajectory('FIST', 3, (0.5, 0.7)).hand_results()
+              + [None]
+              + trajectory('FIST', 2, (0.5, 0.7)).hand_results())
+    fingers = []
+    for hand_result in frames:
+        hand.update_hand_result(hand_result)
+        hand.set_finger_state()
+        if hand_result is not None:
+            hand.get_gesture()
+            fingers.append(hand.finger)
+    assert (stats.hits, stats.misses) == (5, 3)
+    assert fingers[:3] == [Gest.FIRST2] * 3
+    assert fingers[3:] == [Gest.FIST] * 5
+
+
+def test_pipeline_replay_is_unchanged_by_the_cache():
+    """The simulated controller confirms the same gestures and sends the same input"""
+    pytest.importorskip("mediapipe")
+    from simulation import Simulation
+
+    script = [trajectory(label, 12, (0.45, 0.7), (0.55, 0.65))
+              for label in GESTURE_LABELS if label != 'PINCH_MINOR']
+    runs = []
+    for enabled in (False, True):
+        with Simulation({'gesture_cache': enabled}, pause=0.0) as sim:
+            sim.play(*script)
+        runs.append((sim.gestures, sim.sink.events, sim.pipeline.gesture_cache))
+    assert runs[0][:2] == runs[1][:2]
+    assert runs[0][2].frames == 0
+    assert runs[1][2].hit_rate > 0.5
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for table-driven gesture dispatch and the Gesture Mode profiles
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from gesture_dispatch import Binding, GestureDispatcher, compile_table
+
+MAJOR, MINOR = 1, 0
+MOVE, FIST, PINCH = 33, 0, 36
+
+
+def recording_binding(log, name, stat=None):
+    """A binding that logs its start, update and stop calls"""
+    return Binding(start=lambda hand_result: log.append((name, 'start', hand_result)),
+                   update=lambda hand_result: log.append((name, 'update', hand_result)),
+                   stop=lambda: log.append((name, 'stop')),
+                   stat=stat)
+
+
+def test_hand_specific_entries_override_generic_ones():
+    """None applies to every hand, specific entries win"""
+    generic, minor_only = Binding(stat='a'), Binding(stat='b')
+    table = compile_table({(PINCH, None): generic, (PINCH, MINOR): minor_only}, (MAJOR, MINOR))
+    assert table == {(PINCH, MAJOR): generic, (PINCH, MINOR): minor_only}
+
+
+def test_bindings_start_update_and_stop_on_transitions():
+    """Start runs once per gesture entry, update every frame, stop on change"""
+    log, stats = [], []
+    modes = {"Basic": {(FIST, None): recording_binding(log, 'drag', 'fist_count'),
+                       (MOVE, None): recording_binding(log, 'move')}}
+    dispatcher = GestureDispatcher(modes, (MAJOR, MINOR), on_action=stats.append)
+    for frame, gesture in enumerate([FIST, FIST, MOVE, 99, FIST]):
+        dispatcher.dispatch(gesture, MAJOR, frame)
+    assert log == [('drag', 'start', 0), ('drag', 'update', 0), ('drag', 'update', 1),
+                   ('drag', 'stop'), ('move', 'start', 2), ('move', 'update', 2),
+                   ('move', 'stop'), ('drag', 'start', 4), ('drag', 'update', 4)]
+    assert stats == ['fist_count', 'fist_count']
+
+
+def test_lost_hand_and_mode_switch_release_held_gestures():
+    """A hand leaving the frame or a mode change ends its held gesture"""
+    log = []
+    modes = {"Basic": {(FIST, None): recording_binding(log, 'drag')},
+             "Gaming": {(MOVE, None): recording_binding(log, 'move')}}
+    dispatcher = GestureDispatcher(modes, (MAJOR, MINOR), mode="Basic")
+    dispatcher.dispatch(FIST, MAJOR, None)
+    dispatcher.dispatch(FIST, MINOR, None)
+    dispatcher.retain([MAJOR])
+    assert log.count(('drag', 'stop')) == 1
+
+    dispatcher.set_mode("Gaming")
+    assert log.count(('drag', 'stop')) == 2
+    dispatcher.dispatch(FIST, MAJOR, None)
+    assert dispatcher.active == {}
+
+    dispatcher.set_mode("No such mode")
+    assert dispatcher.mode == "Basic"
+
+
+def test_gesture_modes_count_every_dashboard_stat():
+    """Every dashboard counter, including scrolls, is reachable in Basic mode"""
+    pytest.importorskip("pyautogui")
+    pytest.importorskip("ai_virtual_mouse")
+    from gesture_actions import GESTURE_MODES
+
+    stats = {binding.stat for binding in GESTURE_MODES["Basic"].values()}
+    assert stats == {'fist_count', 'pinch_count', 'v_gest_count', 'click_count', 'scroll_count',
+                     'right_click_count', 'double_click_count'}
+    assert set(GESTURE_MODES) == {"Basic", "Advanced", "Gaming"}
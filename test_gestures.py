@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Tests for gesture recognition against the labeled landmark corpus
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from gesture_fixtures import GESTURE_LABELS, load_corpus, save_corpus, synthetic_corpus
+from benchmarks.gesture_benchmark import check_report, run_benchmark
+
+
+def test_corpus_covers_every_gesture():
+    """The synthetic corpus is deterministic and labels every Gest member"""
+    corpus = synthetic_corpus()
+    assert {seq.label for seq in corpus} == set(GESTURE_LABELS)
+    assert [seq.frames for seq in corpus] == [seq.frames for seq in synthetic_corpus()]
+    for seq in corpus:
+        for frame in seq.frames:
+            assert frame is None or len(frame) == 21
+
+
+def test_corpus_roundtrip(tmp_path):
+    """Corpora survive a save and load"""
+    corpus = synthetic_corpus(per_label=1, frames=3)
+    path = str(tmp_path / "corpus.jsonl")
+    save_corpus(path, corpus)
+    loaded = load_corpus(path)
+    assert [(s.label, s.hand, s.frames) for s in loaded] == [(s.label, s.hand, s.frames) for s in corpus]
+
+
+def test_gesture_accuracy_and_throughput():
+    """HandRecog does not regress on the corpus"""
+    pytest.importorskip("ai_virtual_mouse")
+    report = run_benchmark(load_corpus())
+    assert check_report(report) == []
+    for label in ('FIST', 'THUMB', 'V_GEST', 'PINCH_MAJOR', 'PINCH_MINOR', 'TWO_FINGER_CLOSED'):
+        assert report['per_label'][label]['recall'] == 1.0
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for frame-to-frame hand identity tracking
+"""
+
+import sys
+import os
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from gesture_fixtures import LandmarkList, base_pose, place_pose
+from hand_tracking import DEFAULT_MAX_MISSED, HandTracker
+
+POSE = base_pose('LAST4')
+
+
+def hand_at(x, y=0.7):
+    """A hand whose wrist sits at (x, y)"""
+    return LandmarkList(place_pose(POSE, x, y, 1.0, 0.0))
+
+
+def test_one_frame_label_flip_keeps_the_slots():
+    """A single mislabeled frame does not swap major and minor"""
+    tracker = HandTracker()
+    for _ in range(5):
+        right, left = hand_at(0.3), hand_at(0.7)
+        assert tracker.update([right, left], ['Right', 'Left']) == (right, left)
+    major_id = tracker.major_id
+
+    right, left = hand_at(0.31), hand_at(0.69)
+    assert tracker.update([right, left], ['Left', 'Right']) == (right, left)
+    # Both hands labelled the same for a frame
+    assert tracker.update([left, right], ['Right', 'Right']) == (right, left)
+    assert tracker.major_id == major_id
+
+
+def test_lone_hand_keeps_its_voted_label():
+    """A single hand stays minor through a flipped label and after a brief miss"""
+    tracker = HandTracker()
+    hand = hand_at(0.5)
+    for _ in range(4):
+        assert tracker.update([hand], ['Left']) == (None, hand)
+    assert tracker.update([hand], ['Right']) == (None, hand)
+    for _ in range(DEFAULT_MAX_MISSED):
+        assert tracker.update([], []) == (None, None)
+    track_id = tracker.tracks[0].id
+    assert tracker.update([hand_at(0.52)], ['Right'])[1] is not None
+    assert tracker.tracks[0].id == track_id
+
+
+def test_tracks_follow_moving_hands_and_expire():
+    """Ids follow hands as they move and a new id is issued after a long absence"""
+    tracker = HandTracker()
+    for step in range(10):
+        tracker.update([hand_at(0.2 + step * 0.03)], ['Right'])
+    assert [t.id for t in tracker.tracks] == [1]
+    for _ in range(DEFAULT_MAX_MISSED + 1):
+        tracker.update([], [])
+    assert tracker.tracks == []
+    tracker.update([hand_at(0.5)], ['Right'])
+    assert tracker.major_id == 2
+
+
+def test_dominant_hand_setting():
+    """With a left dominant hand the left-labelled hand is major"""
+    tracker = HandTracker()
+    right, left = hand_at(0.3), hand_at(0.7)
+    assert tracker.update([right, left], ['Right', 'Left'], dominant='Left') == (left, right)
+    assert tracker.update([right], ['Right'], dominant='Left') == (None, right)
+
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for the profile photo cache and its thumbnails
+"""
+
+import sys
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+pytest.importorskip("PIL")
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import image_cache
+from image_cache import PhotoImageCache, save_user_image, thumbnail_path
+
+
+@pytest.fixture
+def photos(monkeypatch):
+    """PhotoImages need a Tk root; stand in with the decoded image's size"""
+    monkeypatch.setattr(image_cache.ImageTk, "PhotoImage", lambda image: ("photo", image.size))
+
+
+def write_image(path, value=128, size=(320, 240)):
+    """Save a gray frame and its thumbnails"""
+    save_user_image(np.full((size[1], size[0], 3), value, dtype=np.uint8), path)
+
+
+def test_repeat_lookups_hit_and_the_oldest_entry_is_evicted(tmp_path, photos):
+    """Lookups are served from the cache; the least recently used image goes first"""
+    cache = PhotoImageCache(max_entries=2)
+    paths = [str(tmp_path / f"user{i}.jpg") for i in range(3)]
+    for path in paths:
+        write_image(path)
+
+    first = cache.get(paths[0])
+    assert first == ("photo", (100, 100))
+    assert cache.get(paths[0]) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.get(paths[1])
+    cache.get(paths[0])
+    cache.get(paths[2])
+    assert cache.key(paths[0]) in cache.entries
+    assert cache.key(paths[1]) not in cache.entries
+    assert len(cache.entries) == 2
+
+
+def test_rewritten_image_gets_a_new_key(tmp_path, photos):
+    """A changed modification time or file size invalidates the cached photo"""
+    cache = PhotoImageCache()
+    path = str(tmp_path / "user.jpg")
+    write_image(path)
+    key = cache.key(path)
+    cache.get(path)
+
+    thumb = thumbnail_path(path, 100)
+    stat = os.stat(thumb)
+    os.utime(thumb, (stat.st_atime, stat.st_mtime + 10))
+    moved = cache.key(path)
+    assert moved != key
+
+    # Same mtime, different content size
+    with open(thumb, 'ab') as f:
+        f.write(b"\0" * 16)
+    os.utime(thumb, (stat.st_atime, stat.st_mtime + 10))
+    assert cache.key(path) not in (key, moved)
+
+    misses = cache.misses
+    cache.get(path)
+    assert cache.misses == misses + 1
+
+
+def test_legacy_full_size_image_gets_a_thumbnail(tmp_path, photos):
+    """An image saved before thumbnails existed is downscaled once and reused"""
+    import cv2
+
+    cache = PhotoImageCache()
+    path = str(tmp_path / "legacy.jpg")
+    cv2.imwrite(path, np.full((240, 320, 3), 64, dtype=np.uint8))
+    thumb = thumbnail_path(path, 100)
+    assert not os.path.exists(thumb)
+
+    assert cache.key(path)[0] == path
+    assert cache.get(path) == ("photo", (100, 100))
+    assert os.path.exists(thumb)
+    assert cache.key(path)[0] == thumb
+    assert cache.get(str(tmp_path / "missing.jpg")) is None
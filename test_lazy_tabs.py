@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for lazily built notebook tabs and off-thread profile image decoding
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lazy_tabs import TAB_CHANGED, LazyNotebook
+
+
+class Notebook:
+    """The ttk.Notebook calls LazyNotebook makes; the first tab added is selected"""
+
+    def __init__(self):
+        self.tabs = []
+        self.selected = None
+        self.bindings = {}
+
+    def bind(self, sequence, func, add=None):
+        self.bindings[sequence] = func
+
+    def add(self, frame, **options):
+        self.tabs.append(frame)
+        if self.selected is None:
+            self.selected = frame
+
+    def select(self, tab=None):
+        if tab is None:
+            return str(self.selected)
+        self.selected = tab
+        self.bindings[TAB_CHANGED](None)
+
+
+class Frame:
+    """A stand-in for a tab's frame, named like a Tk path"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __str__(self):
+        return self.name
+
+
+def test_tabs_are_built_once_on_first_selection():
+    """Nothing is built until a tab is selected, and reselecting reuses the content"""
+    notebook = Notebook()
+    calls = []
+    reported = []
+    tabs = LazyNotebook(notebook, on_built=lambda name, seconds: reported.append(name))
+    settings, help_tab = Frame(".settings"), Frame(".help")
+    tabs.add(settings, calls.append, text="Settings")
+    tabs.add(help_tab, calls.append, text="Help")
+    assert calls == [] and not tabs.built(settings)
+
+    notebook.select(help_tab)
+    notebook.select(settings)
+    notebook.select(help_tab)
+    assert calls == [help_tab, settings]
+    assert reported == ["Help", "Settings"]
+    assert set(tabs.build_seconds) == {"Help", "Settings"}
+    assert tabs.built(settings) and tabs.built(help_tab)
+
+
+def test_initially_selected_tab_can_be_built_at_once():
+    """build() fills the tab shown when the notebook appears"""
+    notebook = Notebook()
+    calls = []
+    tabs = LazyNotebook(notebook)
+    first, second = Frame(".first"), Frame(".second")
+    tabs.add(first, calls.append, text="First")
+    tabs.add(second, calls.append, text="Second")
+    assert tabs.build(notebook.select())
+    assert not tabs.build(notebook.select())
+    assert calls == [first]
+
+
+def test_profile_image_decodes_without_tk(tmp_path):
+    """The decode half of the photo cache runs without Tk and touches no cache entries"""
+    pytest.importorskip("cv2")
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("PIL")
+    from image_cache import PhotoImageCache, save_user_image, thumbnail_path
+
+    image_path = str(tmp_path / "user.jpg")
+    save_user_image(np.full((240, 320, 3), 128, dtype=np.uint8), image_path)
+    cache = PhotoImageCache()
+    key, image = cache.decode(image_path, 100)
+    assert key == cache.key(image_path, 100)
+    assert key[0] == thumbnail_path(image_path, 100)
+    assert image.size == (100, 100)
+    assert cache.entries == {} and cache.cached(key) is None
+    assert cache.decode(str(tmp_path / "missing.jpg"), 100) is None
+
+
+def test_failed_profile_image_decode_has_its_own_message(tmp_path):
+    """A decode that raises is reported as an image problem, not an authentication error"""
+    pytest.importorskip("cv2")
+    pytest.importorskip("PIL")
+    from auth_service import AsyncAuthService
+    from user_store import AuthenticationManager
+
+    class Root:
+        def __init__(self):
+            self.callbacks = []
+
+        def after(self, ms, func):
+            self.callbacks.append(func)
+            return len(self.callbacks)
+
+    class BrokenCache:
+        def decode(self, image_path, size):
+            raise OSError("unreadable thumbnail")
+
+    auth_manager = AuthenticationManager(hash_iterations=1000, data_file=str(tmp_path / "users.json"))
+    auth_manager.add_user("erin", "secret")
+    auth_manager.set_user_image("erin", str(tmp_path / "erin.jpg"))
+    root = Root()
+    service = AsyncAuthService(root, auth_manager)
+    results = []
+    service.load_user_image("erin", BrokenCache(), 100, lambda *result: results.append(result))
+    service.executor.shutdown(wait=True)
+    while root.callbacks:
+        root.callbacks.pop(0)()
+    assert results == [(False, "Cannot load profile image: unreadable thumbnail")]
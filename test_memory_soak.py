@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Soak test: the controller pipeline runs from a replay source with bounded memory,
+measured both by tracemalloc and by the process RSS
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+pytest.importorskip("ai_virtual_mouse")
+
+from controller_pipeline import ControllerConfig, ControllerPipeline
+from gesture_fixtures import synthetic_corpus
+from profiling import MemoryProfiler
+from replay import ReplayCapture, replay_hands_factory, results_from_sequences
+
+SOAK_FRAMES = 3000
+WARMUP_FRAMES = 300
+MAX_TRACED_GROWTH = 64 * 1024
+# Allocator and page-granularity noise; a per-frame leak of a 320x240 frame is ~690 MiB
+MAX_RSS_GROWTH = 4 * 1024 * 1024
+
+
+def test_pipeline_memory_is_bounded():
+    """Steady-state traced memory and RSS do not grow with the number of frames"""
+    pytest.importorskip("psutil")
+    results = results_from_sequences(synthetic_corpus())
+    config = ControllerConfig({'preview_rate': 0, 'show_landmarks': True, 'presence_gate': False})
+    pipeline = ControllerPipeline(config, hands_factory=replay_hands_factory(results))
+    pipeline.drive_controls = False
+
+    warmup = ReplayCapture(WARMUP_FRAMES, width=320, height=240)
+    pipeline.run(warmup, lambda: True)
+
+    profiler = MemoryProfiler(interval=500)
+    pipeline.memory_profiler = profiler
+    pipeline.run(ReplayCapture(SOAK_FRAMES, width=320, height=240), lambda: True)
+
+    assert profiler.frames == SOAK_FRAMES
+    # The first interval includes one-off caches, so measure from the second sample
+    rss_growth, traced_growth = profiler.growth(since=1)
+    assert traced_growth < MAX_TRACED_GROWTH, profiler.report()
+    # RSS also catches leaks outside tracemalloc's view, such as OpenCV and NumPy buffers
+    assert all(rss is not None for _, rss in profiler.rss_samples)
+    assert rss_growth < MAX_RSS_GROWTH, profiler.report()
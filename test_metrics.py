@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Tests for the Prometheus metrics endpoint
+"""
+
+import sys
+import os
+from urllib.request import urlopen
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from metrics import MetricsRegistry, MetricsServer, PipelineMetrics
+
+
+def test_render_text_format():
+    """Counters, callback gauges and cumulative histogram buckets render as Prometheus text"""
+    registry = MetricsRegistry()
+    state = {'running': True}
+    registry.gauge("virtual_mouse_controller_running", "Running", func=lambda: state['running'])
+    pipeline = PipelineMetrics(registry)
+    pipeline.frames.inc(3)
+    pipeline.observe_stage("hands.process", 0.004)
+    pipeline.observe_stage("hands.process", 0.2)
+    pipeline.observe_stage("unknown stage", 1.0)
+
+    text = registry.render()
+    lines = text.splitlines()
+    assert "virtual_mouse_controller_running 1" in lines
+    assert "virtual_mouse_frames_total 3" in lines
+    assert 'virtual_mouse_stage_latency_seconds_bucket{stage="hands.process",le="0.005"} 1' in lines
+    assert 'virtual_mouse_stage_latency_seconds_bucket{stage="hands.process",le="+Inf"} 2' in lines
+    assert 'virtual_mouse_stage_latency_seconds_count{stage="hands.process"} 2' in lines
+    assert text.count("# TYPE virtual_mouse_stage_latency_seconds histogram") == 1
+
+    state['running'] = False
+    assert "virtual_mouse_controller_running 0" in registry.render().splitlines()
+
+
+def test_server_serves_metrics():
+    """The endpoint answers scrapes on localhost"""
+    registry = MetricsRegistry()
+    registry.counter("virtual_mouse_camera_reopens_total", "Reopens").inc()
+    server = MetricsServer(registry, 0).start()
+    try:
+        with urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as response:
+            body = response.read().decode()
+            assert response.headers['Content-Type'].startswith("text/plain")
+    finally:
+        server.close()
+    assert "virtual_mouse_camera_reopens_total 1" in body.splitlines()
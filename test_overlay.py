@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Tests for the vectorized landmark overlay
+"""
+
+import sys
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from overlay import JOINT_COLOR, LINE_COLOR, OverlayRenderer, status_text
+from benchmarks.overlay_benchmark import check_report, run_benchmark
+
+
+def straight_hand(x0, y0, step=0.01):
+    """A (21, 2) hand laid out along a diagonal"""
+    return np.array([(x0 + i * step, y0 + i * step) for i in range(21)], dtype=np.float32)
+
+
+def test_draws_joints_and_connections():
+    """Joints get the joint colour and connections are drawn between them"""
+    image = np.zeros((200, 400, 3), dtype=np.uint8)
+    hand = straight_hand(0.05, 0.05, step=0.04)
+    OverlayRenderer().draw(image, [hand, straight_hand(0.5, 0.5)])
+    wrist = (hand[0] * (400, 200)).astype(int)
+    assert tuple(image[wrist[1], wrist[0]]) == JOINT_COLOR
+    # Midway along the wrist-to-index-knuckle connection (0, 5)
+    mid = ((hand[0] + hand[5]) / 2 * (400, 200)).astype(int)
+    assert tuple(image[mid[1], mid[0]]) == LINE_COLOR
+    assert image[150:, :100].sum() == 0
+
+
+def test_clips_hands_leaving_the_frame():
+    """Landmarks outside the frame are dropped instead of wrapping around"""
+    image = np.zeros((100, 100, 3), dtype=np.uint8)
+    OverlayRenderer().draw(image, [straight_hand(0.9, -0.1, step=0.05)])
+    assert image[:, :50].sum() == 0
+    assert OverlayRenderer().draw(image, []) is image
+
+
+def test_status_line():
+    """The status line shows the gesture and fps"""
+    image = np.zeros((100, 300, 3), dtype=np.uint8)
+    text = status_text("V_GEST", 29.6)
+    assert text == "V_GEST | 30 fps"
+    OverlayRenderer().draw(image, [], text)
+    assert image[:40].any()
+    assert status_text(None, None) == ""
+
+
+def test_overlay_fits_the_frame_budget():
+    """Drawing two hands stays within the benchmark budget"""
+    report = run_benchmark(rounds=20)
+    assert check_report(report) == []
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for the idle power-saving policy
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from power import ACTIVE, IDLE, PowerPolicy
+
+FPS = 30
+
+
+class FrameClock:
+    """Clock advancing one camera frame per reading"""
+
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        self.t += 1.0 / FPS
+        return self.t
+
+
+def test_idles_after_timeout_and_resumes_on_first_hand():
+    """No hand for idle_after seconds idles; the next hand resumes at once"""
+    clock = FrameClock()
+    policy = PowerPolicy(idle_after=2.0, clock=clock)
+    states = [policy.update(False) for _ in range(3 * FPS)]
+    assert states.count(IDLE) == 1
+    assert states.index(IDLE) == 2 * FPS - 1
+    assert policy.inference_stride(1) == policy.idle_stride
+
+    assert policy.update(True) == ACTIVE
+    assert policy.inference_stride(1) == 1
+    durations = policy.durations(clock.t)
+    assert durations[IDLE] == pytest.approx(1.0 + 1.0 / FPS)
+    assert sum(durations.values()) == pytest.approx(clock.t - 1.0 / FPS)
+
+
+def test_hands_keep_the_controller_active():
+    """Hands seen more often than idle_after keep the ACTIVE state"""
+    policy = PowerPolicy(idle_after=1.0, clock=FrameClock())
+    for i in range(10 * FPS):
+        policy.update(i % FPS == 0)
+    assert policy.state == ACTIVE
+    assert policy.transitions == []
+
+
+def test_resume_bound():
+    """The resume bound covers the idle inference interval"""
+    policy = PowerPolicy(idle_fps=10, idle_stride=2)
+    assert policy.max_resume_seconds() == pytest.approx(0.2)
+    assert policy.max_resume_seconds(wake_frames=11) == pytest.approx(2.2)
+
+
+def test_pipeline_idles_and_resumes_on_replay():
+    """The pipeline lowers the camera rate and inference while idle and restores both"""
+    pytest.importorskip("ai_virtual_mouse")
+    from controller_pipeline import ControllerConfig, ControllerPipeline
+    from gesture_fixtures import synthetic_corpus
+    from replay import ReplayCapture, replay_hands_factory, results_from_frames
+
+    class RecordingCapture(ReplayCapture):
+        """Replay capture that remembers frame rate requests"""
+
+        def __init__(self, *args):
+            super().__init__(*args)
+            self.fps_requests = []
+
+        def set(self, prop, value):
+            import cv2
+            if prop == cv2.CAP_PROP_FPS:
+                self.fps_requests.append(value)
+            return True
+
+        def get(self, prop):
+            return float(FPS)
+
+    hand = next(frame for seq in synthetic_corpus() for frame in seq.frames if frame is not None)
+    results = results_from_frames([[('major', hand)]] * 30 + [[]] * 150 + [[('major', hand)]] * 30)
+    config = ControllerConfig({'preview_rate': 0, 'presence_gate': False, 'idle_timeout': 2,
+                               'camera_mode': "Default"})
+    replay_hands = replay_hands_factory(results, loop=False)
+    pipeline = ControllerPipeline(config, hands_factory=replay_hands)
+    pipeline.drive_controls = False
+    clock = FrameClock()
+    pipeline.power = PowerPolicy(clock=clock)
+
+    cap = RecordingCapture(300)
+    # Run until the policy has idled and resumed
+    pipeline.run(cap, lambda: len(pipeline.power.transitions) < 2)
+
+    power = pipeline.power
+    assert [state for _, state in power.transitions] == [IDLE, ACTIVE]
+    assert cap.fps_requests == [power.idle_fps, FPS]
+    # Hands vanish after frame 30 and the policy idles two seconds later
+    idle_at, active_at = power.transitions[0][0], power.transitions[1][0]
+    assert idle_at == pytest.approx((30 + 2 * FPS) / FPS, abs=2.0 / FPS)
+    # Remaining 90 empty results are consumed at one inference per idle_stride frames
+    idle_frames = round((active_at - idle_at) * FPS)
+    assert idle_frames == pytest.approx(90 * power.idle_stride, abs=power.idle_stride)
+    assert replay_hands(None).position == 181
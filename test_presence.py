@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the motion/presence gate in front of hand inference
+"""
+
+import sys
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from presence import PresenceGate
+
+
+def still_frame(value=80):
+    """A uniform 640x480 BGR frame"""
+    return np.full((480, 640, 3), value, dtype=np.uint8)
+
+
+def moving_frame(offset):
+    """A frame with a bright block whose position depends on offset"""
+    frame = still_frame()
+    frame[200:300, offset:offset + 100] = 255
+    return frame
+
+
+def run_gate(gate, frames, hands=()):
+    """Feed frames through the gate and return which were inferred"""
+    inferred = []
+    for index, frame in enumerate(frames):
+        run = gate.check(frame)
+        if run:
+            gate.observe(index in hands, 0.01)
+        inferred.append(run)
+    return inferred
+
+
+def test_static_scene_is_gated_with_bounded_wakeup():
+    """A still scene skips most frames but infers at least every max_skip + 1 frames"""
+    gate = PresenceGate(max_skip=5, hand_grace=3)
+    inferred = run_gate(gate, [still_frame()] * 120)
+    gaps, last = [], None
+    for index, run in enumerate(inferred):
+        if run:
+            if last is not None:
+                gaps.append(index - last)
+            last = index
+    assert max(gaps) <= gate.max_wake_frames
+    assert gate.gated_fraction > 0.7
+    assert gate.saved_seconds == pytest.approx(gate.gated * 0.01)
+
+
+def test_motion_opens_the_gate():
+    """Every frame that changes noticeably is inferred"""
+    gate = PresenceGate(max_skip=100, hand_grace=0)
+    frames = [still_frame()] * 10 + [moving_frame(60 * i) for i in range(1, 9)]
+    inferred = run_gate(gate, frames)
+    assert not any(inferred[1:10])
+    assert all(inferred[10:])
+
+
+def test_recent_hand_keeps_inference_running():
+    """Inference continues through the grace period after a hand was seen"""
+    gate = PresenceGate(max_skip=100, hand_grace=10)
+    inferred = run_gate(gate, [still_frame()] * 40, hands={0})
+    assert all(inferred[:11])
+    assert not any(inferred[12:])
+
+
+def test_sensor_noise_does_not_count_as_motion():
+    """Small per-pixel noise stays below the motion threshold"""
+    rng = np.random.default_rng(0)
+    frames = [np.clip(still_frame().astype(np.int16) + rng.integers(-4, 5, (480, 640, 3)), 0, 255)
+              .astype(np.uint8) for _ in range(30)]
+    gate = PresenceGate(max_skip=100, hand_grace=0)
+    assert sum(run_gate(gate, frames)) == 1
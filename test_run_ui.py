@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Tests for the command-line launcher
+"""
+
+import sys
+import os
+import json
+import subprocess
+
+import pytest
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import run_ui
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_import_does_not_load_tk():
+    """Importing the launcher and parsing arguments leaves Tk unloaded"""
+    code = ("import sys, run_ui; run_ui.build_parser().parse_args(['--headless']); "
+            "sys.exit('tkinter' in sys.modules)")
+    assert subprocess.run([sys.executable, "-c", code], cwd=HERE).returncode == 0
+
+
+def test_usage_errors_exit_with_2(tmp_path, capsys):
+    """A missing recording or unknown profile is a usage error"""
+    pytest.importorskip("numpy")
+    assert run_ui.main(["--headless", "--replay", str(tmp_path / "missing.npz")]) == 2
+    assert run_ui.main(["--headless", "--profile", "no-such-user-or-file"]) == 2
+    assert run_ui.main(["--source", "clip.mp4"]) == 2
+    assert run_ui.main(["--tracker", "Stub"]) == 2
+    assert "Error" in capsys.readouterr().err
+
+
+def test_benchmark_exit_code():
+    """A benchmark within budget exits with 0"""
+    pytest.importorskip("cv2")
+    assert run_ui.main(["--benchmark", "overlay"]) == 0
+
+
+def test_headless_replay_and_record(tmp_path, capsys):
+    """A headless dry run replays a recording and records it again"""
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("mediapipe")
+    pytest.importorskip("ai_virtual_mouse")
+    from gesture_fixtures import synthetic_corpus
+    from replay import HandsRecorder, load_recording, results_from_sequences
+
+    results = results_from_sequences(synthetic_corpus(per_label=1, frames=6))
+    recorder = HandsRecorder()
+    for result in results:
+        recorder.record(result)
+    source = str(tmp_path / "source.landmarks.npz")
+    recorder.save(source)
+
+    copy = str(tmp_path / "copy.landmarks.npz")
+    assert run_ui.main(["--headless", "--dry-run", "--replay", source, "--record", copy]) == 0
+    assert f"Processed {len(results)} frames" in capsys.readouterr().out
+
+    replayed = load_recording(copy)
+    assert len(replayed) == len(results)
+    for original, again in zip(results, replayed):
+        assert len(original.multi_hand_landmarks or []) == len(again.multi_hand_landmarks or [])
+        for hand, other in zip(original.multi_hand_landmarks or [], again.multi_hand_landmarks or []):
+            assert np.allclose([(p.x, p.y) for p in hand.landmark],
+                               [(p.x, p.y) for p in other.landmark], atol=1e-6)
+
+    assert run_ui.main(["--headless", "--dry-run", "--replay", copy, "--frames", "5"]) == 0
+    assert "Processed 5 frames" in capsys.readouterr().out
+
+
+def test_headless_dry_run_does_not_load_tk(tmp_path):
+    """A headless dry run never imports pyautogui, which would load Tk through pymsgbox"""
+    pytest.importorskip("numpy")
+    pytest.importorskip("cv2")
+    pytest.importorskip("ai_virtual_mouse")
+    from gesture_fixtures import synthetic_corpus
+    from replay import HandsRecorder, results_from_sequences
+
+    recorder = HandsRecorder()
+    for result in results_from_sequences(synthetic_corpus(per_label=1, frames=6)):
+        recorder.record(result)
+    source = str(tmp_path / "source.landmarks.npz")
+    recorder.save(source)
+
+    def loaded(code):
+        out = subprocess.run([sys.executable, "-c", "import json, sys; " + code +
+                              "; print(json.dumps(['tkinter' in sys.modules, 'pyautogui' in sys.modules]))"],
+                             cwd=HERE, capture_output=True, text=True, check=True).stdout
+        return json.loads(out.splitlines()[-1])
+
+    # Controller's own module is outside this repo and may import pyautogui itself
+    baseline = loaded("import ai_virtual_mouse")
+    if baseline[0]:
+        pytest.skip("ai_virtual_mouse loads Tk on import")
+    run = (f"import run_ui, gesture_actions; "
+           f"assert run_ui.main(['--headless', '--dry-run', '--replay', {source!r}]) == 0; "
+           f"assert gesture_actions.pyautogui is None")
+    assert loaded(run) == baseline
+
+
+def test_headless_camera_closing_is_a_failure(monkeypatch, capsys):
+    """A camera that closes mid-run fails the run, unlike a replay reaching its end"""
+    pytest.importorskip("numpy")
+    pytest.importorskip("ai_virtual_mouse")
+    from replay import ReplayCapture
+
+    monkeypatch.setattr(run_ui, "open_source", lambda pipeline, source, *args, **kwargs: ReplayCapture(5))
+    assert run_ui.main(["--headless", "--dry-run", "--tracker", "Stub", "--source", "0"]) == 1
+    assert "Camera closed" in capsys.readouterr().out
+
+
+def test_headless_stub_runs_without_a_camera(capsys):
+    """The stub tracker runs on blank frames when no source is given"""
+    pytest.importorskip("numpy")
+    pytest.importorskip("ai_virtual_mouse")
+    assert run_ui.main(["--headless", "--dry-run", "--tracker", "Stub", "--frames", "30"]) == 0
+    assert "Processed 30 frames" in capsys.readouterr().out
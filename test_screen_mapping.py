@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the precomputed camera-to-screen mapping
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from gesture_fixtures import LandmarkList
+from screen_mapping import CursorMapper, ScreenMapping, active_region
+
+
+def hand_at(x, y):
+    """A hand whose pointer landmark sits at (x, y)"""
+    return LandmarkList([(x, y, 0.0)] * 21)
+
+
+class CountingPointer:
+    """Pointer that counts position queries"""
+
+    def __init__(self, position):
+        self.queries = 0
+        self.at = position
+
+    def position(self):
+        self.queries += 1
+        return self.at
+
+
+def test_region_maps_onto_a_multi_monitor_desktop():
+    """The active region's corners land on the virtual desktop's corners"""
+    desktop = (-1920, 0, 3840, 1080)
+    mapping = ScreenMapping(desktop, active_region(0.8))
+    assert mapping.map(0.1, 0.1) == pytest.approx((-1920, 0))
+    assert mapping.map(0.9, 0.9) == pytest.approx((1920, 1080))
+    assert mapping.clamp(*mapping.map(0.0, 1.0)) == (-1920, 1079)
+
+
+def test_aspect_correction_matches_the_desktop_shape():
+    """A 4:3 camera region is trimmed to 16:9 so x and y move equally fast"""
+    mapping = ScreenMapping.build((0, 0, 1920, 1080), camera_aspect=4 / 3)
+    x0, y0, x1, y1 = mapping.region
+    assert (x0, x1) == (0.0, 1.0)
+    assert (x1 - x0) * 4 / 3 / (y1 - y0) == pytest.approx(16 / 9)
+    assert mapping.scale_x / (4 / 3) == pytest.approx(mapping.scale_y)
+    plain = ScreenMapping.build((0, 0, 1920, 1080), aspect_correction=False)
+    assert plain.region == (0.0, 0.0, 1.0, 1.0)
+
+
+def test_cursor_moves_without_per_frame_os_queries():
+    """The OS is asked for the cursor once per sync, not once per frame"""
+    pointer = CountingPointer((500, 500))
+    cursor = CursorMapper(ScreenMapping((0, 0, 1000, 1000)), pointer=pointer)
+    assert cursor.position(hand_at(0.5, 0.5)) == (500, 500)
+    x, y = 500, 500
+    for step in range(1, 20):
+        x, y = cursor.position(hand_at(0.5 + step * 0.02, 0.5))
+    assert x > 500 and y == 500
+    assert pointer.queries == 1
+
+    # Sub-threshold jitter doesn't move the cursor, big moves are capped
+    assert cursor.position(hand_at(0.5 + 19 * 0.02 + 0.001, 0.5)) == (x, y)
+    assert cursor.position(hand_at(0.1, 0.5))[0] == 0
+    cursor.sync()
+    cursor.position(hand_at(0.1, 0.5))
+    assert pointer.queries == 2
+
+
+def test_cursor_reads_the_shared_pointer(monkeypatch):
+    """Without its own pointer the mapper asks gesture_actions, as the simulation patches it"""
+    pytest.importorskip("ai_virtual_mouse")
+    import gesture_actions
+
+    pointer = CountingPointer((300, 400))
+    monkeypatch.setattr(gesture_actions, "pyautogui", pointer)
+    cursor = CursorMapper(ScreenMapping((0, 0, 1000, 1000)))
+    assert cursor.position(hand_at(0.5, 0.5)) == (300, 400)
+    assert pointer.queries == 1
+    assert cursor.pointer is None
+
+
+def test_gain_scales_motion():
+    """Mouse sensitivity multiplies the cursor's travel"""
+    travel = []
+    for gain in (1.0, 2.0):
+        cursor = CursorMapper(ScreenMapping((0, 0, 1000, 1000)), gain, CountingPointer((100, 100)))
+        cursor.position(hand_at(0.5, 0.5))
+        travel.append(cursor.position(hand_at(0.52, 0.5))[0] - 100)
+    assert travel[1] == pytest.approx(2 * travel[0])
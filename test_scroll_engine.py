@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Tests for the pinch scroll engine
+"""
+
+import sys
+import os
+from collections import namedtuple
+
+import pytest
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import scroll_engine
+from scroll_engine import DEAD_ZONE, WHEEL_DELTA, ScrollEngine
+
+Point = namedtuple('Point', 'x y')
+
+
+class Hand:
+    """A hand result with the pinching fingertip at (x, y)"""
+
+    def __init__(self, x, y):
+        self.landmark = [Point(x, y)] * 21
+
+
+class Pointer:
+    """Records scroll calls"""
+
+    def __init__(self):
+        self.calls = []
+
+    def scroll(self, clicks, _pause=True):
+        self.calls.append(('scroll', clicks, _pause))
+
+    def hscroll(self, clicks, _pause=True):
+        self.calls.append(('hscroll', clicks, _pause))
+
+    def keyDown(self, key, _pause=True):
+        self.calls.append(('key_down', key, _pause))
+
+    def keyUp(self, key, _pause=True):
+        self.calls.append(('key_up', key, _pause))
+
+
+def pinch(engine, start, end, seconds, fps=30):
+    """Hold a pinch moved from start to end for seconds, ticking once per frame"""
+    engine.start(Hand(*start), now=0.0)
+    frames = int(seconds * fps)
+    for frame in range(1, frames + 1):
+        engine.update(Hand(*end))
+        engine.tick(frame / fps)
+    return frames / fps
+
+
+def test_held_pinch_scrolls_at_a_bounded_rate():
+    """Fractional scroll accumulates into evenly spaced events no faster than max_rate"""
+    pointer = Pointer()
+    engine = ScrollEngine(max_rate=10.0, pointer=pointer, unit=1)
+    offset = DEAD_ZONE + 0.1
+    pinch(engine, (0.5, 0.7), (0.5, 0.7 - offset), 2.0)
+    assert all(kind == 'scroll' and amount > 0 and not pause for kind, amount, pause in pointer.calls)
+    assert 18 <= len(pointer.calls) <= 20
+    expected = 0.1 * scroll_engine.NOTCHES_PER_UNIT * 2.0 * WHEEL_DELTA
+    assert sum(amount for _, amount, _ in pointer.calls) == pytest.approx(expected, rel=0.05)
+    assert engine.stats.events == len(pointer.calls)
+    assert engine.stats.latencies == [pytest.approx(1 / 30)]
+
+
+def test_scroll_speed_scales_the_distance():
+    """Doubling Scroll Speed doubles how far a pinch scrolls"""
+    totals = []
+    for speed in (1.0, 2.0):
+        pointer = Pointer()
+        pinch(ScrollEngine(speed=speed, pointer=pointer, unit=1), (0.5, 0.5), (0.5, 0.4), 1.0)
+        totals.append(sum(amount for _, amount, _ in pointer.calls))
+    assert totals[1] == pytest.approx(2 * totals[0], rel=0.05)
+
+
+def test_whole_notch_clicks_carry_the_remainder():
+    """Where a scroll click is a notch, events send whole notches and keep the fraction"""
+    pointer = Pointer()
+    engine = ScrollEngine(max_rate=10.0, pointer=pointer, unit=WHEEL_DELTA)
+    offset = DEAD_ZONE + 0.025
+    pinch(engine, (0.5, 0.7), (0.5, 0.7 - offset), 2.0)
+    clicks = [amount for _, amount, _ in pointer.calls]
+    # 2.5 notches a second: at most one notch per event, none lost to rounding
+    assert set(clicks) == {1}
+    assert len(clicks) == int(0.025 * scroll_engine.NOTCHES_PER_UNIT * 2.0)
+    assert 0 <= engine.pending[1] < 1
+    assert engine.stats.units == len(clicks) * WHEEL_DELTA
+
+
+def test_dead_zone_and_direction():
+    """Small offsets do nothing; leftward and downward pinches scroll negatively"""
+    pointer = Pointer()
+    engine = ScrollEngine(pointer=pointer)
+    pinch(engine, (0.5, 0.5), (0.5 + DEAD_ZONE / 2, 0.5), 1.0)
+    assert pointer.calls == []
+    pinch(engine, (0.5, 0.5), (0.4, 0.5), 0.5)
+    assert pointer.calls and all(amount < 0 for _, amount, _ in pointer.calls)
+    del pointer.calls[:]
+    pinch(engine, (0.5, 0.5), (0.5, 0.6), 0.5)
+    assert pointer.calls and all(kind == 'scroll' and amount < 0 for kind, amount, _ in pointer.calls)
+
+
+def test_horizontal_scroll_is_one_call_per_event(monkeypatch):
+    """Sideways pinches use hscroll, or one chord per coalesced event where hscroll is vertical"""
+    for native in (True, False):
+        monkeypatch.setattr(scroll_engine, 'NATIVE_HSCROLL', native)
+        pointer = Pointer()
+        pinch(ScrollEngine(pointer=pointer), (0.5, 0.5), (0.6, 0.5), 1.0)
+        kinds = [kind for kind, _, _ in pointer.calls]
+        scrolls = kinds.count('hscroll' if native else 'scroll')
+        assert scrolls > 0
+        assert len(kinds) == (scrolls if native else 5 * scrolls)
+
+
+def test_inertia_coasts_to_a_stop_after_release():
+    """Without inertia scrolling stops on release; with it the velocity decays to zero"""
+    results = []
+    for inertia in (False, True):
+        pointer = Pointer()
+        engine = ScrollEngine(inertia=inertia, pointer=pointer, unit=1)
+        now = pinch(engine, (0.5, 0.5), (0.5, 0.35), 0.5)
+        held = len(pointer.calls)
+        engine.release()
+        for frame in range(1, 91):
+            engine.tick(now + frame / 30)
+        results.append(pointer.calls[held:])
+        assert not engine.active
+    assert results[0] == []
+    coast = [amount for _, amount, _ in results[1]]
+    assert len(coast) > 3 and coast[0] >= coast[-1] > 0
+
+
+def test_classic_mode_and_simulated_latency():
+    """The harness measures events and latency; Classic mode keeps Controller's stepped scrolling"""
+    pytest.importorskip("ai_virtual_mouse")
+    from gesture_fixtures import trajectory
+    from simulation import Simulation
+
+    script = (trajectory('PINCH_MINOR', 8, (0.5, 0.7)),
+              trajectory('PINCH_MINOR', 4, (0.5, 0.7), (0.5, 0.6)),
+              trajectory('PINCH_MINOR', 30, (0.5, 0.6)))
+    runs = {}
+    for mode in ("Smooth", "Classic"):
+        with Simulation({'multi_hand_mode': True, 'scroll_mode': mode}) as sim:
+            sim.play(*script)
+        runs[mode] = sim
+    smooth, classic = runs["Smooth"], runs["Classic"]
+    assert smooth.scroll_stats.events == len(smooth.sink.of('scroll')) > 10
+    assert smooth.scroll_stats.gestures == 1
+    assert classic.scroll_stats.events == 0
+    assert all(event.args == (WHEEL_DELTA,) for event in classic.sink.of('scroll'))
+    # Classic waits for the level to settle and every call blocks for pyautogui's pause
+    assert smooth.sink.of('scroll')[0].time < classic.sink.of('scroll')[0].time
+    assert smooth.fps > classic.fps
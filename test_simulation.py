@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for the controller's gesture timing, run on the simulation harness
+"""
+
+import sys
+import os
+import time
+
+import pytest
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+pytest.importorskip("mediapipe")
+pytest.importorskip("ai_virtual_mouse")
+
+import gesture_actions
+from gesture_fixtures import trajectory
+from simulation import FakeClock, InputSink, Simulation, controller_state
+
+FPS = 30
+# HandRecog confirms a gesture on its fifth repeat after the first sighting
+CONFIRM_FRAMES = 6
+
+
+def test_sink_charges_durations_to_the_clock():
+    """Calls are timestamped and block the loop for duration plus pause"""
+    clock = FakeClock()
+    sink = InputSink(clock, pause=0.1)
+    sink.moveTo(100, 200, duration=0.1)
+    sink.doubleClick()
+    assert sink.position() == (100, 200)
+    assert [(e.time, e.kind, e.args) for e in sink.events] == [
+        (0.0, 'move', (100, 200)), (pytest.approx(0.2), 'click', ('left', 2))]
+    assert clock() == pytest.approx(0.3)
+
+
+def test_click_fires_once_when_the_gesture_is_confirmed():
+    """Moving in V_GEST steers the cursor; MID clicks once, on its confirmation frame"""
+    with Simulation() as sim:
+        sim.play(trajectory('V_GEST', 20, (0.4, 0.7), (0.6, 0.7)),
+                 trajectory('MID', 10, (0.6, 0.7)))
+    moves = sim.sink.of('move')
+    assert moves[0].frame == CONFIRM_FRAMES
+    xs = [event.args[0] for event in moves]
+    assert xs == sorted(xs) and xs[-1] > xs[0]
+    assert {event.args[1] for event in moves} == {540}
+
+    clicks = sim.sink.of('click')
+    assert [(e.frame, e.args) for e in clicks] == [(20 + CONFIRM_FRAMES, ('left', 1))]
+    # moveTo's 0.1 s tween plus pyautogui.PAUSE hold the loop well below the camera rate
+    assert moves[1].time - moves[0].time == pytest.approx(0.2)
+    assert sim.fps < FPS / 2
+
+
+def test_drag_releases_when_the_hand_is_lost():
+    """FIST presses the button and losing the hand releases it"""
+    with Simulation(pause=0.0) as sim:
+        sim.play(trajectory('V_GEST', 8, (0.5, 0.7)),
+                 trajectory('FIST', 10, (0.5, 0.7), (0.4, 0.6)),
+                 trajectory('PALM', 2, None))
+    kinds = sim.sink.kinds()
+    assert kinds.count('mouse_down') == kinds.count('mouse_up') == 1
+    assert kinds.index('mouse_down') < kinds.index('mouse_up')
+    assert sim.sink.of('mouse_up')[0].frame == 8 + 10 + 1
+
+
+def test_minor_pinch_scrolls_once_per_stable_level():
+    """In the Classic mode a held vertical pinch scrolls each time its level stays put for five frames"""
+    with Simulation({'multi_hand_mode': True, 'scroll_mode': "Classic"}, pause=0.0) as sim:
+        sim.play(trajectory('PINCH_MINOR', 8, (0.5, 0.7)),
+                 trajectory('PINCH_MINOR', 4, (0.5, 0.7), (0.5, 0.62)),
+                 trajectory('PINCH_MINOR', 20, (0.5, 0.62)))
+    scrolls = sim.sink.of('scroll')
+    assert len(scrolls) >= 2
+    assert all(event.args == (120,) for event in scrolls)
+    assert {b.frame - a.frame for a, b in zip(scrolls, scrolls[1:])} == {5}
+
+
+def test_runs_are_repeatable_fast_and_leave_no_trace():
+    """Identical scripts give identical event streams at thousands of frames per second"""
+    script = [trajectory(label, 10, (0.5, 0.7), (0.55, 0.65))
+              for label in ('V_GEST', 'MID', 'FIST', 'INDEX', 'PALM')] * 80
+    state = controller_state()
+    streams = []
+    for _ in range(2):
+        start = time.perf_counter()
+        with Simulation(pause=0.0) as sim:
+            streams.append(sim.play(*script))
+        elapsed = time.perf_counter() - start
+    assert streams[0] == streams[1]
+    assert len(script) * 10 / elapsed > 1000
+    assert controller_state() == state
+    assert gesture_actions.pyautogui is not sim.sink
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for trace-event recording
+"""
+
+import sys
+import os
+import json
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from tracing import TraceRecorder
+
+
+class StepClock:
+    """Clock advancing one millisecond per reading"""
+
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        self.t += 0.001
+        return self.t
+
+
+def test_disabled_recorder_records_nothing():
+    """Spans are free when tracing is off"""
+    tracer = TraceRecorder()
+    with tracer.span("idle", "tk"):
+        pass
+    assert not tracer.events
+
+
+def test_trace_events_are_bounded_and_loadable(tmp_path):
+    """The buffer keeps the newest events and dumps valid trace JSON"""
+    tracer = TraceRecorder(capacity=5, clock=StepClock())
+    tracer.enabled = True
+    for i in range(10):
+        start = tracer.now()
+        tracer.complete("hands.process", start, "controller pipeline", args={'i': i})
+    with tracer.span("update_dashboard", "tk"):
+        pass
+    assert len(tracer.events) == 5
+
+    path = tracer.dump(str(tmp_path / "trace.json"))
+    with open(path) as f:
+        data = json.load(f)
+    spans = [e for e in data['traceEvents'] if e['ph'] == 'X']
+    names = {e['args']['name'] for e in data['traceEvents'] if e.get('name') == 'thread_name'}
+    assert names == {"controller pipeline", "tk"}
+    assert spans[-1]['name'] == "update_dashboard"
+    assert spans[0]['args'] == {'i': 6}
+    assert abs(spans[0]['dur'] - 1000.0) < 1e-6
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Tests for the hand tracker backends
+"""
+
+import sys
+import os
+import time
+from collections import namedtuple
+
+import pytest
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+np = pytest.importorskip("numpy")
+
+from replay import NO_HANDS
+from settings_profile import TRACKER_BACKENDS, default_settings, migrate_settings
+from trackers import BUILDERS, STUB_BACKEND, build_tracker, convert_task_result
+
+Point = namedtuple('Point', 'x y z')
+Category = namedtuple('Category', 'index score display_name category_name')
+TaskResult = namedtuple('TaskResult', 'handedness hand_landmarks hand_world_landmarks')
+
+
+def stub_settings(**changes):
+    """Default settings selecting the stub backend"""
+    settings = default_settings()
+    settings['tracker_backend'] = "Stub"
+    settings.update(changes)
+    return settings
+
+
+def test_stub_backend_is_deterministic():
+    """Two stub trackers return the same hands for the same frames"""
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    runs = []
+    for _ in range(2):
+        tracker = build_tracker(stub_settings())
+        runs.append([None if not r.multi_hand_landmarks else
+                     [(p.x, p.y) for p in r.multi_hand_landmarks[0].landmark]
+                     for r in (tracker.process(frame) for _ in range(200))])
+        tracker.close()
+    assert runs[0] == runs[1]
+    assert any(runs[0]) and None in runs[0]
+
+
+def test_stub_is_not_a_dashboard_backend():
+    """Saved settings cannot select the stub; only tests, benchmarks and --headless can"""
+    import run_ui
+
+    assert STUB_BACKEND not in TRACKER_BACKENDS
+    assert set(run_ui.TRACKER_CHOICES) == set(BUILDERS)
+    assert migrate_settings({'tracker_backend': STUB_BACKEND})['tracker_backend'] == "Solutions"
+    assert migrate_settings({'tracker_backend': "Tasks"})['tracker_backend'] == "Tasks"
+
+
+def test_task_results_take_the_solutions_shape():
+    """HandLandmarker results convert to multi_hand_landmarks and multi_handedness"""
+    hand = [Point(i / 21, 0.5, 0.0) for i in range(21)]
+    result = TaskResult([[Category(1, 0.9, "Left", "Left")]], [hand], [])
+    converted = convert_task_result(result)
+    assert converted.multi_hand_landmarks[0].landmark[20].x == pytest.approx(20 / 21)
+    classification = converted.multi_handedness[0].classification[0]
+    assert (classification.label, classification.score, classification.index) == ("Left", 0.9, 0)
+    assert convert_task_result(TaskResult([], [], [])) is NO_HANDS
+
+
+def test_tasks_backend_needs_a_local_model(tmp_path):
+    """A missing model file is reported before MediaPipe is loaded, not downloaded"""
+    from trackers import TasksTracker
+
+    with pytest.raises(RuntimeError, match="hand_landmarker.task"):
+        TasksTracker(stub_settings(), model_path=str(tmp_path / "missing.task"))
+
+
+def test_solutions_backend_reports_a_missing_api(monkeypatch):
+    """A MediaPipe without the Solutions API fails the build with RuntimeError"""
+    import types
+
+    monkeypatch.setitem(sys.modules, 'mediapipe', types.ModuleType('mediapipe'))
+    monkeypatch.setitem(sys.modules, 'mediapipe.python', None)
+    with pytest.raises(RuntimeError, match="Solutions API not available"):
+        build_tracker(default_settings())
+
+
+def test_pipeline_runs_on_the_stub_and_survives_a_failed_rebuild():
+    """The backend is chosen by config; a backend that fails to build keeps the current one"""
+    pytest.importorskip("ai_virtual_mouse")
+    from controller_pipeline import ControllerConfig, ControllerPipeline, build_hands
+    from replay import ReplayCapture
+
+    def factory(settings):
+        if settings['tracker_backend'] == "Tasks":
+            raise RuntimeError("no model")
+        return build_hands(settings)
+
+    gestures = []
+    config = ControllerConfig(stub_settings(preview_rate=0, presence_gate=False))
+    pipeline = ControllerPipeline(config, on_gesture=gestures.append, hands_factory=factory)
+    pipeline.drive_controls = False
+    pipeline.poll_config()
+    stub = pipeline.model.current()
+
+    config.update(tracker_backend="Tasks")
+    pipeline.poll_config()
+    deadline = time.monotonic() + 5
+    while pipeline.model.builder is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert pipeline.model.current() is stub
+
+    pipeline.run(ReplayCapture(120, width=64, height=48), lambda: True)
+    assert len(set(gestures)) > 3
+
+
+def test_setting_reverted_mid_build_keeps_the_current_tracker():
+    """A build finishing after its setting was reverted is closed, not swapped in"""
+    import threading
+
+    pytest.importorskip("ai_virtual_mouse")
+    from controller_pipeline import HandsModel
+
+    class Hands:
+        def __init__(self, backend):
+            self.backend = backend
+            self.closed = False
+
+        def close(self):
+            self.closed = True
+
+    started, release = threading.Event(), threading.Event()
+    built = []
+
+    def slow_factory(settings):
+        hands = Hands(settings['tracker_backend'])
+        if built:
+            started.set()
+            release.wait(5)
+        built.append(hands)
+        return hands
+
+    model = HandsModel(stub_settings(), slow_factory)
+    stub = model.current()
+    model.request(stub_settings(tracker_backend="Tasks"))
+    assert started.wait(5)
+    model.request(stub_settings())
+    release.set()
+    deadline = time.monotonic() + 5
+    while model.builder is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert model.current() is stub and not stub.closed
+    assert model.rebuild_count == 0
+    assert [hands.backend for hands in built] == ["Stub", "Tasks"] and built[1].closed
+
+
+def test_build_finishing_after_close_is_closed():
+    """Closing the model while a build is running leaves nothing open"""
+    import threading
+
+    pytest.importorskip("ai_virtual_mouse")
+    from controller_pipeline import HandsModel
+
+    class Hands:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    started, release = threading.Event(), threading.Event()
+    built = []
+
+    def slow_factory(settings):
+        if built:
+            started.set()
+            release.wait(5)
+        built.append(Hands())
+        return built[-1]
+
+    model = HandsModel(stub_settings(), slow_factory)
+    model.request(stub_settings(tracker_backend="Tasks"))
+    assert started.wait(5)
+    model.close()
+    release.set()
+    deadline = time.monotonic() + 5
+    while model.builder is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert model.ready is None
+    assert len(built) == 2 and all(hands.closed for hands in built)
+
+
+def test_benchmark_compares_available_backends():
+    """Unavailable backends are skipped and the stub keeps up with the camera"""
+    from benchmarks.tracker_benchmark import check_report, format_report, load_frames, run_benchmark
+
+    report = run_benchmark(load_frames(count=20, size=(64, 48)), camera_fps=200.0)
+    assert check_report(report) == []
+    stub = [stats for stats in report['backends'] if stats['backend'] == "Stub"][0]
+    assert stub['frames'] == 20 and stub['frames_with_hands'] > 0
+    assert "Stub" in format_report(report)
@@ -0,0 +1,115 @@
+"""
+Chrome trace-event recording for the controller pipeline and the Tk UI.
+
+Events are kept in a bounded in-memory ring buffer and written on demand as
+Trace Event Format JSON, which chrome://tracing and ui.perfetto.dev open
+directly. Each track (pipeline stages, Tk callbacks) is a named thread row.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+
+DEFAULT_CAPACITY = 200000
+TRACES_DIR = "traces"
+TK_TRACK = "tk main thread"
+
+
+class TraceRecorder:
+    """Bounded buffer of complete ('X') trace events.
+
+    Hot paths check ``enabled`` once and pass start timestamps from now()
+    to complete(), so a disabled recorder costs a single attribute read.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, clock=time.perf_counter):
+        """Initialize a disabled recorder"""
+        self.events = deque(maxlen=capacity)
+        self.clock = clock
+        self.enabled = False
+        self.pid = os.getpid()
+        self.tracks = {}
+        self.lock = threading.Lock()
+
+    def now(self):
+        """Return the current time in trace clock seconds"""
+        return self.clock()
+
+    def track(self, name):
+        """Return the trace thread id for a named track"""
+        tid = self.tracks.get(name)
+        if tid is None:
+            with self.lock:
+                tid = self.tracks.setdefault(name, len(self.tracks) + 1)
+        return tid
+
+    def complete(self, name, start, track, end=None, args=None):
+        """Record a span that started at start (from now()) and ends now"""
+        if end is None:
+            end = self.clock()
+        event = {'name': name, 'ph': 'X', 'pid': self.pid, 'tid': self.track(track),
+                 'ts': start * 1e6, 'dur': (end - start) * 1e6}
+        if args:
+            event['args'] = args
+        self.events.append(event)
+
+    def span(self, name, track, args=None):
+        """Context manager recording a span around a block"""
+        return _Span(self, name, track, args)
+
+    def instant(self, name, track, args=None):
+        """Record an instant event"""
+        event = {'name': name, 'ph': 'i', 's': 't', 'pid': self.pid,
+                 'tid': self.track(track), 'ts': self.clock() * 1e6}
+        if args:
+            event['args'] = args
+        self.events.append(event)
+
+    def clear(self):
+        """Drop all recorded events"""
+        self.events.clear()
+
+    def to_json(self):
+        """Return the buffer as a Trace Event Format dict"""
+        metadata = [{'name': 'process_name', 'ph': 'M', 'pid': self.pid,
+                     'args': {'name': "AI Virtual Mouse"}}]
+        for name, tid in list(self.tracks.items()):
+            metadata.append({'name': 'thread_name', 'ph': 'M', 'pid': self.pid,
+                             'tid': tid, 'args': {'name': name}})
+            metadata.append({'name': 'thread_sort_index', 'ph': 'M', 'pid': self.pid,
+                             'tid': tid, 'args': {'sort_index': tid}})
+        return {'traceEvents': metadata + list(self.events), 'displayTimeUnit': 'ms'}
+
+    def dump(self, path=None):
+        """Write the buffer to path (default: traces/trace-<time>.json) and return the path"""
+        if path is None:
+            os.makedirs(TRACES_DIR, exist_ok=True)
+            path = os.path.join(TRACES_DIR, time.strftime("trace-%Y%m%d-%H%M%S.json"))
+        with open(path, 'w') as f:
+            json.dump(self.to_json(), f)
+        return path
+
+
+class _Span:
+    """Context manager behind TraceRecorder.span()"""
+
+    __slots__ = ('recorder', 'name', 'track', 'args', 'start')
+
+    def __init__(self, recorder, name, track, args):
+        self.recorder = recorder
+        self.name = name
+        self.track = track
+        self.args = args
+        self.start = None
+
+    def __enter__(self):
+        if self.recorder.enabled:
+            self.start = self.recorder.clock()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.start is not None:
+            self.recorder.complete(self.name, self.start, self.track, args=self.args)
+        return False
@@ -0,0 +1,159 @@
+"""
+Hand tracker backends.
+
+A tracker has process(rgb_image), returning an object with MediaPipe
+Solutions' ``multi_hand_landmarks`` and ``multi_handedness`` fields, and
+close(). The pipeline builds one through build_tracker(), which picks the
+backend named by the ``tracker_backend`` setting:
+
+Solutions  MediaPipe's legacy Hands graph, called synchronously (default).
+Tasks      MediaPipe Tasks' HandLandmarker in LIVE_STREAM mode. Frames are
+           submitted with detect_async and process() returns the newest
+           finished result, so inference overlaps with capturing the next
+           frame at the cost of about a frame of latency. Needs a local
+           ``hand_landmarker.task`` model; nothing is downloaded.
+Stub       Loops a deterministic synthetic gesture script; needs no
+           MediaPipe. For tests, benchmarks and ``run_ui.py --headless``
+           only: the dashboard does not offer it, since the script would
+           drive the real desktop.
+
+MediaPipe is only imported when its backend is built.
+"""
+
+import os
+import threading
+import time
+
+from replay import (Classification, Handedness, HandResults, NO_HANDS, ReplayHands,
+                    results_from_sequences)
+
+MODEL_ENV_VAR = "VIRTUAL_MOUSE_HAND_MODEL"
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  "models", "hand_landmarker.task")
+
+
+def task_model_path():
+    """Return the HandLandmarker model to load, from the environment or the models directory"""
+    return os.environ.get(MODEL_ENV_VAR) or DEFAULT_MODEL_PATH
+
+
+def build_solutions_tracker(settings):
+    """Build a MediaPipe Solutions Hands graph for the given settings"""
+    try:
+        import mediapipe.python.solutions.hands as mp_hands
+    except ImportError:
+        import mediapipe as mp
+        if not hasattr(mp, 'solutions'):
+            raise RuntimeError(f"MediaPipe Solutions API not available in mediapipe "
+                               f"{getattr(mp, '__version__', '?')}; choose the Tasks tracker")
+        mp_hands = mp.solutions.hands  # type: ignore
+    return mp_hands.Hands(max_num_hands=2 if settings['multi_hand_mode'] else 1,  # type: ignore
+                          model_complexity=settings['model_complexity'],
+                          min_detection_confidence=settings['hand_detection_confidence'],
+                          min_tracking_confidence=settings['tracking_confidence'])
+
+
+class TaskLandmarks:
+    """A HandLandmarker hand in the shape of a Solutions NormalizedLandmarkList"""
+
+    __slots__ = ('landmark',)
+
+    def __init__(self, landmarks):
+        """Wrap a list of NormalizedLandmarks"""
+        self.landmark = landmarks
+
+
+def convert_task_result(result):
+    """Turn a HandLandmarkerResult into Solutions-style HandResults"""
+    if not result.hand_landmarks:
+        return NO_HANDS
+    handedness = []
+    for index, categories in enumerate(result.handedness):
+        best = categories[0]
+        handedness.append(Handedness([Classification(best.category_name, best.score, index)]))
+    return HandResults([TaskLandmarks(hand) for hand in result.hand_landmarks], handedness)
+
+
+class TasksTracker:
+    """HandLandmarker in LIVE_STREAM mode behind the synchronous process() interface"""
+
+    def __init__(self, settings, model_path=None, clock=time.monotonic):
+        """Create the landmarker; raises RuntimeError if the model file is missing"""
+        model_path = model_path or task_model_path()
+        if not os.path.isfile(model_path):
+            raise RuntimeError(f"Hand landmarker model not found at {model_path}; "
+                               f"download hand_landmarker.task there or set {MODEL_ENV_VAR}")
+        import mediapipe as mp
+        from mediapipe.tasks import python as mp_tasks
+        from mediapipe.tasks.python import vision
+
+        self.mp = mp
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.latest = NO_HANDS
+        self.latest_timestamp = -1
+        self.timestamp = -1
+        self.submitted = 0
+        self.completed = 0
+        options = vision.HandLandmarkerOptions(
+            base_options=mp_tasks.BaseOptions(model_asset_path=model_path),
+            running_mode=vision.RunningMode.LIVE_STREAM,
+            num_hands=2 if settings['multi_hand_mode'] else 1,
+            min_hand_detection_confidence=settings['hand_detection_confidence'],
+            min_hand_presence_confidence=settings['hand_detection_confidence'],
+            min_tracking_confidence=settings['tracking_confidence'],
+            result_callback=self.on_result)
+        self.landmarker = vision.HandLandmarker.create_from_options(options)
+
+    def on_result(self, result, image, timestamp_ms):
+        """Keep the newest result; called on MediaPipe's thread"""
+        converted = convert_task_result(result)
+        with self.lock:
+            if timestamp_ms > self.latest_timestamp:
+                self.latest, self.latest_timestamp = converted, timestamp_ms
+            self.completed += 1
+
+    def process(self, image):
+        """Submit image for tracking and return the newest finished result"""
+        # LIVE_STREAM needs strictly increasing timestamps
+        self.timestamp = max(self.timestamp + 1, int(self.clock() * 1000))
+        frame = self.mp.Image(image_format=self.mp.ImageFormat.SRGB, data=image)
+        self.landmarker.detect_async(frame, self.timestamp)
+        self.submitted += 1
+        with self.lock:
+            return self.latest
+
+    @property
+    def lag_ms(self):
+        """Milliseconds between the newest submitted frame and the newest result"""
+        with self.lock:
+            return self.timestamp - self.latest_timestamp if self.latest_timestamp >= 0 else None
+
+    def close(self):
+        """Stop the landmarker"""
+        self.landmarker.close()
+
+
+def stub_results():
+    """Return the stub backend's script: every gesture, held long enough to confirm"""
+    from gesture_fixtures import synthetic_corpus
+    return results_from_sequences(synthetic_corpus(per_label=1, frames=12))
+
+
+def build_stub_tracker(settings):
+    """Build a tracker that loops the deterministic stub script"""
+    return ReplayHands(stub_results(), loop=True)
+
+
+STUB_BACKEND = "Stub"
+BUILDERS = {
+    "Solutions": build_solutions_tracker,
+    "Tasks": TasksTracker,
+    STUB_BACKEND: build_stub_tracker,
+}
+
+
+def build_tracker(settings):
+    """Build the tracker backend named by settings; unknown names use Solutions"""
+    builder = BUILDERS.get(settings.get('tracker_backend'), build_solutions_tracker)
+    return builder(settings)
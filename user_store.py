@@ -0,0 +1,158 @@
+"""
+User accounts: password hashes, profile images, settings and custom gesture
+templates stored in users/users.json. Kept free of Tk so headless tools can
+load the same profiles; the login windows live in auth.py.
+"""
+
+import json
+import os
+import hashlib
+import hmac
+import threading
+from settings_profile import migrate_settings, serialize_settings
+
+USERS_DIR = "users"
+USER_IMAGES_DIR = os.path.join(USERS_DIR, "images")
+USER_DATA_FILE = os.path.join(USERS_DIR, "users.json")
+
+# PBKDF2 iteration count for new password hashes; raise it on faster machines
+DEFAULT_HASH_ITERATIONS = 200000
+HASH_SCHEME = "pbkdf2_sha256"
+
+os.makedirs(USERS_DIR, exist_ok=True)
+os.makedirs(USER_IMAGES_DIR, exist_ok=True)
+
+class AuthenticationManager:
+    def __init__(self, hash_iterations=DEFAULT_HASH_ITERATIONS, data_file=USER_DATA_FILE):
+        """Initialize the authentication manager"""
+        self.current_user = None
+        self.hash_iterations = hash_iterations
+        self.data_file = data_file
+        # Guards self.users and the JSON file; methods may run on worker threads
+        self.lock = threading.RLock()
+        self.load_users()
+    
+    def load_users(self):
+        """Load users from JSON file"""
+        with self.lock:
+            if os.path.exists(self.data_file):
+                try:
+                    with open(self.data_file, 'r') as f:
+                        self.users = json.load(f)
+                except:
+                    self.users = {}
+            else:
+                self.users = {}
+    
+    def save_users(self):
+        """Save users to JSON file"""
+        with self.lock:
+            tmp_file = self.data_file + ".tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(self.users, f, indent=2)
+            os.replace(tmp_file, self.data_file)
+    
+    def hash_password(self, password, salt=None, iterations=None):
+        """Hash password using salted PBKDF2-SHA256"""
+        if salt is None:
+            salt = os.urandom(16)
+        if iterations is None:
+            iterations = self.hash_iterations
+        digest = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, iterations)
+        return f"{HASH_SCHEME}${iterations}${salt.hex()}${digest.hex()}"
+    
+    def verify_password(self, password, stored_hash):
+        """Check password against a stored PBKDF2 or legacy SHA-256 hash"""
+        if stored_hash.startswith(HASH_SCHEME + "$"):
+            try:
+                _, iterations, salt, _ = stored_hash.split("$")
+                candidate = self.hash_password(password, bytes.fromhex(salt), int(iterations))
+            except ValueError:
+                return False
+        else:
+            candidate = hashlib.sha256(password.encode()).hexdigest()
+        return hmac.compare_digest(candidate, stored_hash)
+    
+    def user_exists(self, username):
+        """Check if user exists"""
+        return username in self.users
+    
+    def add_user(self, username, password):
+        """Add a new user"""
+        if self.user_exists(username):
+            return False, "User already exists"
+        
+        hashed_password = self.hash_password(password)
+        with self.lock:
+            if self.user_exists(username):
+                return False, "User already exists"
+            self.users[username] = {
+                'password': hashed_password,
+                'image_path': None
+            }
+            self.save_users()
+        return True, "User registered successfully"
+    
+    def authenticate_user(self, username, password):
+        """Authenticate user with username and password"""
+        if not self.user_exists(username):
+            return False, "User not found"
+        
+        if self.verify_password(password, self.users[username]['password']):
+            self.current_user = username
+            return True, "Login successful"
+        else:
+            return False, "Incorrect password"
+    
+    def logout_user(self):
+        """Logout current user"""
+        self.current_user = None
+    
+    def get_current_user(self):
+        """Get current logged in user"""
+        return self.current_user
+    
+    def get_user_image_path(self, username):
+        """Get user's image path"""
+        if self.user_exists(username):
+            return self.users[username].get('image_path')
+        return None
+    
+    def set_user_image(self, username, image_path):
+        """Set user's image path"""
+        with self.lock:
+            if self.user_exists(username):
+                self.users[username]['image_path'] = image_path
+                self.save_users()
+                return True
+        return False
+    
+    def get_user_settings(self, username, base=None):
+        """Get user's controller settings, upgraded to the current version"""
+        if self.user_exists(username):
+            return migrate_settings(self.users[username].get('settings'), base)
+        return migrate_settings(None, base)
+    
+    def set_user_settings(self, username, settings, base=None):
+        """Persist user's controller settings; performance keys matching base are not stored"""
+        with self.lock:
+            if self.user_exists(username):
+                self.users[username]['settings'] = serialize_settings(settings, base)
+                self.save_users()
+                return True
+        return False
+
+    def get_gesture_templates(self, username):
+        """Get user's custom gesture templates in their stored form"""
+        if self.user_exists(username):
+            return self.users[username].get('gesture_templates', [])
+        return []
+
+    def set_gesture_templates(self, username, templates):
+        """Persist user's custom gesture templates"""
+        with self.lock:
+            if self.user_exists(username):
+                self.users[username]['gesture_templates'] = templates
+                self.save_users()
+                return True
+        return False
@@ -2,7 +2,6 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
 import cv2
-import mediapipe as mp
 import pyautogui
 import math
 from enum import IntEnum
@@ -10,28 +9,38 @@ from ctypes import cast, POINTER
 from comtypes import CLSCTX_ALL
 from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
 import screen_brightness_control as sbcontrol
-from google.protobuf.json_format import MessageToDict
 import time
 import webbrowser
 import os
 import numpy as np
 from PIL import Image, ImageTk
-from ai_virtual_mouse import Gest, HLabel, HandRecog, Controller, GestureController
-from auth import AuthenticationManager
-
-try:
-    import mediapipe.python.solutions.drawing_utils as drawing_utils
-    import mediapipe.python.solutions.hands as hands_module
-    mp_drawing = drawing_utils
-    mp_hands = hands_module
-except ImportError:
-    
-    mp_drawing = mp.solutions.drawing_utils  # type: ignore
-    mp_hands = mp.solutions.hands  # type: ignore
+from auth import AuthenticationManager, USER_IMAGES_DIR
+from auth_service import AsyncAuthService
+from image_cache import PhotoImageCache, PROFILE_THUMBNAIL_SIZE, save_user_image
+from settings_profile import (CAMERA_MODES, INFERENCE_WIDTHS, PREVIEW_RATES, PREVIEW_WIDTHS,
+                              MODEL_COMPLEXITIES, INFERENCE_STRIDES, IDLE_TIMEOUTS, ACTIVE_REGIONS,
+                              DOMINANT_HANDS, SCROLL_MODES, TRACKER_BACKENDS, PERFORMANCE_KEYS,
+                              default_settings)
+from controller_pipeline import ControllerConfig, ControllerPipeline
+from autotune import calibrate, load_machine_profile, save_machine_profile, machine_settings
+from profiling import MemoryProfiler, profiling_requested
+from tracing import TraceRecorder, TK_TRACK
+from custom_gestures import (SAMPLES_PER_GESTURE, TemplateMatcher, landmark_array,
+                             normalize_landmarks)
+from gesture_actions import CUSTOM_ACTIONS
+from metrics import MetricsRegistry, MetricsServer, PipelineMetrics, metrics_port_from_env
+from analytics import DashboardAnalytics, Sparkline, format_ms
+from power import format_duration
+from lazy_tabs import LazyNotebook
 
 class VirtualMouseUI:
-    def __init__(self, root):
+    def __init__(self, root, autostart=False, launch_settings=None, camera_index=0):
         self.root = root
+        # Launcher options: start the controller after login, override the
+        # user's saved settings with a named profile, pick the camera
+        self.autostart = autostart
+        self.launch_settings = launch_settings
+        self.camera_index = camera_index
         self.root.title("AI Virtual Mouse Controller")
         self.root.geometry("1200x800")
         self.root.minsize(1000, 700)
@@ -39,9 +48,11 @@ class VirtualMouseUI:
         
 
         self.auth_manager = AuthenticationManager()
+        self.auth_service = AsyncAuthService(self.root, self.auth_manager)
         
         self.is_running = False
         self.gesture_controller = None
+        self.pipeline = None
         self.update_thread = None
         self.stats = {
             'fist_count': 0,
@@ -53,22 +64,66 @@ class VirtualMouseUI:
             'double_click_count': 0
         }
         
-
-        self.prev_gest_major = None
-        self.prev_gest_minor = None
-        
         # Settings variables
         self.multi_hand_mode = tk.BooleanVar(value=True)
         self.hand_detection_confidence = tk.DoubleVar(value=0.7)
         self.tracking_confidence = tk.DoubleVar(value=0.7)
         self.show_landmarks_var = tk.BooleanVar(value=True)
         self.mouse_sensitivity = tk.DoubleVar(value=1.0)
+        self.active_region = tk.IntVar(value=100)
+        self.aspect_correction = tk.BooleanVar(value=True)
         self.scroll_speed = tk.DoubleVar(value=1.0)
+        self.scroll_mode = tk.StringVar(value="Smooth")
         self.click_delay = tk.DoubleVar(value=0.3)
         self.gesture_mode = tk.StringVar(value="Basic")
+        self.dominant_hand = tk.StringVar(value="Right")
         self.theme_color = tk.StringVar(value="Blue")
         self.autoclick_enabled = tk.BooleanVar(value=False)
         self.autoclick_delay = tk.DoubleVar(value=1.0)
+        self.camera_mode = tk.StringVar(value="640x480@30")
+        self.inference_width = tk.IntVar(value=0)
+        self.preview_rate = tk.IntVar(value=30)
+        self.preview_width = tk.IntVar(value=0)
+        self.model_complexity = tk.IntVar(value=1)
+        self.inference_stride = tk.IntVar(value=1)
+        self.tracker_backend = tk.StringVar(value="Solutions")
+        self.presence_gate = tk.BooleanVar(value=True)
+        self.gesture_cache = tk.BooleanVar(value=True)
+        self.idle_timeout = tk.IntVar(value=30)
+        
+        # Persisted settings keys and the variables holding them
+        self.settings_vars = {
+            'multi_hand_mode': self.multi_hand_mode,
+            'hand_detection_confidence': self.hand_detection_confidence,
+            'tracking_confidence': self.tracking_confidence,
+            'show_landmarks': self.show_landmarks_var,
+            'mouse_sensitivity': self.mouse_sensitivity,
+            'active_region': self.active_region,
+            'aspect_correction': self.aspect_correction,
+            'scroll_speed': self.scroll_speed,
+            'scroll_mode': self.scroll_mode,
+            'click_delay': self.click_delay,
+            'gesture_mode': self.gesture_mode,
+            'dominant_hand': self.dominant_hand,
+            'theme_color': self.theme_color,
+            'autoclick_enabled': self.autoclick_enabled,
+            'autoclick_delay': self.autoclick_delay,
+            'camera_mode': self.camera_mode,
+            'inference_width': self.inference_width,
+            'preview_rate': self.preview_rate,
+            'preview_width': self.preview_width,
+            'model_complexity': self.model_complexity,
+            'inference_stride': self.inference_stride,
+            'tracker_backend': self.tracker_backend,
+            'presence_gate': self.presence_gate,
+            'gesture_cache': self.gesture_cache,
+            'idle_timeout': self.idle_timeout,
+        }
+        
+        # Settings changes reach a running controller through this channel
+        self.controller_config = ControllerConfig(self.collect_settings())
+        for key, var in self.settings_vars.items():
+            var.trace_add('write', lambda *args, key=key: self.push_setting(key))
         
         self.fist_count_var = tk.StringVar(value="0")
         self.pinch_count_var = tk.StringVar(value="0")
@@ -77,8 +132,39 @@ class VirtualMouseUI:
         self.right_click_count_var = tk.StringVar(value="0")
         self.double_click_count_var = tk.StringVar(value="0")
         self.scroll_count_var = tk.StringVar(value="0")
+        self.power_var = tk.StringVar(value="Stopped")
+        # Rolling last-minute analytics fed by the controller thread
+        self.analytics = DashboardAnalytics()
+        self.gesture_rate_var = tk.StringVar(value="-")
+        self.click_latency_var = tk.StringVar(value="-")
+        self.frame_latency_var = tk.StringVar(value="-")
+        self.gesture_time_var = tk.StringVar(value="-")
+        self.sparklines = {}
+        
+        # Custom gestures recorded by the current user
+        self.custom_gestures = TemplateMatcher()
+        self.custom_name = tk.StringVar()
+        self.custom_action = tk.StringVar(value=next(iter(CUSTOM_ACTIONS)))
+        self.custom_samples = []
+        self.custom_samples_var = tk.StringVar(value=f"0/{SAMPLES_PER_GESTURE} samples")
   
         self.image_references = []
+        self.photo_cache = PhotoImageCache()
+        # Set VIRTUAL_MOUSE_PROFILE_MEMORY=1 to log per-frame allocations and RSS
+        self.profile_memory = profiling_requested()
+        self.preview_profiler = None
+        # perf_counter() times of pressing Login and of its success
+        self.login_started = self.login_succeeded = None
+        # Timeline trace of pipeline stages and Tk callbacks, toggled from the dashboard
+        self.tracer = TraceRecorder()
+        self.trace_enabled = tk.BooleanVar(value=False)
+        self.trace_enabled.trace_add('write', lambda *args: self.toggle_trace())
+        # Set VIRTUAL_MOUSE_METRICS_PORT to serve Prometheus metrics on localhost
+        self.pipeline_metrics = None
+        self.metrics_server = None
+        # Session totals for the metrics endpoint; unlike stats, never reset
+        self.gesture_counters = {}
+        self.start_metrics_server(metrics_port_from_env())
      
         self.show_authentication_popup()
     
@@ -158,10 +244,10 @@ class VirtualMouseUI:
         self.login_status_label.pack(pady=10)
         
         # Login button
-        login_button = tk.Button(form_frame, text="Login", font=("Arial", 12, "bold"),
-                                bg="#3498db", fg="white", width=15, height=1,
-                                command=self.authenticate_user)
-        login_button.pack(pady=15)
+        self.login_button = tk.Button(form_frame, text="Login", font=("Arial", 12, "bold"),
+                                      bg="#3498db", fg="white", width=15, height=1,
+                                      command=self.authenticate_user)
+        self.login_button.pack(pady=15)
         
         # Bind Enter key to login
         self.password_entry.bind('<Return>', lambda event: self.authenticate_user())
@@ -214,16 +300,29 @@ class VirtualMouseUI:
         self.register_status_label.pack(pady=10)
         
         # Register button
-        register_button = tk.Button(form_frame, text="Register", font=("Arial", 12, "bold"),
-                                   bg="#27ae60", fg="white", width=15, height=1,
-                                   command=self.register_user)
-        register_button.pack(pady=15)
+        self.register_button = tk.Button(form_frame, text="Register", font=("Arial", 12, "bold"),
+                                         bg="#27ae60", fg="white", width=15, height=1,
+                                         command=self.register_user)
+        self.register_button.pack(pady=15)
         
         # Bind Enter key to register
         self.reg_confirm_entry.bind('<Return>', lambda event: self.register_user())
     
+    def auth_pending(self):
+        """Return True while a login or registration is being hashed"""
+        return str(self.login_button['state']) == tk.DISABLED
+
+    def set_auth_pending(self, pending):
+        """Disable the login and register buttons while a request is on the worker pool"""
+        state = tk.DISABLED if pending else tk.NORMAL
+        self.login_button.config(state=state)
+        self.register_button.config(state=state)
+
     def authenticate_user(self):
         """Handle login"""
+        # Enter still fires while the buttons are disabled
+        if self.auth_pending():
+            return
         username = self.username_entry.get().strip()
         password = self.password_entry.get()
         
@@ -231,17 +330,30 @@ class VirtualMouseUI:
             self.login_status_label.config(text="Please enter both username and password", fg="#e74c3c")
             return
         
-        # Authenticate user
-        success, message = self.auth_manager.authenticate_user(username, password)
+        # Hashing runs on the auth worker pool so the UI stays responsive
+        self.login_status_label.config(text="Signing in...", fg="#f5f0e1")
+        self.login_started = time.perf_counter()
+        self.set_auth_pending(True)
+        self.auth_service.authenticate(username, password, self.on_authenticate_result)
+    
+    def on_authenticate_result(self, success, message):
+        """Handle the login result delivered on the Tk thread"""
+        if not self.login_status_label.winfo_exists():
+            return
         if success:
+            self.login_succeeded = time.perf_counter()
+            # The buttons stay disabled until the login form is replaced
             self.login_status_label.config(text=message, fg="#27ae60")
          
             self.root.after(1000, self.show_image_capture_popup)
         else:
+            self.set_auth_pending(False)
             self.login_status_label.config(text=message, fg="#e74c3c")
     
     def register_user(self):
         """Handle registration"""
+        if self.auth_pending():
+            return
         username = self.reg_username_entry.get().strip()
         password = self.reg_password_entry.get()
         confirm_password = self.reg_confirm_entry.get()
@@ -254,8 +366,15 @@ class VirtualMouseUI:
             self.register_status_label.config(text="Passwords do not match", fg="#e74c3c")
             return
         
-   
-        success, message = self.auth_manager.add_user(username, password)
+        self.register_status_label.config(text="Creating account...", fg="#f5f0e1")
+        self.set_auth_pending(True)
+        self.auth_service.register(username, password, self.on_register_result)
+    
+    def on_register_result(self, success, message):
+        """Handle the registration result delivered on the Tk thread"""
+        if not self.register_status_label.winfo_exists():
+            return
+        self.set_auth_pending(False)
         if success:
             self.register_status_label.config(text=message, fg="#27ae60")
          
@@ -319,6 +438,9 @@ class VirtualMouseUI:
         
         # Video capture
         self.cap = cv2.VideoCapture(0)
+        if self.profile_memory:
+            self.preview_profiler = MemoryProfiler(interval=100, name="capture preview", log=print)
+            self.preview_profiler.start()
         
         # Start video update
         self.update_frame()
@@ -326,18 +448,24 @@ class VirtualMouseUI:
     def update_frame(self):
         """Update video frame"""
         if hasattr(self, 'capture_frame') and self.capture_frame.winfo_exists():
-            ret, frame = self.cap.read()
-            if ret:
-            
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                frame_resized = cv2.resize(frame_rgb, (300, 200))
-                img = Image.fromarray(frame_resized)
-                imgtk = ImageTk.PhotoImage(image=img)
-                self.video_label.configure(image=imgtk)
-                self.image_references.append(imgtk)
-  
+            with self.tracer.span("capture preview paint", TK_TRACK):
+                self.paint_capture_preview()
             self.capture_frame.after(10, self.update_frame)
     
+    def paint_capture_preview(self):
+        """Show the latest camera frame in the capture popup"""
+        ret, frame = self.cap.read()
+        if ret:
+            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            frame_resized = cv2.resize(frame_rgb, (300, 200))
+            img = Image.fromarray(frame_resized)
+            imgtk = ImageTk.PhotoImage(image=img)
+            self.video_label.configure(image=imgtk)
+            # Keep only the frame on screen alive; older frames can be freed
+            self.video_label.image = imgtk
+            if self.preview_profiler:
+                self.preview_profiler.frame()
+    
     def capture_image(self):
         """Capture and save user image"""
         ret, frame = self.cap.read()
@@ -347,10 +475,10 @@ class VirtualMouseUI:
             
             # Create image path
             image_filename = f"{username}.jpg"
-            image_path = os.path.join("users", "images", image_filename)
+            image_path = os.path.join(USER_IMAGES_DIR, image_filename)
             
-            # Save image
-            cv2.imwrite(image_path, frame)
+            # Save image along with the thumbnails the UI displays
+            save_user_image(frame, image_path)
             
             # Update user data
             self.auth_manager.set_user_image(username, image_path)
@@ -360,26 +488,74 @@ class VirtualMouseUI:
             # Close window and proceed
             self.root.after(1000, self.finish_authentication)
     
+    def stop_preview_profiler(self):
+        """Report and stop the capture preview profiler"""
+        if self.preview_profiler:
+            self.preview_profiler.collect()
+            self.preview_profiler.stop()
+            self.preview_profiler = None
+
     def skip_capture(self):
         """Skip image capture"""
+        started = time.perf_counter()
+        self.stop_preview_profiler()
         self.cap.release()
         self.capture_frame.destroy()
         self.overlay_frame.destroy()
-        self.create_main_ui()
+        self.create_main_ui(started)
     
     def finish_authentication(self):
         """Finish authentication and show main UI"""
+        started = time.perf_counter()
+        self.stop_preview_profiler()
         self.cap.release()
         self.capture_frame.destroy()
         self.overlay_frame.destroy()
-        self.create_main_ui()
+        self.create_main_ui(started)
     
-    def create_main_ui(self):
-        """Create the main UI after successful authentication"""
+    def create_main_ui(self, started=None):
+        """Create the main UI after successful authentication.
 
+        started is when the photo prompt was dismissed, before its window
+        was torn down.
+        """
+        if started is None:
+            started = time.perf_counter()
         self.image_references.clear()
+        username = self.auth_manager.get_current_user()
+        if self.launch_settings is not None:
+            self.apply_settings(self.launch_settings)
+        else:
+            self.apply_settings(self.auth_manager.get_user_settings(username, machine_settings()))
+        self.custom_gestures = TemplateMatcher.from_profile(self.auth_manager.get_gesture_templates(username))
         self.create_widgets()
         self.update_dashboard()
+        # Idle callbacks run once the dashboard has been laid out and drawn
+        self.root.after_idle(lambda: self.report_interactive(started))
+        if self.autostart:
+            self.root.after(0, self.start_controller)
+    
+    def report_interactive(self, started):
+        """Log how long the dashboard took to become usable after login.
+
+        The total is the sign-in round trip plus the time from dismissing the
+        photo prompt to the drawn dashboard; time spent on the prompt and the
+        status message delay before it are left out.
+        """
+        end = time.perf_counter()
+        sign_in = 0.0
+        if self.login_started is not None and self.login_succeeded is not None:
+            sign_in = self.login_succeeded - self.login_started
+        if self.tracer.enabled:
+            if sign_in:
+                self.tracer.complete("sign in", self.login_started, TK_TRACK, self.login_succeeded)
+            self.tracer.complete("teardown to interactive", started, TK_TRACK, end)
+        print(f"Dashboard interactive {(sign_in + end - started) * 1000:.0f} ms after login "
+              f"(sign-in {sign_in * 1000:.0f} ms)")
+    
+    def report_tab_built(self, name, seconds):
+        """Log the first build of a lazily created tab"""
+        print(f"Built {name} tab in {seconds * 1000:.0f} ms")
     
     def create_widgets(self):
         """Create all UI widgets"""
@@ -409,15 +585,12 @@ class VirtualMouseUI:
 
         dashboard_tab = tk.Frame(tab_control, bg="#1e3d59")
         tab_control.add(dashboard_tab, text="Dashboard")
- 
-        settings_tab = tk.Frame(tab_control, bg="#1e3d59")
-        tab_control.add(settings_tab, text="Settings")
-
-        help_tab = tk.Frame(tab_control, bg="#1e3d59")
-        tab_control.add(help_tab, text="Help & Instructions")
         self.create_dashboard_tab(dashboard_tab)
-        self.create_settings_tab(settings_tab)
-        self.create_help_tab(help_tab)
+ 
+        # Settings and Help are built when first opened
+        tabs = LazyNotebook(tab_control, self.tracer, TK_TRACK, self.report_tab_built)
+        tabs.add(tk.Frame(tab_control, bg="#1e3d59"), self.create_settings_tab, text="Settings")
+        tabs.add(tk.Frame(tab_control, bg="#1e3d59"), self.create_help_tab, text="Help & Instructions")
     
     def create_dashboard_tab(self, parent):
         """Create the dashboard tab"""
@@ -445,6 +618,20 @@ class VirtualMouseUI:
                                 bg="#3498db", fg="white", font=("Arial", 12, "bold"),
                                 command=self.reset_statistics, width=20, height=2)
         reset_button.pack(pady=5)
+        
+        trace_frame = tk.Frame(button_frame, bg="#3a506b")
+        trace_frame.pack(pady=5)
+        trace_check = tk.Checkbutton(trace_frame, text="Record Trace", variable=self.trace_enabled,
+                                    font=("Arial", 11, "bold"), bg="#3a506b", fg="#f5f0e1",
+                                    selectcolor="#2c3e50", activebackground="#3a506b")
+        trace_check.pack(side=tk.LEFT, padx=5)
+        dump_button = tk.Button(trace_frame, text="Dump Trace", 
+                               bg="#8e44ad", fg="white", font=("Arial", 11, "bold"),
+                               command=self.dump_trace, width=10)
+        dump_button.pack(side=tk.LEFT, padx=5)
+        power_label = tk.Label(button_frame, textvariable=self.power_var, font=("Arial", 11, "bold"),
+                              bg="#3a506b", fg="#f5f0e1")
+        power_label.pack(pady=5)
         dashboard_title = tk.Label(left_frame, text="GESTURE STATISTICS", font=("Arial", 16, "bold"), 
                                   bg="#3a506b", fg="#f5f0e1")
         dashboard_title.pack(fill=tk.X, pady=(20, 10))
@@ -486,6 +673,29 @@ class VirtualMouseUI:
         info_text = tk.Label(right_frame, text="Start the controller to see gesture visualization", 
                             font=("Arial", 11), bg="#2c3e50", fg="#f5f0e1")
         info_text.pack(pady=10)
+        
+        analytics_title = tk.Label(right_frame, text="LAST MINUTE", font=("Arial", 16, "bold"), 
+                                  bg="#2c3e50", fg="#f5f0e1")
+        analytics_title.pack(fill=tk.X, pady=(10, 5))
+        for key, color in (('gestures', "#2ecc71"), ('fps', "#5bc0be")):
+            canvas = tk.Canvas(right_frame, bg="#3a506b", width=300, height=50, highlightthickness=0)
+            canvas.pack(fill=tk.X, padx=20, pady=3)
+            self.sparklines[key] = Sparkline(canvas, 300, 50, color)
+        analytics_rows = [
+            ("Gestures / min:", self.gesture_rate_var),
+            ("Click latency p50 / p95:", self.click_latency_var),
+            ("Frame latency p50 / p95 / p99:", self.frame_latency_var),
+            ("Time in gesture:", self.gesture_time_var)
+        ]
+        for label_text, var in analytics_rows:
+            row = tk.Frame(right_frame, bg="#2c3e50")
+            row.pack(fill=tk.X, padx=20, pady=2)
+            label = tk.Label(row, text=label_text, font=("Arial", 11, "bold"), 
+                            bg="#2c3e50", fg="#f5f0e1", anchor=tk.W)
+            label.pack(side=tk.LEFT)
+            value_label = tk.Label(row, textvariable=var, font=("Arial", 11), 
+                                  bg="#2c3e50", fg="#f5f0e1")
+            value_label.pack(side=tk.RIGHT)
     
     def create_settings_tab(self, parent):
         """Create the settings tab with proper alignment and margins"""
@@ -522,17 +732,7 @@ class VirtualMouseUI:
             user_label = tk.Label(profile_frame, text=f"Logged in as: {current_user}", 
                                  font=("Arial", 12), bg="#2c3e50", fg="#f5f0e1")
             user_label.pack(anchor=tk.W, pady=(0, 10))
-            user_image_path = self.auth_manager.get_user_image_path(current_user)
-            if user_image_path and os.path.exists(user_image_path):
-                try:
-                    user_img = Image.open(user_image_path)
-                    user_img = user_img.resize((100, 100))
-                    user_photo = ImageTk.PhotoImage(user_img)
-                    img_label = tk.Label(profile_frame, image=user_photo, bg="#2c3e50")
-                    img_label.pack(pady=(0, 10))
-                    self.image_references.append(user_photo)
-                except:
-                    pass
+            self.show_profile_image(profile_frame, user_label, current_user)
         
         # Logout button
         logout_button = tk.Button(profile_frame, text="Logout", 
@@ -558,6 +758,24 @@ class VirtualMouseUI:
                                     bg="#2c3e50", length=400, fg="#f5f0e1", troughcolor="#3a506b")
         sensitivity_scale.pack(side=tk.RIGHT, padx=(10, 0))
         
+        # Active region of the camera frame
+        region_frame = tk.Frame(mouse_frame, bg="#2c3e50")
+        region_frame.pack(fill=tk.X, pady=10)
+        
+        region_label = tk.Label(region_frame, text="Active Region (% of frame):", 
+                               font=("Arial", 12), bg="#2c3e50", fg="#f5f0e1")
+        region_label.pack(side=tk.LEFT)
+        
+        region_dropdown = ttk.Combobox(region_frame, textvariable=self.active_region, 
+                                      values=ACTIVE_REGIONS, state="readonly", width=20)
+        region_dropdown.pack(side=tk.RIGHT, padx=(10, 0))
+        
+        aspect_check = tk.Checkbutton(mouse_frame, text="Match screen aspect ratio", 
+                                     variable=self.aspect_correction,
+                                     font=("Arial", 12), bg="#2c3e50", fg="#f5f0e1",
+                                     selectcolor="#3a506b", activebackground="#2c3e50")
+        aspect_check.pack(anchor=tk.W)
+        
         # Scroll speed
         scroll_frame = tk.Frame(mouse_frame, bg="#2c3e50")
         scroll_frame.pack(fill=tk.X, pady=10)
@@ -571,6 +789,17 @@ class VirtualMouseUI:
                                bg="#2c3e50", length=400, fg="#f5f0e1", troughcolor="#3a506b")
         scroll_scale.pack(side=tk.RIGHT, padx=(10, 0))
         
+        scroll_mode_frame = tk.Frame(mouse_frame, bg="#2c3e50")
+        scroll_mode_frame.pack(fill=tk.X, pady=10)
+        
+        scroll_mode_label = tk.Label(scroll_mode_frame, text="Scrolling:", 
+                                    font=("Arial", 12), bg="#2c3e50", fg="#f5f0e1")
+        scroll_mode_label.pack(side=tk.LEFT)
+        
+        scroll_mode_dropdown = ttk.Combobox(scroll_mode_frame, textvariable=self.scroll_mode, 
+                                           values=SCROLL_MODES, state="readonly", width=20)
+        scroll_mode_dropdown.pack(side=tk.RIGHT, padx=(10, 0))
+        
         # Click delay
         delay_frame = tk.Frame(mouse_frame, bg="#2c3e50")
         delay_frame.pack(fill=tk.X, pady=10)
@@ -626,7 +855,18 @@ class VirtualMouseUI:
         mode_dropdown = ttk.Combobox(mode_frame, textvariable=self.gesture_mode, 
                                     values=mode_options, state="readonly", width=20)
         mode_dropdown.pack(side=tk.RIGHT, padx=(10, 0))
-        mode_dropdown.set("Basic")
+        
+        # Dominant hand
+        dominant_frame = tk.Frame(gesture_frame, bg="#2c3e50")
+        dominant_frame.pack(fill=tk.X, pady=10)
+        
+        dominant_label = tk.Label(dominant_frame, text="Dominant Hand:", 
+                                 font=("Arial", 12), bg="#2c3e50", fg="#f5f0e1")
+        dominant_label.pack(side=tk.LEFT)
+        
+        dominant_dropdown = ttk.Combobox(dominant_frame, textvariable=self.dominant_hand, 
+                                        values=DOMINANT_HANDS, state="readonly", width=20)
+        dominant_dropdown.pack(side=tk.RIGHT, padx=(10, 0))
         
         # Multi-hand mode
         multi_hand_frame = tk.Frame(gesture_frame, bg="#2c3e50")
@@ -638,6 +878,58 @@ class VirtualMouseUI:
                                          selectcolor="#3a506b", activebackground="#2c3e50")
         multi_hand_check.pack(anchor=tk.W)
         
+        # CUSTOM GESTURES
+        custom_frame = tk.LabelFrame(settings_frame, text="Custom Gestures", font=("Arial", 14, "bold"), 
+                                    bg="#2c3e50", fg="#5bc0be", padx=20, pady=20)
+        custom_frame.pack(fill=tk.X, pady=(0, 20), padx=20)
+        
+        custom_help = tk.Label(custom_frame, text="Start the controller, hold a pose with your main hand "
+                               f"and record {SAMPLES_PER_GESTURE} samples", 
+                               font=("Arial", 11), bg="#2c3e50", fg="#f5f0e1")
+        custom_help.pack(anchor=tk.W)
+        
+        name_frame = tk.Frame(custom_frame, bg="#2c3e50")
+        name_frame.pack(fill=tk.X, pady=10)
+        name_label = tk.Label(name_frame, text="Gesture Name:", 
+                             font=("Arial", 12), bg="#2c3e50", fg="#f5f0e1")
+        name_label.pack(side=tk.LEFT)
+        name_entry = tk.Entry(name_frame, textvariable=self.custom_name, width=23)
+        name_entry.pack(side=tk.RIGHT, padx=(10, 0))
+        
+        action_frame = tk.Frame(custom_frame, bg="#2c3e50")
+        action_frame.pack(fill=tk.X, pady=10)
+        action_label = tk.Label(action_frame, text="Action:", 
+                               font=("Arial", 12), bg="#2c3e50", fg="#f5f0e1")
+        action_label.pack(side=tk.LEFT)
+        action_dropdown = ttk.Combobox(action_frame, textvariable=self.custom_action, 
+                                      values=list(CUSTOM_ACTIONS), state="readonly", width=20)
+        action_dropdown.pack(side=tk.RIGHT, padx=(10, 0))
+        
+        record_frame = tk.Frame(custom_frame, bg="#2c3e50")
+        record_frame.pack(fill=tk.X, pady=10)
+        record_button = tk.Button(record_frame, text="Record Sample", 
+                                 bg="#3498db", fg="white", font=("Arial", 11, "bold"),
+                                 command=self.record_custom_sample, width=15)
+        record_button.pack(side=tk.LEFT)
+        samples_label = tk.Label(record_frame, textvariable=self.custom_samples_var, 
+                                font=("Arial", 11), bg="#2c3e50", fg="#f5f0e1")
+        samples_label.pack(side=tk.LEFT, padx=10)
+        add_button = tk.Button(record_frame, text="Save Gesture", 
+                              bg="#2ecc71", fg="white", font=("Arial", 11, "bold"),
+                              command=self.save_custom_gesture, width=15)
+        add_button.pack(side=tk.RIGHT)
+        
+        list_frame = tk.Frame(custom_frame, bg="#2c3e50")
+        list_frame.pack(fill=tk.X, pady=10)
+        self.custom_listbox = tk.Listbox(list_frame, height=4, font=("Arial", 11),
+                                         bg="#3a506b", fg="#f5f0e1")
+        self.custom_listbox.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        delete_button = tk.Button(list_frame, text="Delete Selected", 
+                                 bg="#e74c3c", fg="white", font=("Arial", 11, "bold"),
+                                 command=self.delete_custom_gesture, width=15)
+        delete_button.pack(side=tk.RIGHT, padx=(10, 0))
+        self.refresh_custom_list()
+        
         # DETECTION SETTINGS
         detection_frame = tk.LabelFrame(settings_frame, text="Detection Settings", font=("Arial", 14, "bold"), 
                                        bg="#2c3e50", fg="#5bc0be", padx=20, pady=20)
@@ -696,7 +988,51 @@ class VirtualMouseUI:
         theme_dropdown = ttk.Combobox(theme_frame, textvariable=self.theme_color, 
                                      values=theme_options, state="readonly", width=20)
         theme_dropdown.pack(side=tk.RIGHT, padx=(10, 0))
-        theme_dropdown.set("Blue")
+        
+        # PERFORMANCE SETTINGS
+        perf_frame = tk.LabelFrame(settings_frame, text="Performance", font=("Arial", 14, "bold"), 
+                                  bg="#2c3e50", fg="#5bc0be", padx=20, pady=20)
+        perf_frame.pack(fill=tk.X, pady=(0, 20), padx=20)
+        
+        perf_options = [
+            ("Camera Mode:", self.camera_mode, CAMERA_MODES),
+            ("Inference Width (0 = full):", self.inference_width, INFERENCE_WIDTHS),
+            ("Preview Rate (fps, 0 = off):", self.preview_rate, PREVIEW_RATES),
+            ("Preview Width (0 = full):", self.preview_width, PREVIEW_WIDTHS),
+            ("Model Complexity (0 = lite):", self.model_complexity, MODEL_COMPLEXITIES),
+            ("Inference Every Nth Frame:", self.inference_stride, INFERENCE_STRIDES),
+            ("Hand Tracker:", self.tracker_backend, TRACKER_BACKENDS),
+            ("Idle After (s, 0 = never):", self.idle_timeout, IDLE_TIMEOUTS)
+        ]
+        
+        for label_text, var, options in perf_options:
+            option_frame = tk.Frame(perf_frame, bg="#2c3e50")
+            option_frame.pack(fill=tk.X, pady=10)
+            
+            option_label = tk.Label(option_frame, text=label_text, 
+                                   font=("Arial", 12), bg="#2c3e50", fg="#f5f0e1")
+            option_label.pack(side=tk.LEFT)
+            
+            option_dropdown = ttk.Combobox(option_frame, textvariable=var, 
+                                          values=options, state="readonly", width=20)
+            option_dropdown.pack(side=tk.RIGHT, padx=(10, 0))
+        
+        gate_check = tk.Checkbutton(perf_frame, text="Skip hand detection while the scene is still", 
+                                   variable=self.presence_gate,
+                                   font=("Arial", 12), bg="#2c3e50", fg="#f5f0e1",
+                                   selectcolor="#3a506b", activebackground="#2c3e50")
+        gate_check.pack(anchor=tk.W, pady=10)
+        
+        cache_check = tk.Checkbutton(perf_frame, text="Reuse gestures while the hand holds its pose", 
+                                    variable=self.gesture_cache,
+                                    font=("Arial", 12), bg="#2c3e50", fg="#f5f0e1",
+                                    selectcolor="#3a506b", activebackground="#2c3e50")
+        cache_check.pack(anchor=tk.W, pady=(0, 10))
+        
+        retune_button = tk.Button(perf_frame, text="Re-tune for This Machine", 
+                                 bg="#3498db", fg="white", font=("Arial", 12, "bold"),
+                                 command=self.retune_performance, width=25, height=1)
+        retune_button.pack(pady=(10, 0))
         
         # Save settings button
         save_frame = tk.Frame(settings_frame, bg="#1e3d59")
@@ -711,6 +1047,32 @@ class VirtualMouseUI:
         settings_canvas.pack(side="left", fill="both", expand=True)
         settings_scrollbar.pack(side="right", fill="y")
     
+    def show_profile_image(self, profile_frame, user_label, username):
+        """Show the user's thumbnail below user_label, decoding it off the Tk thread on a cache miss"""
+        def show(photo):
+            if photo is not None and user_label.winfo_exists():
+                img_label = tk.Label(profile_frame, image=photo, bg="#2c3e50")
+                img_label.pack(pady=(0, 10), after=user_label)
+        
+        def on_loaded(success, result):
+            if not success:
+                print(result)
+                return
+            try:
+                show(self.photo_cache.store(*result))
+            except Exception as e:
+                print(f"Cannot show profile image: {e}")
+        
+        user_image_path = self.auth_manager.get_user_image_path(username)
+        key = self.photo_cache.key(user_image_path, PROFILE_THUMBNAIL_SIZE) if user_image_path else None
+        if key is None:
+            return
+        photo = self.photo_cache.cached(key)
+        if photo is not None:
+            show(photo)
+        else:
+            self.auth_service.load_user_image(username, self.photo_cache, PROFILE_THUMBNAIL_SIZE, on_loaded)
+    
     def create_help_tab(self, parent):
         """Create the help tab with sub-tabs"""
         parent.grid_rowconfigure(0, weight=1)
@@ -725,16 +1087,12 @@ class VirtualMouseUI:
                        padding=[20, 8], font=("Arial", 11, "bold"))
         style.map("Sub.TNotebook.Tab", background=[("selected", "#5bc0be")], 
                   foreground=[("selected", "#1e3d59")])
-        start_tab = tk.Frame(sub_tab_control, bg="#2c3e50")
-        sub_tab_control.add(start_tab, text="Getting Started")
-        gestures_tab = tk.Frame(sub_tab_control, bg="#2c3e50")
-        sub_tab_control.add(gestures_tab, text="Gestures")
-        troubleshoot_tab = tk.Frame(sub_tab_control, bg="#2c3e50")
-        sub_tab_control.add(troubleshoot_tab, text="Troubleshooting")
-
-        self.create_start_guide(start_tab)
-        self.create_gestures_guide(gestures_tab)
-        self.create_troubleshoot_guide(troubleshoot_tab)
+        guides = LazyNotebook(sub_tab_control, self.tracer, TK_TRACK, self.report_tab_built)
+        guides.add(tk.Frame(sub_tab_control, bg="#2c3e50"), self.create_start_guide, text="Getting Started")
+        guides.add(tk.Frame(sub_tab_control, bg="#2c3e50"), self.create_gestures_guide, text="Gestures")
+        guides.add(tk.Frame(sub_tab_control, bg="#2c3e50"), self.create_troubleshoot_guide,
+                   text="Troubleshooting")
+        guides.build(sub_tab_control.select())
     
     def create_start_guide(self, parent):
         """Create getting started guide"""
@@ -881,9 +1239,98 @@ For additional support, please check our documentation or contact support.
         text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
     
+    def collect_settings(self):
+        """Read the current settings from the UI variables"""
+        settings = default_settings()
+        for key, var in self.settings_vars.items():
+            try:
+                settings[key] = var.get()
+            except tk.TclError:
+                pass
+        return settings
+    
+    def push_setting(self, key):
+        """Forward a changed setting to the controller"""
+        try:
+            self.controller_config.update(**{key: self.settings_vars[key].get()})
+        except tk.TclError:
+            pass
+    
+    def apply_settings(self, settings):
+        """Load settings into the UI variables"""
+        for key, var in self.settings_vars.items():
+            if key in settings:
+                var.set(settings[key])
+    
     def save_settings(self):
-        """Save current settings"""
-        messagebox.showinfo("Settings", "Settings saved successfully!")
+        """Save current settings to the user's profile"""
+        username = self.auth_manager.get_current_user()
+        self.auth_service.save_settings(username, self.collect_settings(), self.on_settings_saved,
+                                        base=machine_settings())
+    
+    def on_settings_saved(self, success, message):
+        """Report the result of saving settings"""
+        if success:
+            messagebox.showinfo("Settings", message)
+        else:
+            messagebox.showerror("Settings", message)
+    
+    def record_custom_sample(self):
+        """Capture the main hand's current pose as a custom gesture sample"""
+        hand = self.pipeline.last_major if self.is_running and self.pipeline is not None else None
+        vector = normalize_landmarks(landmark_array(hand)) if hand is not None else None
+        if vector is None:
+            messagebox.showinfo("Custom Gestures", "Start the controller and hold the pose in view of the camera")
+            return
+        self.custom_samples.append(vector)
+        self.custom_samples_var.set(f"{len(self.custom_samples)}/{SAMPLES_PER_GESTURE} samples")
+    
+    def save_custom_gesture(self):
+        """Store the recorded samples as a named custom gesture"""
+        name = self.custom_name.get().strip()
+        if not name:
+            messagebox.showerror("Custom Gestures", "Please enter a gesture name")
+            return
+        if len(self.custom_samples) < SAMPLES_PER_GESTURE:
+            messagebox.showerror("Custom Gestures", f"Record at least {SAMPLES_PER_GESTURE} samples first")
+            return
+        profile = [entry for entry in self.custom_gestures.to_profile() if entry['name'] != name]
+        matcher = TemplateMatcher.from_profile(profile)
+        matcher.add(name, self.custom_samples, self.custom_action.get())
+        self.custom_samples = []
+        self.custom_samples_var.set(f"0/{SAMPLES_PER_GESTURE} samples")
+        self.replace_custom_gestures(matcher)
+    
+    def delete_custom_gesture(self):
+        """Remove the custom gesture selected in the list"""
+        selection = self.custom_listbox.curselection()
+        if not selection:
+            return
+        name = self.custom_gestures.names[selection[0]]
+        self.replace_custom_gestures(TemplateMatcher.from_profile(
+            [entry for entry in self.custom_gestures.to_profile() if entry['name'] != name]))
+    
+    def replace_custom_gestures(self, matcher):
+        """Hand a new matcher to the running controller and persist it"""
+        self.custom_gestures = matcher
+        if self.pipeline is not None:
+            self.pipeline.custom_gestures = matcher
+        self.refresh_custom_list()
+        self.auth_service.save_gesture_templates(self.auth_manager.get_current_user(),
+                                                 matcher.to_profile(), self.on_custom_gestures_saved)
+    
+    def on_custom_gestures_saved(self, success, message):
+        """Report the result of saving custom gestures"""
+        if success:
+            self.status_var.set(message)
+        else:
+            messagebox.showerror("Custom Gestures", message)
+    
+    def refresh_custom_list(self):
+        """Show the saved custom gestures and their actions"""
+        self.custom_listbox.delete(0, tk.END)
+        for name in self.custom_gestures.names:
+            self.custom_listbox.insert(tk.END, f"{name} - {self.custom_gestures.actions[name] or 'No action'}")
     
     def logout_user(self):
         """Logout current user and show authentication window"""
@@ -893,6 +1340,49 @@ For additional support, please check our documentation or contact support.
         self.image_references.clear()
         self.show_authentication_popup()
     
+    def retune_performance(self):
+        """Benchmark this machine and apply the tuned performance settings"""
+        if self.is_running:
+            messagebox.showinfo("Performance", "Stop the controller before re-tuning")
+            return
+        self.status_var.set("Calibrating performance for this machine...")
+        threading.Thread(target=self.run_calibration, daemon=True).start()
+    
+    def run_calibration(self, cap=None, should_run=None):
+        """Calibrate on cap (or a newly opened camera) and apply the result.
+
+        Runs off the Tk thread, so widgets are only updated through root.after.
+        should_run() lets the controller thread stop between ladder rungs.
+        """
+        owns_cap = cap is None
+        try:
+            if owns_cap:
+                cap = cv2.VideoCapture(self.camera_index)
+                if not cap.isOpened():
+                    raise RuntimeError("Cannot open camera")
+            profile = calibrate(cap, should_run=should_run)
+            if profile is not None:
+                save_machine_profile(profile)
+        except Exception as e:
+            message = f"Calibration failed: {e}"
+            self.root.after(0, lambda: self.status_var.set(message))
+            return None
+        finally:
+            if owns_cap and cap is not None:
+                cap.release()
+        if profile is None:
+            self.root.after(0, lambda: self.status_var.set("Calibration stopped"))
+            return None
+        # Performance settings the user saved still win over the new machine profile
+        username = self.auth_manager.get_current_user()
+        merged = self.auth_manager.get_user_settings(username, machine_settings(profile))
+        tuned = {key: merged[key] for key in PERFORMANCE_KEYS}
+        self.controller_config.update(**tuned)
+        message = f"Tuned for {profile['measured']['fps']:.0f} fps"
+        self.root.after(0, lambda: self.apply_settings(tuned))
+        self.root.after(0, lambda: self.status_var.set(message))
+        return profile
+    
     def start_controller(self):
         """Start the gesture controller"""
         if not self.is_running:
@@ -903,6 +1393,8 @@ For additional support, please check our documentation or contact support.
             self.update_thread = threading.Thread(target=self.run_controller)
             self.update_thread.daemon = True
             self.update_thread.start()
+            self.root.after(1000, self.refresh_power_state)
+            self.root.after(1000, self.refresh_analytics)
     
     def stop_controller(self):
         """Stop the gesture controller"""
@@ -910,11 +1402,41 @@ For additional support, please check our documentation or contact support.
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
         self.status_var.set("Controller stopped - Ready to start")
-        self.prev_gest_major = None
-        self.prev_gest_minor = None
+    
+    def refresh_power_state(self):
+        """Show the controller's power state and time per state, once a second while running"""
+        if not self.is_running:
+            self.power_var.set("Stopped")
+            return
+        power = self.pipeline.power if self.pipeline is not None else None
+        self.power_var.set(power.summary() if power is not None else "Active - idle power saving off")
+        self.root.after(1000, self.refresh_power_state)
+    
+    def refresh_analytics(self):
+        """Show the rolling analytics, once a second while running"""
+        if not self.is_running:
+            return
+        with self.tracer.span("refresh_analytics", TK_TRACK):
+            summary = self.analytics.summary()
+            fps = summary['fps_p50']
+            fps_text = "-" if fps is None else f"median {fps:.0f}, 5th pct {summary['fps_p5']:.0f}"
+            self.sparklines['gestures'].update(summary['gesture_series'],
+                                               f"gestures/s - {summary['gestures_per_minute']:.0f}/min")
+            self.sparklines['fps'].update(summary['frame_series'], f"fps - {fps_text}")
+            self.gesture_rate_var.set(f"{summary['gestures_per_minute']:.0f}")
+            self.click_latency_var.set(f"{format_ms(summary['click_p50_ms'])} / "
+                                       f"{format_ms(summary['click_p95_ms'])}")
+            self.frame_latency_var.set(f"{format_ms(summary['latency_p50_ms'])} / "
+                                       f"{format_ms(summary['latency_p95_ms'])} / "
+                                       f"{format_ms(summary['latency_p99_ms'])}")
+            top = sorted(summary['gesture_seconds'].items(), key=lambda item: -item[1])[:3]
+            self.gesture_time_var.set(", ".join(f"{ControllerPipeline.gesture_name(gesture)} "
+                                                f"{format_duration(seconds)}" for gesture, seconds in top) or "-")
+        self.root.after(1000, self.refresh_analytics)
     
     def reset_statistics(self):
         """Reset all statistics"""
+        self.analytics.reset()
         self.stats = {
             'fist_count': 0,
             'pinch_count': 0,
@@ -926,8 +1448,47 @@ For additional support, please check our documentation or contact support.
         }
         self.update_dashboard()
     
+    def start_metrics_server(self, port):
+        """Expose controller and gesture metrics at http://127.0.0.1:<port>/metrics"""
+        if port is None:
+            return
+        registry = MetricsRegistry()
+        registry.gauge("virtual_mouse_controller_running", "1 while the gesture controller is running",
+                       func=lambda: self.is_running)
+        for key in self.stats:
+            self.gesture_counters[key] = registry.counter(
+                "virtual_mouse_gestures_total", "Gestures recognized this session",
+                {'kind': key[:-len('_count')]})
+        self.pipeline_metrics = PipelineMetrics(registry)
+        try:
+            self.metrics_server = MetricsServer(registry, port).start()
+        except OSError as e:
+            print(f"Metrics endpoint disabled: {e}")
+            self.pipeline_metrics = None
+    
+    def toggle_trace(self):
+        """Start or pause recording trace events"""
+        self.tracer.enabled = self.trace_enabled.get()
+    
+    def dump_trace(self):
+        """Write the recorded trace for chrome://tracing or Perfetto"""
+        if not self.tracer.events:
+            messagebox.showinfo("Trace", "No trace events recorded yet - enable Record Trace first")
+            return
+        try:
+            path = self.tracer.dump()
+        except OSError as e:
+            messagebox.showerror("Trace", f"Could not write trace: {e}")
+            return
+        self.status_var.set(f"Trace with {len(self.tracer.events)} events written to {path}")
+    
     def update_dashboard(self):
         """Update the dashboard with current statistics"""
+        with self.tracer.span("update_dashboard", TK_TRACK):
+            self.refresh_stat_vars()
+    
+    def refresh_stat_vars(self):
+        """Copy the statistics into the dashboard variables"""
         self.fist_count_var.set(str(self.stats['fist_count']))
         self.pinch_count_var.set(str(self.stats['pinch_count']))
         self.v_gest_count_var.set(str(self.stats['v_gest_count']))
@@ -936,130 +1497,54 @@ For additional support, please check our documentation or contact support.
         self.double_click_count_var.set(str(self.stats['double_click_count']))
         self.scroll_count_var.set(str(self.stats['scroll_count']))
     
-    def update_gesture_stats(self, gesture):
-        """Update gesture statistics"""
-        if gesture == Gest.FIST:
-            self.stats['fist_count'] += 1
-        elif gesture in [Gest.PINCH_MAJOR, Gest.PINCH_MINOR]:
-            self.stats['pinch_count'] += 1
-        elif gesture == Gest.V_GEST:
-            self.stats['v_gest_count'] += 1
-        elif gesture == Gest.MID:
-            self.stats['click_count'] += 1
-        elif gesture == Gest.INDEX:
-            self.stats['right_click_count'] += 1
-        elif gesture == Gest.TWO_FINGER_CLOSED:
-            self.stats['double_click_count'] += 1
-        elif gesture in [Gest.PINCH_MAJOR, Gest.PINCH_MINOR]:
-            self.stats['scroll_count'] += 1
-        
+    def update_gesture_stats(self, stat):
+        """Count a gesture action reported by the controller's dispatch table"""
+        self.stats[stat] += 1
+        if stat in self.gesture_counters:
+            self.gesture_counters[stat].inc()
         self.update_dashboard()
     
     def run_controller(self):
         """Run the gesture controller"""
         try:
-            handmajor = HandRecog(HLabel.MAJOR)
-            handminor = HandRecog(HLabel.MINOR)
-            cap = cv2.VideoCapture(0)
-            if not cap.isOpened():
-                messagebox.showerror("Error", "Cannot open camera")
+            memory_profiler = MemoryProfiler(log=print) if self.profile_memory else None
+            pipeline = ControllerPipeline(self.controller_config, on_action=self.update_gesture_stats,
+                                          memory_profiler=memory_profiler, tracer=self.tracer,
+                                          metrics=self.pipeline_metrics, analytics=self.analytics)
+            self.pipeline = pipeline
+            pipeline.custom_gestures = self.custom_gestures
+            try:
+                cap = pipeline.open_camera(self.camera_index)
+            except RuntimeError as e:
+                messagebox.showerror("Error", str(e))
                 self.stop_controller()
                 return
             
-            CAM_HEIGHT = cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
-            CAM_WIDTH = cap.get(cv2.CAP_PROP_FRAME_WIDTH)
-            detection_conf = self.hand_detection_confidence.get()
-            tracking_conf = self.tracking_confidence.get()
-
-            show_landmarks = self.show_landmarks_var.get()
+            if load_machine_profile() is None:
+                # First run on this machine: tune before taking over the cursor
+                self.root.after(0, lambda: self.status_var.set(
+                    "Calibrating performance for this machine..."))
+                self.run_calibration(cap, lambda: self.is_running)
             
-            with mp_hands.Hands(max_num_hands=2 if self.multi_hand_mode.get() else 1, 
-                               min_detection_confidence=detection_conf, 
-                               min_tracking_confidence=tracking_conf) as hands:  # type: ignore
-                while self.is_running and cap.isOpened():
-                    success, image = cap.read()
-                    
-                    if not success:
-                        print("Ignoring empty camera frame.")
-                        continue
-                    
-                    image = cv2.cvtColor(cv2.flip(image, 1), cv2.COLOR_BGR2RGB)
-                    image.flags.writeable = False
-                    results = hands.process(image)
-                    
-                    image.flags.writeable = True
-                    image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-
-                    left, right = None, None
-                    hr_major, hr_minor = None, None
-                    
-                    if results.multi_hand_landmarks:  # type: ignore
-                        try:
-                            handedness_dict = MessageToDict(results.multi_handedness[0])  # type: ignore
-                            if handedness_dict['classification'][0]['label'] == 'Right':
-                                right = results.multi_hand_landmarks[0]  # type: ignore
-                            else:
-                                left = results.multi_hand_landmarks[0]  # type: ignore
-                        except:
-                            pass
-                        if len(results.multi_hand_landmarks) > 1:  # type: ignore
-                            try:
-                                handedness_dict = MessageToDict(results.multi_handedness[1])  # type: ignore
-                                if handedness_dict['classification'][0]['label'] == 'Right':
-                                    right = results.multi_hand_landmarks[1]  # type: ignore
-                                else:
-                                    left = results.multi_hand_landmarks[1]  # type: ignore
-                            except:
-                                pass
-
-                        dom_hand = True  
-                        hr_major = right if dom_hand else left
-                        hr_minor = left if dom_hand else right
-                        handmajor.update_hand_result(hr_major)
-                        handminor.update_hand_result(hr_minor)
-
-                        handmajor.set_finger_state()
-                        handminor.set_finger_state()
-                        if hr_major is not None:
-                            gest_major = handmajor.get_gesture()
-                            if gest_major != self.prev_gest_major:
-                                self.update_gesture_stats(gest_major)
-                                self.prev_gest_major = gest_major
-                            Controller.handle_controls(gest_major, handmajor.hand_result)  # type: ignore
-                        if hr_minor is not None and self.multi_hand_mode.get():
-                            gest_minor = handminor.get_gesture()
-                            if gest_minor != self.prev_gest_minor:
-                                self.update_gesture_stats(gest_minor)
-                                self.prev_gest_minor = gest_minor
-                            Controller.handle_controls(gest_minor, handminor.hand_result)  # type: ignore
-                        if show_landmarks:
-                            for hand_landmarks in results.multi_hand_landmarks:  # type: ignore
-                                mp_drawing.draw_landmarks(  # type: ignore
-                                    image, hand_landmarks, mp_hands.HAND_CONNECTIONS)  # type: ignore
-                    
-                    else:
-                        self.prev_gest_major = None
-                        self.prev_gest_minor = None
-                        Controller.prev_hand = None
-
-                    cv2.imshow('AI Virtual Mouse - Press ESC to stop', image)
-                    key = cv2.waitKey(1) & 0xFF
-                    if key == 27:  
-                        self.is_running = False
-                        break
+            cap = pipeline.run(cap, lambda: self.is_running)
+            if pipeline.presence_gate is not None:
+                print(pipeline.presence_gate.report())
+            if pipeline.settings and pipeline.settings['gesture_cache']:
+                print(pipeline.gesture_cache.report())
+            if pipeline.scroller.stats.gestures:
+                print(pipeline.scroller.stats.report())
             
             cap.release()
-            cv2.destroyAllWindows()
             self.stop_controller()
             
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
             self.stop_controller()
 
-def main():
+def main(autostart=False, launch_settings=None, camera_index=0):
     """Main function to run the application"""
     root = tk.Tk()
-    app = VirtualMouseUI(root)
+    app = VirtualMouseUI(root, autostart, launch_settings, camera_index)
     root.mainloop()
 
 if __name__ == "__main__":